@@ -0,0 +1,131 @@
+"""
+Téléchargement asynchrone des pages d'offres (asyncio + aiohttp).
+
+Après la collecte des identifiants, les pages publiques des offres sont
+téléchargées de façon concurrente sur un seul cœur : un sémaphore borne le nombre
+de requêtes en vol, le limiteur de débit commun (rate_limiter) rythme les
+requêtes vers LinkedIn, et une asyncio.Queue transmet les offres analysées à l'étape de scoring au fur
+et à mesure de leur arrivée.
+"""
+
+import logging
+
+from job_extractor import job_view_url
+from http_extractor import DEFAULT_HEADERS, AUTH_REDIRECT_MARKERS, parse_job_page
+from rate_limiter import RateLimiter, DEFAULT_HOST_RATE, THROTTLE_STATUSES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 20
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# Marqueur de fin de la file des offres analysées
+_DONE = None
+
+
+class AsyncJobFetcher:
+    """Télécharge et analyse les pages publiques des offres en parallèle"""
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, host_rate=DEFAULT_HOST_RATE, timeout=15, retries=3,
+                 limiter=None, recorder=None):
+        self.concurrency = max(1, concurrency)
+        self.limiter = limiter or RateLimiter(rate=host_rate, name="HTTP")
+        # Enregistrement des pages téléchargées (fixtures.FixtureRecorder, optionnel)
+        self.recorder = recorder
+        self.timeout = timeout
+        self.retries = retries
+
+    async def fetch(self, session, job_id):
+        """Retourne les informations de l'offre, ou None si sa page publique ne suffit pas"""
+        import asyncio
+        import aiohttp
+
+        url = job_view_url(job_id)
+        for attempt in range(self.retries + 1):
+            await asyncio.sleep(self.limiter.reserve())
+            try:
+                async with session.get(url) as response:
+                    if response.status in THROTTLE_STATUSES:
+                        # Suspension commune même au dernier essai (navigateurs et requêtes HTTP)
+                        self.limiter.throttled(f"réponse HTTP {response.status}")
+                        if attempt < self.retries:
+                            continue
+                    if response.status in RETRY_STATUSES and attempt < self.retries:
+                        delay = float(response.headers.get('Retry-After', 0) or 0) or 0.5 * 2 ** attempt
+                        logger.info(f"Offre {job_id}: réponse HTTP {response.status}, nouvel essai dans {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    if any(marker in str(response.url) for marker in AUTH_REDIRECT_MARKERS):
+                        logger.info(f"Offre {job_id}: page publique non disponible (redirection vers {response.url})")
+                        return None
+                    if response.status != 200:
+                        logger.warning(f"Offre {job_id}: réponse HTTP {response.status}")
+                        return None
+                    html = await response.text()
+                    self.limiter.success()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.retries:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+                logger.error(f"Offre {job_id}: erreur HTTP: {str(e)}")
+                return None
+            if self.recorder:
+                self.recorder.record(url, html)
+            # Analyse BeautifulSoup hors de la boucle, qui continue les autres téléchargements
+            details = await asyncio.to_thread(parse_job_page, html, job_id, url)
+            if details is None:
+                logger.info(f"Offre {job_id}: description absente de la page publique")
+            return details
+        return None
+
+    async def _run(self, job_ids, handle):
+        # asyncio et aiohttp ne sont importés que lorsque le backend async est utilisé
+        import asyncio
+        import aiohttp
+
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(headers=DEFAULT_HEADERS, connector=connector, timeout=timeout) as session:
+            async def produce(position, job_id):
+                async with semaphore:
+                    details = await self.fetch(session, job_id)
+                await queue.put((position, details))
+
+            async def produce_all():
+                await asyncio.gather(*(produce(position, job_id) for position, job_id in enumerate(job_ids)))
+                await queue.put(_DONE)
+
+            async def consume():
+                # Étape de scoring: reçoit les offres dans leur ordre d'arrivée
+                while True:
+                    item = await queue.get()
+                    if item is _DONE:
+                        break
+                    handle(*item)
+
+            producer = asyncio.create_task(produce_all())
+            consumer = asyncio.create_task(consume())
+            try:
+                # Une erreur de handle arrête les téléchargements (sinon bloqués sur la file pleine)
+                await asyncio.wait((producer, consumer), return_when=asyncio.FIRST_EXCEPTION)
+                for task in (consumer, producer):
+                    if task.done():
+                        task.result()
+            finally:
+                producer.cancel()
+                consumer.cancel()
+                await asyncio.gather(producer, consumer, return_exceptions=True)
+
+    def run(self, job_ids, handle):
+        """
+        Télécharge les offres et appelle handle(position, détails) pour chacune dès
+        qu'elle est analysée ; détails vaut None en cas d'échec.
+        Une exception levée par handle interrompt les téléchargements et est propagée
+        """
+        import asyncio
+
+        logger.info(f"Téléchargement asynchrone de {len(job_ids)} offres ({self.concurrency} requêtes simultanées)")
+        asyncio.run(self._run(job_ids, handle))
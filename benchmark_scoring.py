@@ -0,0 +1,259 @@
+"""
+Benchmark des analyseurs gaijin-friendly.
+
+Génère un corpus reproductible de descriptions d'offres synthétiques (anglais,
+français, japonais et mélange, de 1 à 20 Ko), chronomètre chaque méthode
+analyze_* de GaijinScorer ainsi que is_gaijin_friendly de bout en bout, puis
+affiche le débit (descriptions par seconde) et les latences p50/p95/p99.
+
+Les résultats peuvent être enregistrés comme référence ; les exécutions
+suivantes échouent (code de sortie 1) si le débit ou la latence p95 d'une
+méthode se dégrade au-delà de la tolérance.
+
+Exemple:
+    python benchmark_scoring.py --count 200 --save-baseline
+    python benchmark_scoring.py --count 200
+"""
+
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+
+import language_detector
+from gaijin_scorer import GaijinScorer
+from timing import percentile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE_FILE = "benchmark_baseline.json"
+DEFAULT_COUNT = 200
+DEFAULT_SEED = 42
+DEFAULT_MIN_SIZE = 1024
+DEFAULT_MAX_SIZE = 20 * 1024
+# Dégradation tolérée par rapport à la référence (fraction)
+DEFAULT_TOLERANCE = 0.2
+
+LANGUAGES = ('en', 'fr', 'ja', 'mixed')
+
+# Méthodes chronométrées, dans l'ordre de GaijinScorer
+METHODS = [
+    'analyze_japanese_requirements',
+    'analyze_international_environment',
+    'analyze_expat_benefits',
+    'analyze_leave_policy',
+    'analyze_language',
+    'analyze_sentiment',
+    'detect_additional_benefits',
+    'is_gaijin_friendly',
+]
+
+# Phrases du corpus: mélange de formulations qui déclenchent les règles et de texte neutre
+PHRASES = {
+    'en': [
+        "We are looking for a Technical Consultant to join our Tokyo office.",
+        "No Japanese required, English is our official language.",
+        "Business level Japanese (JLPT N2) is a plus but not mandatory.",
+        "Native Japanese speaker required for client-facing meetings.",
+        "You will work in a diverse, international team of 30 nationalities.",
+        "We offer visa sponsorship and relocation support for overseas candidates.",
+        "Housing allowance and a generous relocation package are provided.",
+        "Employees enjoy 25 days of paid leave per year in addition to national holidays.",
+        "Flexible working hours, remote work options and a strong work-life balance.",
+        "Our global company welcomes foreigners and supports career growth.",
+        "Responsibilities include designing integrations, running workshops and supporting customers.",
+        "Experience with REST APIs, SQL and cloud platforms such as AWS or Azure.",
+        "French speakers are welcome; our headquarters are in Paris.",
+        "Strict hierarchy and long overtime hours may be expected during peak periods.",
+        "Health insurance, stock options and annual bonus are part of the package.",
+        "Japanese language training is provided for motivated team members.",
+    ],
+    'fr': [
+        "Nous recherchons un consultant technique pour rejoindre notre bureau de Tokyo.",
+        "Le japonais n'est pas requis, l'anglais est la langue de travail.",
+        "Un niveau de japonais professionnel (JLPT N2) serait un plus.",
+        "Vous travaillerez dans une équipe internationale et multiculturelle.",
+        "Nous proposons un accompagnement pour le visa et la relocalisation.",
+        "Les salariés bénéficient de 25 jours de congés payés par an.",
+        "Entreprise française implantée au Japon depuis plus de vingt ans.",
+        "Maîtrise du français et de l'anglais indispensable.",
+        "Horaires flexibles, télétravail possible et mutuelle prise en charge.",
+        "Vous accompagnerez nos clients dans l'intégration de nos solutions logicielles.",
+        "Expérience des API REST, de SQL et des environnements cloud souhaitée.",
+        "Nos bureaux sont situés à Shibuya, à proximité de la gare.",
+    ],
+    'ja': [
+        "東京オフィスでテクニカルコンサルタントを募集しています。",
+        "日本語ネイティブレベル必須です。",
+        "ビジネスレベルの日本語（日本語能力試験N1）が必要です。",
+        "英語を使用する国際的な環境で働けます。",
+        "ビザサポートあり、外国籍の方も歓迎します。",
+        "年間休日120日以上、有給休暇20日。",
+        "フレックスタイム制、リモートワーク可。",
+        "お客様のシステム導入を技術面から支援していただきます。",
+        "社会保険完備、交通費全額支給。",
+        "SQLやクラウドサービスの実務経験がある方歓迎。",
+    ],
+}
+
+
+def generate_description(rng, language, size):
+    """Description synthétique d'au moins size octets (UTF-8) dans la langue donnée"""
+    pool = [phrase for phrases in PHRASES.values() for phrase in phrases] if language == 'mixed' else PHRASES[language]
+    sentences, length = [], 0
+    while length < size:
+        sentence = rng.choice(pool)
+        sentences.append(sentence)
+        length += len(sentence.encode('utf-8')) + 1
+    return "\n".join(sentences)
+
+
+def generate_corpus(count=DEFAULT_COUNT, seed=DEFAULT_SEED, min_size=DEFAULT_MIN_SIZE, max_size=DEFAULT_MAX_SIZE,
+                    languages=LANGUAGES):
+    """Corpus reproductible de [(langue, description)], langues réparties à tour de rôle"""
+    rng = random.Random(seed)
+    return [
+        (languages[index % len(languages)],
+         generate_description(rng, languages[index % len(languages)], rng.randint(min_size, max_size)))
+        for index in range(count)
+    ]
+
+
+def summarize(latencies):
+    """Débit et percentiles (millisecondes) d'une série de latences en secondes"""
+    total = sum(latencies)
+    return {
+        'count': len(latencies),
+        'throughput': len(latencies) / total if total else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p95_ms': percentile(latencies, 95) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+    }
+
+
+def run_benchmark(corpus, repeat=1, scorer=None):
+    """Chronomètre chaque méthode sur le corpus ; retourne {méthode: résumé}"""
+    scorer = scorer or GaijinScorer()
+    descriptions = [description for _, description in corpus]
+
+    # Échauffement: imports paresseux et caches hors mesure
+    for method in METHODS:
+        getattr(scorer, method)(descriptions[0])
+
+    results = {}
+    for method in METHODS:
+        function = getattr(scorer, method)
+        latencies = []
+        for _ in range(repeat):
+            # Chaque passage paie la détection de langue (cache mémorisé vidé)
+            language_detector.DETECTOR.cache.clear()
+            for description in descriptions:
+                start = time.perf_counter()
+                function(description)
+                latencies.append(time.perf_counter() - start)
+        results[method] = summarize(latencies)
+
+    # Détail par langue pour l'évaluation complète
+    for language in sorted({language for language, _ in corpus}):
+        language_detector.DETECTOR.cache.clear()
+        latencies = []
+        for corpus_language, description in corpus:
+            if corpus_language == language:
+                start = time.perf_counter()
+                scorer.is_gaijin_friendly(description)
+                latencies.append(time.perf_counter() - start)
+        results[f'is_gaijin_friendly[{language}]'] = summarize(latencies)
+    return results
+
+
+def print_report(results):
+    print(f"{'Méthode':<40} {'desc/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for method, summary in results.items():
+        print(f"{method:<40} {summary['throughput']:>10.1f} {summary['p50_ms']:>9.3f} "
+              f"{summary['p95_ms']:>9.3f} {summary['p99_ms']:>9.3f}")
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Liste des régressions (débit ou p95) par rapport à la référence"""
+    regressions = []
+    for method, reference in baseline.items():
+        current = results.get(method)
+        if current is None:
+            continue
+        if current['throughput'] < reference['throughput'] * (1 - tolerance):
+            regressions.append(
+                f"{method}: débit {current['throughput']:.1f} desc/s < référence {reference['throughput']:.1f}"
+            )
+        if current['p95_ms'] > reference['p95_ms'] * (1 + tolerance):
+            regressions.append(
+                f"{method}: p95 {current['p95_ms']:.3f} ms > référence {reference['p95_ms']:.3f} ms"
+            )
+    return regressions
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    # Les journaux par description du moteur de règles fausseraient les mesures
+    logging.getLogger('rule_engine').setLevel(logging.ERROR)
+
+    parser = argparse.ArgumentParser(description="Benchmark des analyseurs gaijin-friendly")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help=f"Nombre de descriptions (défaut: {DEFAULT_COUNT})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"Graine du corpus (défaut: {DEFAULT_SEED})")
+    parser.add_argument("--min-size", type=int, default=DEFAULT_MIN_SIZE, help=f"Taille minimale en octets (défaut: {DEFAULT_MIN_SIZE})")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE, help=f"Taille maximale en octets (défaut: {DEFAULT_MAX_SIZE})")
+    parser.add_argument("--languages", type=str, default=",".join(LANGUAGES),
+                        help=f"Langues du corpus séparées par des virgules (défaut: {','.join(LANGUAGES)})")
+    parser.add_argument("--repeat", type=int, default=1, help="Nombre de passages sur le corpus par méthode (défaut: 1)")
+    parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE_FILE,
+                        help=f"Fichier de référence (défaut: {DEFAULT_BASELINE_FILE})")
+    parser.add_argument("--save-baseline", action="store_true", help="Enregistrer les résultats comme nouvelle référence")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Dégradation tolérée par rapport à la référence (défaut: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args()
+
+    languages = tuple(language.strip() for language in args.languages.split(",") if language.strip())
+    unknown = [language for language in languages if language not in LANGUAGES]
+    if unknown:
+        parser.error(f"langues inconnues: {', '.join(unknown)}")
+    corpus_params = {'count': args.count, 'seed': args.seed, 'min_size': args.min_size,
+                     'max_size': args.max_size, 'languages': list(languages)}
+
+    corpus = generate_corpus(args.count, args.seed, args.min_size, args.max_size, languages)
+    size = sum(len(description.encode('utf-8')) for _, description in corpus)
+    logger.info(f"Corpus: {len(corpus)} descriptions, {size / 1024:.0f} Ko")
+
+    results = run_benchmark(corpus, repeat=args.repeat)
+    print_report(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'corpus': corpus_params, 'results': results}, f, indent=2)
+        logger.info(f"Référence enregistrée dans {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        logger.info(f"Pas de référence ({args.baseline}), lancer avec --save-baseline pour en créer une")
+        return 0
+    if baseline.get('corpus') != corpus_params:
+        logger.warning(f"Corpus différent de celui de la référence: {baseline.get('corpus')}")
+
+    regressions = compare(results, baseline['results'], args.tolerance)
+    for regression in regressions:
+        logger.error(f"Régression: {regression}")
+    if regressions:
+        return 1
+    logger.info(f"Aucune régression par rapport à {args.baseline} (tolérance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Benchmark du démarrage des points d'entrée.
+
+Vérifie que les CLI démarrent sans charger les dépendances lourdes (selenium,
+pandas, langdetect, requests, BeautifulSoup, aiohttp, webdriver-manager), qui
+ne doivent être importées qu'à leur point d'utilisation, et que le temps de
+démarrage médian, au-delà de celui de l'interpréteur seul (python -c pass),
+reste sous le budget. Le détail de python -X importtime est
+affiché pour identifier les modules les plus coûteux.
+
+Exemple:
+    python benchmark_startup.py --budget-ms 100 --runs 5
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import subprocess
+from statistics import median
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_MS = 100
+DEFAULT_RUNS = 5
+
+# Modules qui ne doivent pas être chargés au démarrage
+HEAVY_MODULES = ['selenium', 'pandas', 'langdetect', 'requests', 'bs4', 'aiohttp', 'webdriver_manager', 'dotenv']
+
+# Points d'entrée mesurés: (nom, arguments de python)
+ENTRY_POINTS = [
+    ("linkedin_scraper.py --help", ["linkedin_scraper.py", "--help"]),
+    ("rescore.py --help", ["rescore.py", "--help"]),
+    ("job_store.py --help", ["job_store.py", "--help"]),
+    ("import linkedin_export", ["-c", "import linkedin_export"]),
+]
+
+# Modules dont les imports de premier niveau sont contrôlés
+CHECKED_MODULES = ['linkedin_scraper', 'linkedin_export', 'rescore', 'job_store', 'gaijin_scorer', 'worker_pool']
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_python(args, extra=()):
+    """Lance l'interpréteur dans le répertoire du projet et retourne le processus terminé"""
+    return subprocess.run([sys.executable, *extra, *args], cwd=ROOT, capture_output=True, text=True)
+
+
+def startup_time(args, runs=DEFAULT_RUNS):
+    """Temps de démarrage médian (secondes) d'un point d'entrée"""
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = run_python(args)
+        durations.append(time.perf_counter() - start)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} a échoué: {result.stderr.strip()}")
+    return median(durations)
+
+
+def heavy_imports(module):
+    """Dépendances lourdes chargées par l'import du module"""
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))"
+    )
+    result = run_python(["-c", code])
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} a échoué: {result.stderr.strip()}")
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def import_profile(args, top=10):
+    """Modules les plus coûteux selon -X importtime: [(cumulé µs, module)]"""
+    result = run_python(args, extra=["-X", "importtime"])
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        timings.append((int(cumulative_us), name.strip()))
+    return sorted(timings, reverse=True)[:top]
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    parser = argparse.ArgumentParser(description="Benchmark du démarrage des CLI")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Temps de démarrage médian maximal au-delà de python -c pass, en millisecondes (défaut: {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help=f"Exécutions par point d'entrée (défaut: {DEFAULT_RUNS})")
+    parser.add_argument("--profile", action="store_true", help="Afficher les modules les plus coûteux (-X importtime)")
+    args = parser.parse_args()
+
+    failures = []
+
+    for module in CHECKED_MODULES:
+        loaded = heavy_imports(module)
+        if loaded:
+            failures.append(f"import {module} charge {', '.join(loaded)}")
+
+    # Référence: interpréteur seul
+    baseline = startup_time(["-c", "pass"], args.runs)
+    print(f"{'Point d entrée':<32} {'médiane ms':>11} {'surcoût ms':>11}")
+    print(f"{'python -c pass':<32} {baseline * 1000:>11.1f}")
+    for name, entry_args in ENTRY_POINTS:
+        duration = startup_time(entry_args, args.runs)
+        # Le budget porte sur le surcoût du point d'entrée, pas sur le démarrage de l'interpréteur
+        overhead = duration - baseline
+        print(f"{name:<32} {duration * 1000:>11.1f} {overhead * 1000:>11.1f}")
+        if overhead * 1000 > args.budget_ms:
+            failures.append(f"{name}: {overhead * 1000:.1f} ms au-delà de python -c pass > budget {args.budget_ms:.0f} ms")
+        if args.profile:
+            for cumulative_us, module in import_profile(entry_args):
+                print(f"    {module:<40} {cumulative_us / 1000:>8.1f} ms")
+
+    for failure in failures:
+        logger.error(failure)
+    if failures:
+        return 1
+    logger.info(f"Démarrage dans le budget ({args.budget_ms:.0f} ms au-delà de python -c pass), aucune dépendance lourde chargée")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+"""
+Points de reprise d'une exécution du scraper.
+
+L'état (paramètres de recherche, page en cours, identifiants des offres déjà
+traitées et résultats accumulés) est enregistré régulièrement pendant le
+scraping ; avec --resume, une exécution interrompue reprend là où elle s'était
+arrêtée au lieu de recommencer depuis la première page.
+"""
+
+import os
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_FILE = ".scrape_checkpoint.json"
+
+# Nombre d'offres traitées entre deux enregistrements
+CHECKPOINT_EVERY = 5
+
+
+class Checkpoint:
+    """Fichier JSON contenant l'état de la dernière exécution interrompue"""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_FILE, every=CHECKPOINT_EVERY):
+        self.path = path
+        self.every = every
+        self.pending = 0
+
+    def save(self, state):
+        """Enregistre l'état (fichier temporaire puis remplacement atomique)"""
+        temporary = f"{self.path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(temporary, self.path)
+        self.pending = 0
+
+    def step(self, state_factory):
+        """Compte une offre traitée et enregistre l'état toutes les `every` offres"""
+        self.pending += 1
+        if self.pending >= self.every:
+            self.save(state_factory())
+
+    def load(self):
+        """Retourne l'état enregistré, ou None s'il n'y en a pas"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Point de reprise illisible ({str(e)}), reprise impossible")
+            return None
+        logger.info(
+            f"Point de reprise trouvé: page {state.get('page', 0) + 1}, "
+            f"{len(state.get('processed_ids', []))} offres déjà traitées"
+        )
+        return state
+
+    def clear(self):
+        """Supprime le point de reprise (exécution terminée)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
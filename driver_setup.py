@@ -0,0 +1,184 @@
+"""
+Profils de configuration du driver Firefox et résolution de geckodriver.
+
+Le profil "default" reproduit le navigateur visible 1920x1080 utilisé pour le
+débogage. Le profil "performance" tourne en headless, bloque les images, les
+médias et les polices via les préférences Firefox et rend la main dès que le DOM
+est prêt (stratégie de chargement "eager"), ce qui réduit le CPU et la mémoire
+consommés par navigateur.
+
+Le chemin de geckodriver est résolu sans accès réseau dans le cas courant: chemin
+explicite ou variable d'environnement GECKODRIVER_PATH, puis cache local décrit
+par un manifeste de version ; GeckoDriverManager n'est appelé qu'en dernier
+recours, et son résultat est alors mis en cache.
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+# Variable d'environnement donnant le chemin explicite de geckodriver
+GECKODRIVER_ENV = "GECKODRIVER_PATH"
+
+# Manifeste du cache local: chemin, version et date de résolution du driver
+DRIVER_CACHE_MANIFEST = os.path.join(
+    os.path.expanduser("~"), ".cache", "linkedin-gaijin-jobs", "geckodriver.json"
+)
+
+# Âge maximal du cache avant une nouvelle vérification par GeckoDriverManager (7 jours)
+DRIVER_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# Préférences Firefox bloquant les ressources inutiles au scraping
+BLOCKING_PREFERENCES = {
+    'permissions.default.image': 2,              # images
+    'media.autoplay.default': 5,                 # lecture automatique audio/vidéo
+    'media.mediasource.enabled': False,          # flux vidéo (MSE)
+    'media.peerconnection.enabled': False,       # WebRTC
+    'gfx.downloadable_fonts.enabled': False,     # polices web
+    'browser.display.use_document_fonts': 0,
+}
+
+DRIVER_PROFILES = {
+    'default': {
+        'headless': False,
+        'preferences': {},
+        'page_load_strategy': 'normal',
+        'maximize': True,
+    },
+    'performance': {
+        'headless': True,
+        'preferences': BLOCKING_PREFERENCES,
+        'page_load_strategy': 'eager',
+        'maximize': False,
+    },
+}
+
+DEFAULT_PROFILE = 'default'
+
+
+def build_options(profile=DEFAULT_PROFILE):
+    """Options Firefox correspondant au profil demandé"""
+    # selenium n'est importé qu'à la création d'un driver (démarrage rapide de la CLI)
+    from selenium import webdriver
+
+    settings = DRIVER_PROFILES[profile]
+    options = webdriver.FirefoxOptions()
+    if settings['headless']:
+        options.add_argument('--headless')
+    options.add_argument('--width=1920')
+    options.add_argument('--height=1080')
+    for name, value in settings['preferences'].items():
+        options.set_preference(name, value)
+    options.page_load_strategy = settings['page_load_strategy']
+    return options
+
+
+def should_maximize(profile=DEFAULT_PROFILE):
+    """Indique si la fenêtre doit être maximisée après le démarrage"""
+    return DRIVER_PROFILES[profile]['maximize']
+
+
+# Messages de selenium indiquant que Firefox ou geckodriver ne répond plus
+DRIVER_LOST_MARKERS = (
+    'failed to decode response from marionette',
+    'tried to run command without establishing a connection',
+    'session deleted',
+    'connection refused',
+)
+
+
+def is_driver_fatal(error):
+    """
+    Indique si l'erreur signifie que le navigateur est perdu (plantage de Firefox
+    ou de geckodriver, session fermée) : aucune action ne peut plus aboutir
+    """
+    from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+    from urllib3.exceptions import HTTPError as Urllib3Error
+
+    # ConnectionError et erreurs urllib3: geckodriver ne répond plus
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException, ConnectionError, Urllib3Error)):
+        return True
+    return isinstance(error, WebDriverException) and any(
+        marker in (error.msg or '').lower() for marker in DRIVER_LOST_MARKERS
+    )
+
+
+def _is_executable(path):
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def geckodriver_version(path):
+    """Version de geckodriver, déduite du chemin ou de `geckodriver --version`"""
+    match = re.search(r'v?(\d+\.\d+\.\d+)', os.path.dirname(path))
+    if match:
+        return match.group(1)
+    try:
+        output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        match = re.search(r'(\d+\.\d+\.\d+)', output)
+        return match.group(1) if match else None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def read_driver_cache(manifest=DRIVER_CACHE_MANIFEST, max_age=DRIVER_CACHE_MAX_AGE):
+    """Chemin du driver en cache, ou None si le manifeste est absent, périmé ou invalide"""
+    try:
+        with open(manifest, encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if max_age is not None and time.time() - entry.get('resolved_at', 0) > max_age:
+        logger.info("Cache de geckodriver périmé")
+        return None
+    if not _is_executable(entry.get('path')):
+        return None
+    logger.info(f"geckodriver {entry.get('version') or '?'} trouvé dans le cache")
+    return entry['path']
+
+
+def write_driver_cache(path, manifest=DRIVER_CACHE_MANIFEST):
+    """Enregistre le chemin et la version du driver dans le manifeste du cache"""
+    entry = {'path': path, 'version': geckodriver_version(path), 'resolved_at': time.time()}
+    try:
+        os.makedirs(os.path.dirname(manifest), exist_ok=True)
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+    except OSError as e:
+        logger.warning(f"Impossible d'écrire le cache de geckodriver: {str(e)}")
+
+
+def resolve_geckodriver(explicit_path=None, manifest=DRIVER_CACHE_MANIFEST):
+    """
+    Retourne le chemin de geckodriver: chemin explicite, variable GECKODRIVER_PATH,
+    cache local, puis GeckoDriverManager (accès réseau) en dernier recours
+    """
+    start = time.monotonic()
+    source = "explicite"
+    path = explicit_path or os.getenv(GECKODRIVER_ENV)
+    if path and not _is_executable(path):
+        logger.warning(f"geckodriver introuvable ou non exécutable: {path}")
+        path = None
+    if not path:
+        source = "cache"
+        path = read_driver_cache(manifest)
+    if not path:
+        source = "GeckoDriverManager"
+        # Import tardif: webdriver_manager n'est nécessaire que sans cache valide
+        from webdriver_manager.firefox import GeckoDriverManager
+        try:
+            path = GeckoDriverManager().install()
+            write_driver_cache(path, manifest)
+        except Exception as e:
+            # Hôte hors ligne ou limité: un driver en cache, même périmé, reste utilisable
+            path = read_driver_cache(manifest, max_age=None)
+            if not path:
+                raise
+            source = "cache périmé"
+            logger.warning(f"GeckoDriverManager indisponible ({str(e)}), utilisation du cache périmé")
+    logger.info(f"geckodriver résolu ({source}) en {time.monotonic() - start:.2f}s: {path}")
+    return path
@@ -0,0 +1,167 @@
+"""
+Enregistrement et rejeu hors ligne des pages LinkedIn.
+
+En mode enregistrement (option --record du scraper), le HTML des pages de
+résultats et des pages d'offres est sauvegardé dans un répertoire de fixtures,
+avec un index fixtures.json associant chaque URL (chemin et paramètres, sans
+l'adresse de base) à son fichier. Les balises <script> sont retirées : la page
+rejouée est le DOM tel que le scraper l'a lu, sans le code qui le modifierait.
+
+En mode rejeu, ce répertoire est servi par un serveur HTTP local ; le scraper
+lancé avec --base-url sur ce serveur exécute tout le pipeline (collecte des
+identifiants, extraction, scoring, export) sans réseau, avec des temps
+reproductibles.
+
+Exemple:
+    python fixtures.py fixtures/tokyo --port 8765
+    python linkedin_scraper.py --base-url http://127.0.0.1:8765 --no-login --no-store --workers 2
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "fixtures.json"
+DEFAULT_PORT = 8765
+
+_SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def fixture_key(url):
+    """Clé d'une page: chemin et paramètres triés, indépendants de l'adresse de base"""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+        path += "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{path}?{query}" if query else path
+
+
+def load_manifest(directory):
+    """Index {clé: fichier} du répertoire de fixtures (vide s'il n'existe pas)"""
+    path = os.path.join(directory, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class FixtureRecorder:
+    """Sauvegarde le HTML des pages visitées dans un répertoire de fixtures"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.manifest = load_manifest(directory)
+        self.lock = threading.Lock()
+        logger.info(f"Enregistrement des pages dans {directory} ({len(self.manifest)} déjà présentes)")
+
+    def record(self, url, html):
+        """Enregistre le HTML de la page (remplace un enregistrement précédent de la même URL)"""
+        key = fixture_key(url)
+        filename = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + ".html"
+        with open(os.path.join(self.directory, filename), 'w', encoding='utf-8') as f:
+            f.write(_SCRIPT_TAG.sub("", html))
+        with self.lock:
+            self.manifest[key] = filename
+            temporary = os.path.join(self.directory, f"{MANIFEST_FILE}.tmp")
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(temporary, os.path.join(self.directory, MANIFEST_FILE))
+
+    def record_driver(self, driver, url=None):
+        """Enregistre la page affichée par le driver (sous l'URL donnée, sinon l'URL courante)"""
+        self.record(url or driver.current_url, driver.page_source)
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        filename = self.server.manifest.get(fixture_key(self.path))
+        if filename is None:
+            logger.debug(f"Fixture absente: {self.path}")
+            self.send_error(404)
+            return
+        with open(os.path.join(self.server.directory, filename), 'rb') as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class FixtureServer:
+    """Serveur HTTP local qui rejoue un répertoire de fixtures (port 0: port libre)"""
+
+    def __init__(self, directory, host="127.0.0.1", port=DEFAULT_PORT):
+        self.httpd = ThreadingHTTPServer((host, port), _FixtureHandler)
+        self.httpd.directory = directory
+        self.httpd.manifest = load_manifest(directory)
+        self.thread = None
+        if not self.httpd.manifest:
+            logger.warning(f"Aucune fixture dans {directory}")
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Démarre le serveur dans un thread (harnais de benchmark) et retourne son adresse"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="fixture-server", daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def serve_forever(self):
+        logger.info(f"Rejeu de {len(self.httpd.manifest)} pages sur {self.base_url}")
+        self.httpd.serve_forever()
+
+    def close(self):
+        if self.thread:
+            self.httpd.shutdown()
+            self.thread.join()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    parser = argparse.ArgumentParser(description="Serveur local de rejeu des pages LinkedIn enregistrées")
+    parser.add_argument("directory", help="Répertoire de fixtures (créé par linkedin_scraper.py --record)")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute (défaut: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port d'écoute (défaut: {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    server = FixtureServer(args.directory, host=args.host, port=args.port)
+    logger.info(f"Lancer le scraper avec --base-url {server.base_url} --no-login")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
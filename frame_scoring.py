@@ -0,0 +1,428 @@
+"""
+Scoring gaijin-friendly d'un DataFrame entier de descriptions.
+
+Applique les règles du moteur partagé colonne par colonne avec les opérations
+de chaîne vectorisées de pandas (Series.str.count, str.contains, str.extract)
+au lieu d'appeler is_gaijin_friendly ligne par ligne. Chaque texte distinct
+n'est évalué qu'une fois, et les motifs (?i) sont appliqués sous une forme sans
+drapeau au texte en minuscules, ce qui laisse re chercher leur préfixe littéral.
+Les colonnes produites sont celles de RuleEngine.evaluate, avec les mêmes
+valeurs. Seules les descriptions dont la langue reste ambiguë après la passe
+sur les écritures passent une par une par le détecteur de langue.
+
+Exemple (la base des offres conserve les descriptions, pas les exports JSONL):
+    import sqlite3
+    import pandas as pd
+    from frame_scoring import SCORE_COLUMNS, score_dataframe
+
+    jobs = pd.read_sql("SELECT * FROM jobs", sqlite3.connect("exports/jobs.db"))
+    jobs = jobs.drop(columns=SCORE_COLUMNS, errors='ignore').join(score_dataframe(jobs))
+"""
+
+import re
+import sys
+import warnings
+import functools
+
+import numpy as np
+import pandas as pd
+
+import rule_engine
+import language_detector
+
+# Colonnes produites, dans l'ordre des détails de RuleEngine.evaluate
+SCORE_COLUMNS = [
+    'is_gaijin_friendly', 'score_total', 'score_japonais', 'score_international', 'score_avantages',
+    'score_conges', 'score_langue', 'score_sentiment', 'jours_conges', 'avantages',
+]
+
+# Mots vides de chaque langue, comptés comme mots entiers (équivalent des mots de WORD_RE)
+STOP_WORD_RES = {
+    language: re.compile(r'(?<![^\W\d_])(?:' + '|'.join(map(re.escape, sorted(words))) + r')(?![^\W\d_])')
+    for language, words in language_detector.STOP_WORDS.items()
+}
+
+# Échappements dont le sens ne change pas quand le texte est mis en minuscules
+_LOWER_SAFE_ESCAPES = set('sSdDwWbBAZ123456789')
+
+# Borne de mot suivie de lettres, chiffres et espaces, en tête d'un motif mis en minuscules
+_WORD_PREFIX_RE = re.compile(r'\\b((?:[^\W_]| )+)')
+
+_case_sensitive_re = None
+
+
+def case_sensitive_re():
+    """
+    Caractères pour lesquels str.lower ne reproduit pas re.IGNORECASE : minuscule
+    sur plusieurs caractères, équivalences propres à re ('ſ' et 's', 'K' et 'k'...)
+    et sigma (minuscule contextuelle). Construit à la première utilisation.
+    """
+    global _case_sensitive_re
+    if _case_sensitive_re is None:
+        chars = [char for char in map(chr, range(sys.maxunicode + 1))
+                 if len(char.lower()) != 1 or char.upper().lower() != char.lower()]
+        chars.append('Σ')
+        _case_sensitive_re = re.compile('[' + ''.join(map(re.escape, chars)) + ']')
+    return _case_sensitive_re
+
+
+@functools.lru_cache(maxsize=None)
+def lowered_regex(pattern):
+    """
+    Motif (?i) réécrit pour le texte en minuscules, sans drapeau : le moteur re
+    peut alors chercher le préfixe littéral du motif au lieu de comparer chaque
+    caractère sans la casse. None si le motif n'est pas transposable sans risque
+    (autre drapeau, classe de caractères, échappement inconnu, caractère à casse
+    particulière).
+    """
+    if not pattern.startswith('(?i)'):
+        return None
+    pattern = pattern[len('(?i)'):]
+    if '(?' in pattern.replace('(?:', '').replace('(?<!', '').replace('(?<=', '').replace('(?!', '').replace('(?=', ''):
+        return None
+    if '[' in pattern or case_sensitive_re().search(pattern):
+        return None
+    lowered = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == '\\':
+            escaped = next(chars, '')
+            if escaped.isalnum() and escaped not in _LOWER_SAFE_ESCAPES:
+                return None
+            lowered.append(char + escaped)
+        else:
+            lowered.append(char.lower())
+    lowered = ''.join(lowered)
+    # \b initial vérifié après le littéral qui le suit, que re peut alors chercher directement
+    prefix = _WORD_PREFIX_RE.match(lowered)
+    if prefix:
+        literal, rest = prefix.group(1), lowered[prefix.end():]
+        if rest[:1] in ('?', '*', '+', '{'):
+            # Le quantificateur porte sur le dernier caractère du littéral
+            literal, rest = literal[:-1], literal[-1:] + rest
+        if literal:
+            lowered = f'{literal}(?<=\\b{literal}){rest}'
+    return re.compile(lowered)
+
+
+def _trie_pattern(node):
+    """Motif d'un nœud de l'arbre des littéraux ; les suites plus longues sont essayées d'abord"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    if '' in node:
+        pattern = ('(?:' + pattern + ')' if len(branches) == 1 else pattern) + '?'
+    return pattern
+
+
+@functools.lru_cache(maxsize=8)
+def literal_index(literals):
+    """
+    (motif, préfixes) pour relever en une passe les littéraux d'un texte normalisé.
+    À chaque position, le motif capture le plus long littéral qui y commence ;
+    les littéraux présents sont ceux capturés et leurs préfixes (préfixes[littéral]),
+    qui commencent à la même position.
+    """
+    trie = {}
+    for literal in literals:
+        node = trie
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    prefixes = {literal: {prefix for prefix in literals if literal.startswith(prefix)} for literal in literals}
+    # (?!) ne correspond jamais: aucune règle n'a de littéral obligatoire
+    return re.compile('(?=(' + (_trie_pattern(trie) or '(?!)') + '))'), prefixes
+
+
+class FrameScan:
+    """
+    Évaluation des tables de règles sur une colonne de descriptions.
+    Équivalent de RuleScan : les résultats sont ceux de re.finditer et re.search
+    appliqués à chaque ligne. Les littéraux obligatoires de toutes les règles
+    sont relevés en une passe par ligne (literal_index) et, comme dans RuleScan,
+    chaque règle n'est évaluée que sur les lignes qui contiennent ses littéraux ;
+    sur celles sans caractère à casse particulière, les motifs (?i) le sont sous
+    leur forme lowered_regex.
+    """
+
+    def __init__(self, engine, descriptions):
+        self.engine = engine
+        # Index positionnel (l'index du DataFrame peut contenir des doublons) et type
+        # objet: les méthodes .str utilisent alors le module re, comme le moteur
+        self.descriptions = descriptions.reset_index(drop=True).fillna('').astype(str).astype(object)
+        self.lowered = self.descriptions.str.lower()
+        casefolded = self.descriptions.str.casefold()
+        self.folded = casefolded.str.replace('ı', 'i', regex=False).str.replace('i̇', 'i', regex=False)
+        # Positions du texte normalisé utilisables si casefold a conservé la longueur
+        self.aligned = (casefolded.str.len() == self.descriptions.str.len()).to_numpy(dtype=bool)
+        self.simple = ~self.descriptions.str.contains(case_sensitive_re()).to_numpy(dtype=bool)
+        # Littéraux présents dans chaque ligne, relevés en une passe
+        literals_re, prefixes = literal_index(engine.literals)
+        self.literals = [
+            set().union(*(prefixes[literal] for literal in set(found)))
+            for found in self.folded.str.findall(literals_re)
+        ]
+        self._present = {}
+
+    def present(self, literal):
+        """Lignes qui contiennent le littéral normalisé"""
+        found = self._present.get(literal)
+        if found is None:
+            found = self._present[literal] = np.fromiter((literal in row for row in self.literals),
+                                                         dtype=bool, count=len(self.literals))
+        return found
+
+    def candidates(self, rule):
+        """Lignes qui peuvent correspondre à la règle, d'après ses littéraux obligatoires"""
+        mask = np.ones(len(self.descriptions), dtype=bool)
+        for clause in rule.clauses:
+            mask &= np.logical_or.reduce([self.present(literal) for literal in clause])
+        return mask
+
+    def _apply(self, rule, column_method, row_method, default, dtype=None):
+        """
+        Résultat de la règle par ligne : row_method(motif, texte, positions) aux
+        positions des préfixes sur les lignes alignées (comme RuleScan), sinon
+        column_method(textes, motif, textes d'origine), sous la forme lowered_regex
+        si possible
+        """
+        values = pd.Series(default, index=self.descriptions.index, dtype=dtype)
+        candidates = self.candidates(rule)
+        if rule.prefixes is not None:
+            anchored = candidates & self.aligned
+            if anchored.any():
+                values[anchored] = np.asarray([
+                    row_method(rule.regex, text, _positions(folded, rule.prefixes))
+                    for text, folded in zip(self.descriptions[anchored], self.folded[anchored])
+                ], dtype=values.dtype)
+            candidates = candidates & ~self.aligned
+        fast = lowered_regex(rule.pattern)
+        if fast is None:
+            groups = [(candidates, self.descriptions, rule.regex)]
+        else:
+            groups = [(candidates & self.simple, self.lowered, fast),
+                      (candidates & ~self.simple, self.descriptions, rule.regex)]
+        for mask, texts, regex in groups:
+            if mask.any():
+                # Converti au type de la colonne: .str.contains sur des objets retourne des objets
+                values[mask] = np.asarray(column_method(texts[mask], regex, self.descriptions[mask]),
+                                          dtype=values.dtype)
+        return values
+
+    def count(self, rule):
+        """Nombre de correspondances de la règle par ligne (len(re.findall))"""
+        return self._apply(rule, lambda texts, regex, _: texts.str.count(regex), _count_at, 0)
+
+    def contains(self, rule):
+        """Lignes où la règle correspond (re.search)"""
+        with warnings.catch_warnings():
+            # Les groupes de capture sont voulus (motifs partagés avec le moteur)
+            warnings.simplefilter('ignore', UserWarning)
+            return self._apply(rule, lambda texts, regex, _: texts.str.contains(regex), _matches_at, False)
+
+    def extract(self, rule):
+        """Premier groupe de la première correspondance par ligne (re.search().group(1)), NaN sinon"""
+        return self._apply(rule, _first_groups, _group_at, np.nan, dtype=object)
+
+    def count_table(self, table):
+        return sum((self.count(rule) for rule in self.engine.tables[table]), pd.Series(0, index=self.descriptions.index))
+
+    def count_keywords(self, keywords):
+        """Nombre de mots-clés présents par ligne (recherche simple insensible à la casse)"""
+        return sum((self.lowered.str.contains(keyword.lower(), regex=False).astype(int) for keyword in keywords),
+                   pd.Series(0, index=self.descriptions.index))
+
+
+def _positions(folded, prefixes):
+    """Positions (triées) des préfixes dans le texte normalisé"""
+    found = set()
+    for prefix in prefixes:
+        index = folded.find(prefix)
+        while index != -1:
+            found.add(index)
+            index = folded.find(prefix, index + 1)
+    return sorted(found)
+
+
+def _first_groups(texts, regex, originals):
+    """
+    Premier groupe de la première correspondance de chaque texte, NaN sinon.
+    Il est relu dans le texte d'origine (mêmes positions, un caractère pour un
+    sur les lignes mises en minuscules) pour garder sa casse.
+    """
+    groups = []
+    for text, original in zip(texts, originals):
+        match = regex.search(text)
+        groups.append(original[match.start(1):match.end(1)] if match and match.start(1) != -1 else np.nan)
+    return groups
+
+
+def _count_at(regex, text, positions):
+    """Nombre de correspondances ne se chevauchant pas, ancrées aux positions"""
+    count = end = 0
+    for index in positions:
+        if index < end:
+            continue
+        match = regex.match(text, index)
+        if match:
+            count += 1
+            end = match.end()
+    return count
+
+
+def _matches_at(regex, text, positions):
+    return any(regex.match(text, index) for index in positions)
+
+
+def _group_at(regex, text, positions):
+    for index in positions:
+        match = regex.match(text, index)
+        if match:
+            return match.group(1)
+    return np.nan
+
+
+def score_japanese(scan, weights):
+    positives = scan.count_table('japanese_positive')
+    negatives = scan.count_table('japanese_negative')
+    score = positives * weights['positive_match'] + negatives * weights['negative_match']
+    for rule in scan.engine.tables['jlpt']:
+        score += scan.contains(rule) * weights['jlpt'][rule.label]
+    for rule in scan.engine.tables['japanese_context_positive']:
+        score += scan.contains(rule) * weights['context_positive']
+    for rule in scan.engine.tables['japanese_context_negative']:
+        score += scan.contains(rule) * weights['context_negative']
+    score += ((positives >= weights['positive_only_min']) & (negatives == 0)) * weights['positive_only_bonus']
+    return score
+
+
+def score_international(scan, weights):
+    score = scan.count_table('international') * weights['match']
+    score += (scan.count_keywords(scan.engine.keywords['global']) >= weights['keyword_min']) * weights['keyword_bonus']
+    return score.clip(upper=weights['cap'])
+
+
+def score_benefits(scan, weights):
+    score = scan.count_table('expat_benefits') * weights['match']
+    for rule in scan.engine.tables['expat_context']:
+        score += scan.contains(rule) * weights['context']
+    return score.clip(upper=weights['cap'])
+
+
+def score_leave_policy(scan, weights):
+    """Retourne (score, jours de congés) ; les jours sont ceux de la dernière règle qui correspond"""
+    score = scan.count_table('generous_leave') * weights['match']
+    days_of_leave = pd.Series(np.nan, index=scan.descriptions.index)
+    for rule in scan.engine.tables['leave_days']:
+        # int() comme le moteur: accepte les chiffres pleine chasse (２０) des offres japonaises
+        days = pd.to_numeric(scan.extract(rule).map(int, na_action='ignore'))
+        # Paliers par ordre décroissant: seul le premier palier atteint compte
+        remaining = days.notna()
+        for tier in weights['days_bonus']:
+            reached = remaining & (days >= tier['min_days'])
+            score += reached * tier['bonus']
+            remaining &= ~reached
+        days_of_leave = days.where(days.notna(), days_of_leave)
+    score += (scan.count_keywords(scan.engine.keywords['leave']) >= weights['keyword_min']) * weights['keyword_bonus']
+    return score.clip(upper=weights['cap']), days_of_leave.astype('Int64')
+
+
+def detect_languages(descriptions):
+    """
+    Langue de chaque description, comme language_detector.detect_language.
+    La passe sur les écritures et les mots vides est vectorisée ; les textes
+    ambigus passent par le détecteur (langdetect), None si la détection échoue.
+    """
+    letters = descriptions.str.count(language_detector.LETTER_RE)
+    letters = letters.where(letters > 0)
+    kana = descriptions.str.count(language_detector.KANA_RE)
+    kanji = descriptions.str.count(language_detector.KANJI_RE)
+    latin = descriptions.str.count(language_detector.LATIN_RE)
+    lowered = descriptions.str.lower()
+    en = lowered.str.count(STOP_WORD_RES['en'])
+    fr = lowered.str.count(STOP_WORD_RES['fr'])
+
+    japanese = (kana > 0) & ((kana + kanji) / letters >= language_detector.JAPANESE_RATIO)
+    latin_text = ~japanese & (latin / letters >= language_detector.LATIN_RATIO)
+    english = latin_text & (en >= language_detector.MIN_STOP_WORDS) & (en >= language_detector.STOP_WORD_LEAD * fr)
+    french = (latin_text & ~english & (fr >= language_detector.MIN_STOP_WORDS)
+              & (fr >= language_detector.STOP_WORD_LEAD * en))
+
+    languages = pd.Series(None, index=descriptions.index, dtype=object)
+    languages[japanese] = 'ja'
+    languages[english] = 'en'
+    languages[french] = 'fr'
+    ambiguous = ~(japanese | english | french)
+    if ambiguous.any():
+        languages[ambiguous] = descriptions[ambiguous].map(_detect_or_none)
+    return languages
+
+
+def _detect_or_none(text):
+    try:
+        return language_detector.detect_language(text)
+    except Exception:
+        return None
+
+
+def score_language(scan, weights):
+    french = scan.count_table('french')
+    score = french * weights['french_match'] + (french > 0) * weights['french_bonus']
+    languages = detect_languages(scan.descriptions.str.slice(0, weights['detect_chars']))
+    score += languages.map(weights['languages']).fillna(0).astype(int)
+    return score.clip(upper=weights['cap'])
+
+
+def score_sentiment(scan, weights):
+    score = (scan.count_table('sentiment_positive') * weights['phrase_positive']
+             + scan.count_table('sentiment_negative') * weights['phrase_negative'])
+    positive_words = sum((scan.contains(rule).astype(int) for rule in scan.engine.tables['sentiment_positive_words']),
+                         pd.Series(0, index=scan.descriptions.index))
+    negative_words = sum((scan.contains(rule).astype(int) for rule in scan.engine.tables['sentiment_negative_words']),
+                         pd.Series(0, index=scan.descriptions.index))
+    score += (positive_words > negative_words + weights['word_margin']) * weights['positive_bonus']
+    score += (negative_words > positive_words) * weights['negative_malus']
+    return score.clip(upper=weights['cap'])
+
+
+def additional_benefits(scan):
+    """Libellés des avantages détectés, séparés par des virgules, dans l'ordre des règles"""
+    benefits = pd.Series('', index=scan.descriptions.index, dtype=object)
+    for rule in scan.engine.tables['additional_benefits']:
+        found = scan.contains(rule)
+        benefits = benefits.where(~found, benefits.where(benefits == '', benefits + ', ') + rule.label)
+    return benefits
+
+
+def score_dataframe(df, column='description', engine=None):
+    """
+    Évalue toutes les descriptions de la colonne et retourne un DataFrame de même
+    index avec les colonnes SCORE_COLUMNS (is_gaijin_friendly booléen, scores,
+    jours_conges entier ou <NA>, avantages), identiques à RuleEngine.evaluate.
+    Lève KeyError si la colonne des descriptions est absente.
+    """
+    if column not in df.columns:
+        raise KeyError(f"Colonne '{column}' absente du DataFrame (colonnes: {', '.join(map(str, df.columns))}) ; "
+                       f"les exports CSV et JSONL ne contiennent pas les descriptions, utilisez la base des offres")
+    engine = engine or rule_engine.get_engine()
+    weights = engine.weights
+    # Chaque texte normalisé distinct (analysé par RuleEngine.evaluate) n'est évalué qu'une fois
+    codes, distinct = pd.factorize(df[column].fillna('').astype(str).map(rule_engine.normalize).astype(object))
+    scan = FrameScan(engine, pd.Series(distinct, dtype=object))
+
+    result = pd.DataFrame(index=scan.descriptions.index)
+    result['score_japonais'] = score_japanese(scan, weights['japanese'])
+    result['score_international'] = score_international(scan, weights['international'])
+    result['score_avantages'] = score_benefits(scan, weights['benefits'])
+    result['score_conges'], result['jours_conges'] = score_leave_policy(scan, weights['leave'])
+    result['score_langue'] = score_language(scan, weights['language'])
+    result['score_sentiment'] = score_sentiment(scan, weights['sentiment'])
+    result['score_total'] = result[['score_japonais', 'score_international', 'score_avantages',
+                                    'score_conges', 'score_langue', 'score_sentiment']].sum(axis=1)
+    result['avantages'] = additional_benefits(scan)
+    result['is_gaijin_friendly'] = ((result['score_total'] > engine.threshold['min_total'])
+                                    & (result['score_japonais'] > engine.threshold['min_japanese']))
+    result = result.iloc[codes]
+    result.index = df.index
+    return result[SCORE_COLUMNS]
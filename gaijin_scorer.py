@@ -0,0 +1,94 @@
+"""
+Composant de scoring gaijin-friendly, indépendant du navigateur.
+
+Ce module n'importe ni selenium, ni pandas, ni langdetect au chargement : il peut
+être utilisé par les processus de re-scoring, les tests et les benchmarks sans
+démarrer de driver Firefox.
+"""
+
+import rule_engine
+
+
+class GaijinScorer:
+    """
+    Analyse des descriptions d'offres d'emploi.
+    Reprend les analyseurs historiques de LinkedInScraper en s'appuyant sur le
+    moteur de règles précompilé ; la construction ne compile aucun motif.
+    """
+
+    def __init__(self, engine=None, cache=None):
+        # Moteur imposé, ou None pour suivre le moteur partagé (rechargé quand les règles changent)
+        self._engine = engine
+        # Cache persistant des scores (score_cache.ScoreCache), None pour tout analyser
+        self.cache = cache
+
+    @property
+    def engine(self):
+        return self._engine or rule_engine.get_engine()
+
+    def is_gaijin_friendly(self, description):
+        """
+        Détermine si l'offre est adaptée aux étrangers en utilisant une approche multicritère
+        Retourne un tuple contenant (resultat, scores_détails)
+        Une description déjà évaluée avec les mêmes règles est servie par le cache
+        """
+        if self.cache is None:
+            return self.engine.evaluate(description)
+        result = self.cache.get(description)
+        if result is None:
+            result = self.engine.evaluate(description)
+            self.cache.put(description, *result)
+        return result
+
+    def score_many(self, descriptions):
+        """Évalue plusieurs descriptions, retourne [(resultat, scores_détails)]"""
+        return [self.engine.evaluate(description or '') for description in descriptions]
+
+    # Les analyseurs portent sur la description normalisée, comme is_gaijin_friendly
+
+    def analyze_japanese_requirements(self, description):
+        """
+        Analyse les exigences linguistiques japonaises
+        Retourne un score: positif si peu/pas de japonais requis, négatif si japonais avancé requis
+        """
+        return self.engine.score_japanese(self.engine.scan_description(description))
+
+    def analyze_international_environment(self, description):
+        """
+        Analyse si l'environnement de travail est international
+        """
+        return self.engine.score_international(self.engine.scan_description(description))
+
+    def analyze_expat_benefits(self, description):
+        """
+        Analyse les avantages spécifiques pour les expatriés
+        """
+        return self.engine.score_benefits(self.engine.scan_description(description))
+
+    def analyze_leave_policy(self, description):
+        """
+        Analyse la politique de congés pour identifier les entreprises offrant des conditions
+        plus généreuses que le standard japonais (10 jours après 6 mois)
+        Retourne (score, jours_de_congés)
+        """
+        return self.engine.score_leave_policy(self.engine.scan_description(description))
+
+    def analyze_language(self, description):
+        """
+        Analyse la langue utilisée dans l'offre et détecte les mentions de français
+        qui peuvent indiquer une entreprise francophone
+        """
+        return self.engine.score_language(self.engine.scan_description(description))
+
+    def analyze_sentiment(self, description):
+        """
+        Analyse le sentiment général de l'offre vis-à-vis des étrangers
+        """
+        return self.engine.score_sentiment(self.engine.scan_description(description))
+
+    def detect_additional_benefits(self, description):
+        """
+        Détecte d'autres avantages qui pourraient être intéressants pour les expatriés
+        Cette fonction est utilisée pour information uniquement et n'affecte pas le score
+        """
+        return self.engine.detect_additional_benefits(self.engine.scan_description(description))
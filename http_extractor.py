@@ -0,0 +1,179 @@
+"""
+Extraction des offres par simple requête HTTP, sans navigateur.
+
+Les pages publiques https://www.linkedin.com/jobs/view/{id}/ sont lisibles sans
+connexion : elles sont téléchargées avec une session requests persistante
+(keep-alive, pool de connexions, compression gzip, nouvelles tentatives) puis
+analysées avec BeautifulSoup, au rythme du limiteur de débit commun
+(rate_limiter). Les résultats ont la même forme que ceux de
+job_extractor.DriverJobExtractor ; une offre dont la page publique ne suffit pas
+est signalée (None) pour être reprise par un navigateur.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from job_extractor import job_view_url, build_job_details
+from rate_limiter import RateLimiter, DEFAULT_HOST_RATE, THROTTLE_STATUSES, THROTTLE_RETRIES
+
+logger = logging.getLogger(__name__)
+
+# Analyseur HTML de BeautifulSoup, choisi au premier usage (voir html_parser)
+_html_parser = None
+
+
+def html_parser():
+    """lxml est nettement plus rapide que l'analyseur HTML intégré, mais reste optionnel"""
+    global _html_parser
+    if _html_parser is None:
+        try:
+            import lxml  # noqa: F401
+            _html_parser = 'lxml'
+        except ImportError:
+            _html_parser = 'html.parser'
+    return _html_parser
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0"
+    ),
+    'Accept': "text/html,application/xhtml+xml",
+    'Accept-Language': "en-US,en;q=0.8,fr;q=0.6",
+    'Accept-Encoding': "gzip, deflate",
+}
+
+# Sélecteurs de la page publique (invité) d'une offre
+GUEST_TITLE_SELECTORS = ["h1.top-card-layout__title", "h1.topcard__title", "h1"]
+GUEST_COMPANY_SELECTORS = ["a.topcard__org-name-link", "span.topcard__flavor a", "span.topcard__flavor"]
+GUEST_LOCATION_SELECTORS = ["span.topcard__flavor--bullet", ".topcard__flavor-row span.topcard__flavor--bullet"]
+GUEST_DESCRIPTION_SELECTORS = [
+    "div.show-more-less-html__markup",
+    "div.description__text",
+    "section.description",
+]
+
+# Pages vers lesquelles LinkedIn redirige les invités lorsqu'une offre n'est pas publique
+AUTH_REDIRECT_MARKERS = ("authwall", "/login", "checkpoint")
+
+
+def create_session(pool_size=10, retries=3, backoff_factor=0.5):
+    """
+    Session HTTP persistante: pool de connexions et nouvelles tentatives sur erreurs serveur
+    (les réponses 429 sont laissées au limiteur de débit)
+    """
+    # requests n'est importé qu'à la création d'une session (démarrage rapide de la CLI)
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _first_text(soup, selectors):
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text(separator="\n", strip=True)
+            if text:
+                return text
+    return None
+
+
+def parse_job_page(html, job_id, url=None):
+    """
+    Analyse le HTML d'une page d'offre publique.
+    Retourne le même dictionnaire que DriverJobExtractor.extract, ou None sans description
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, html_parser())
+    raw = {
+        'title': _first_text(soup, GUEST_TITLE_SELECTORS),
+        'company': _first_text(soup, GUEST_COMPANY_SELECTORS),
+        'location': _first_text(soup, GUEST_LOCATION_SELECTORS),
+        'description': _first_text(soup, GUEST_DESCRIPTION_SELECTORS),
+        'current_url': url or job_view_url(job_id),
+        'current_job_id': job_id,
+    }
+    if not raw['description']:
+        return None
+    return build_job_details(raw)
+
+
+class HttpJobExtractor:
+    """
+    Télécharge et analyse les pages publiques des offres.
+    map() a la même forme que worker_pool.BrowserWorkerPool.map
+    """
+
+    def __init__(self, workers=4, timeout=15, session=None, limiter=None, recorder=None):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.session = session or create_session(pool_size=self.workers)
+        self.limiter = limiter or RateLimiter(rate=DEFAULT_HOST_RATE, name="HTTP")
+        # Enregistrement des pages téléchargées (fixtures.FixtureRecorder, optionnel)
+        self.recorder = recorder
+
+    def get(self, url):
+        """GET au rythme du limiteur ; une réponse de limitation suspend le limiteur et la requête est refaite"""
+        for _ in range(THROTTLE_RETRIES + 1):
+            self.limiter.acquire()
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code not in THROTTLE_STATUSES:
+                self.limiter.success()
+                return response
+            self.limiter.throttled(f"réponse HTTP {response.status_code}")
+        return response
+
+    def fetch(self, job_id):
+        """Retourne les informations de l'offre, ou None si sa page publique ne suffit pas"""
+        url = job_view_url(job_id)
+        response = self.get(url)
+        if any(marker in response.url for marker in AUTH_REDIRECT_MARKERS):
+            logger.info(f"Offre {job_id}: page publique non disponible (redirection vers {response.url})")
+            return None
+        if response.status_code != 200:
+            logger.warning(f"Offre {job_id}: réponse HTTP {response.status_code}")
+            return None
+        if self.recorder:
+            self.recorder.record(url, response.text)
+        details = parse_job_page(response.text, job_id, url)
+        if details is None:
+            logger.info(f"Offre {job_id}: description absente de la page publique")
+        return details
+
+    def _safe_fetch(self, job_id):
+        import requests
+
+        try:
+            return self.fetch(job_id)
+        except requests.RequestException as e:
+            logger.error(f"Offre {job_id}: erreur HTTP: {str(e)}")
+            return None
+
+    def map(self, job_ids):
+        """
+        Extrait les offres et les retourne au fil de l'eau, dans l'ordre d'arrivée,
+        sous forme de (position, détails) ; détails vaut None en cas d'échec
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(self._safe_fetch, job_id): position
+                       for position, job_id in enumerate(job_ids)}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,199 @@
+"""
+Extraction du panneau de détails d'une offre en un seul appel execute_script.
+
+Les listes de sélecteurs de repli (titre, entreprise, localisation, description,
+URL) sont évaluées dans le navigateur par un script injecté, qui retourne un seul
+objet JSON par offre. On évite ainsi des dizaines d'allers-retours WebDriver, et
+les exceptions associées à chaque find_element infructueux.
+"""
+
+import re
+import logging
+
+import linkedin_urls
+import timing
+
+logger = logging.getLogger(__name__)
+
+# Chemin canonique d'une offre à partir de son identifiant
+JOB_VIEW_PATH = "/jobs/view/{}/"
+
+TITLE_SELECTORS = [
+    "h2.jobs-unified-top-card__job-title",
+    "h1.job-title",
+    "h1[class*='job']",
+    ".jobs-unified-top-card h1",
+    ".job-details-jobs-unified-top-card__job-title"
+]
+
+COMPANY_SELECTORS = [
+    "a.jobs-unified-top-card__company-name",
+    "span.jobs-unified-top-card__company-name",
+    ".jobs-unified-top-card__subtitle a",
+    ".jobs-unified-top-card__subtitle span",
+    "[class*='company-name']"
+]
+
+LOCATION_SELECTORS = [
+    "span.jobs-unified-top-card__bullet",
+    "span.jobs-unified-top-card__workplace-type",
+    ".jobs-unified-top-card__metadata-container span",
+    ".t-black--light.job-details-jobs-unified-top-card__tertiary-description-container span.tvm__text:first-child",
+    "[class*='location']"
+]
+
+# Textes de localisation à ignorer (date de publication, séparateurs)
+LOCATION_IGNORED_PREFIXES = ["il y a", "·"]
+
+DESCRIPTION_SELECTORS = [
+    "div.jobs-description__content",
+    "div.jobs-description-content",
+    ".jobs-description",
+    "[class*='description-content']",
+    "#job-details"
+]
+
+URL_SELECTORS = [
+    "a.job-details-jobs-unified-top-card__job-title-link",
+    ".jobs-unified-top-card__content a[href*='/jobs/view/']",
+    "a[data-tracking-control-name='public_jobs_topcard-title-link']"
+]
+
+DEFAULT_VALUES = {
+    'title': "Titre inconnu",
+    'company': "Entreprise inconnue",
+    'location': "Localisation inconnue",
+    'description': "Description non disponible",
+}
+
+# Script injecté: arguments[0] contient les listes de sélecteurs
+EXTRACT_JOB_SCRIPT = """
+const config = arguments[0];
+
+function firstText(selectors, ignoredPrefixes) {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (!element) continue;
+        const text = (element.innerText || '').trim();
+        if (!text) continue;
+        if (ignoredPrefixes && ignoredPrefixes.some(prefix => text.startsWith(prefix))) continue;
+        return text;
+    }
+    return null;
+}
+
+function linkUrl(selectors) {
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        const href = element && element.href;
+        if (href && href.includes('/jobs/view/')) return href;
+    }
+    return null;
+}
+
+const currentUrl = window.location.href;
+const currentMatch = currentUrl.match(/currentJobId=(\\d+)/);
+const dataJobElement = document.querySelector('[data-job-id]');
+
+return {
+    title: firstText(config.title),
+    company: firstText(config.company),
+    location: firstText(config.location, config.location_ignored),
+    description: firstText(config.description),
+    current_url: currentUrl,
+    current_job_id: currentMatch ? currentMatch[1] : null,
+    link_url: linkUrl(config.url),
+    data_job_id: dataJobElement ? dataJobElement.getAttribute('data-job-id') : null
+};
+"""
+
+# Script de collecte des identifiants d'offres de la liste de résultats
+COLLECT_JOB_IDS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).map(element => {
+    const link = element.matches(arguments[1]) ? element : element.querySelector(arguments[1]);
+    return [element.getAttribute('data-job-id') || element.getAttribute('href'), link ? link.textContent : ''];
+});
+"""
+JOB_LIST_SELECTOR = "[data-job-id], a.job-card-list__title--link, a[href*='/jobs/view/']"
+# Lien du titre d'une carte d'offre (sélecteurs du parcours séquentiel)
+CARD_TITLE_SELECTOR = "a.job-card-list__title--link, .job-card-container__link, a[href*='/jobs/view/'], h3 a"
+
+
+def job_view_url(job_id):
+    """URL canonique d'une offre, sur l'adresse de base courante (linkedin_urls)"""
+    return linkedin_urls.url(JOB_VIEW_PATH.format(job_id))
+
+
+def job_id_from_url(url):
+    """Extrait l'identifiant d'offre d'une URL LinkedIn (currentJobId= ou /jobs/view/)"""
+    if not url:
+        return None
+    match = re.search(r'currentJobId=(\d+)', url) or re.search(r'/jobs/view/(\d+)', url)
+    return match.group(1) if match else None
+
+
+class DriverJobExtractor:
+    """Extrait les informations de l'offre affichée dans le navigateur"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.selectors = {
+            'title': TITLE_SELECTORS,
+            'company': COMPANY_SELECTORS,
+            'location': LOCATION_SELECTORS,
+            'location_ignored': LOCATION_IGNORED_PREFIXES,
+            'description': DESCRIPTION_SELECTORS,
+            'url': URL_SELECTORS,
+        }
+
+    def extract(self):
+        """
+        Retourne un dictionnaire (title, company, location, description, url, job_id)
+        pour l'offre affichée, en un seul aller-retour avec le navigateur
+        """
+        with timing.phase('extract.script'):
+            raw = self.driver.execute_script(EXTRACT_JOB_SCRIPT, self.selectors) or {}
+        with timing.phase('extract.url'):
+            return build_job_details(raw)
+
+    def job_cards(self):
+        """
+        Offres de la liste de résultats, dans l'ordre et sans doublons: {identifiant: titre de la carte}.
+        Le titre est normalisé comme dans le parcours séquentiel (blancs réduits)
+        """
+        values = self.driver.execute_script(COLLECT_JOB_IDS_SCRIPT, JOB_LIST_SELECTOR, CARD_TITLE_SELECTOR) or []
+        cards = {}
+        for value, title in values:
+            job_id = value if value and value.isdigit() else job_id_from_url(value)
+            if job_id and not cards.get(job_id):
+                cards[job_id] = " ".join((title or "").split())
+        return cards
+
+
+def build_job_details(raw):
+    """
+    Normalise le résultat brut de l'extraction.
+    L'URL est choisie dans le même ordre que l'ancienne extraction: currentJobId,
+    lien du titre, URL courante d'une page d'offre, puis premier attribut data-job-id.
+    """
+    details = {field: raw.get(field) or default for field, default in DEFAULT_VALUES.items()}
+
+    current_url = raw.get('current_url') or ''
+    job_id = raw.get('current_job_id')
+    if job_id:
+        job_url = job_view_url(job_id)
+    elif raw.get('link_url'):
+        job_url = raw['link_url']
+        job_id = job_id_from_url(job_url)
+    elif "/jobs/view/" in current_url:
+        job_url = current_url
+        job_id = job_id_from_url(job_url)
+    elif raw.get('data_job_id'):
+        job_id = raw['data_job_id']
+        job_url = job_view_url(job_id)
+    else:
+        job_url = ""
+
+    details['url'] = job_url
+    details['job_id'] = job_id
+    return details
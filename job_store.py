@@ -0,0 +1,210 @@
+"""
+Stockage SQLite des offres analysées.
+
+Chaque offre est enregistrée dès qu'elle est évaluée, par un upsert sur son
+identifiant LinkedIn : l'historique de toutes les exécutions tient dans une seule
+base au lieu de centaines de fichiers d'export horodatés. La base sert aussi
+d'index entre deux exécutions (une offre connue dont le titre affiché dans la
+liste n'a pas changé n'est pas rouverte) et de source pour les exports, filtrés
+en SQL.
+
+Exemple:
+    python job_store.py --friendly --min-score 20 --since 2026-01-01
+"""
+
+import os
+import hashlib
+import logging
+import sqlite3
+import argparse
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_FILE = os.path.join("exports", "jobs.db")
+
+# Préfixe des clés des offres dont l'identifiant LinkedIn n'a pas pu être extrait
+FALLBACK_KEY_PREFIX = "sans-id:"
+
+# Colonnes d'export, dans l'ordre de rule_engine.build_job_record
+EXPORT_COLUMNS = [
+    'title', 'company', 'location', 'url', 'is_gaijin_friendly',
+    'score_total', 'score_japonais', 'score_international', 'score_avantages',
+    'score_conges', 'score_langue', 'score_sentiment', 'jours_conges', 'avantages',
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    url TEXT,
+    is_gaijin_friendly TEXT,
+    score_total INTEGER,
+    score_japonais INTEGER,
+    score_international INTEGER,
+    score_avantages INTEGER,
+    score_conges INTEGER,
+    score_langue INTEGER,
+    score_sentiment INTEGER,
+    jours_conges,               -- nombre de jours ou 'Non spécifié'
+    avantages TEXT,
+    description TEXT,
+    card_title TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    analyzed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS idx_jobs_score_total ON jobs (score_total);
+CREATE INDEX IF NOT EXISTS idx_jobs_is_gaijin_friendly ON jobs (is_gaijin_friendly);
+CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen);
+"""
+
+# Colonnes mises à jour lorsqu'une offre déjà stockée est ré-analysée (first_seen est conservé)
+_UPDATED_COLUMNS = EXPORT_COLUMNS + ['description', 'last_seen', 'analyzed_at']
+
+_UPSERT = (
+    f"INSERT INTO jobs (job_id, {', '.join(EXPORT_COLUMNS)}, description, card_title, first_seen, last_seen, analyzed_at) "
+    f"VALUES (:job_id, {', '.join(':' + column for column in EXPORT_COLUMNS)}, :description, :card_title, "
+    f":now, :now, :now) "
+    f"ON CONFLICT(job_id) DO UPDATE SET "
+    f"{', '.join(f'{column} = excluded.{column}' for column in _UPDATED_COLUMNS)}, "
+    f"card_title = COALESCE(excluded.card_title, jobs.card_title)"
+)
+
+
+def now():
+    """Horodatage ISO à la seconde (triable comme une chaîne)"""
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def fallback_job_id(job):
+    """
+    Clé d'une offre sans identifiant LinkedIn: empreinte de son URL, ou à défaut
+    de son titre, de son entreprise et de son lieu (l'offre reste exportée)
+    """
+    source = job.get('url') or "|".join(job.get(field) or '' for field in ('title', 'company', 'location'))
+    return FALLBACK_KEY_PREFIX + hashlib.sha1(source.encode('utf-8')).hexdigest()[:16]
+
+
+class JobStore:
+    """Base SQLite des offres, indexée par identifiant LinkedIn"""
+
+    def __init__(self, path=DEFAULT_STORE_FILE):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+        self.skipped = 0
+        logger.info(f"Base des offres: {path} ({len(self)} offres connues)")
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, job_id):
+        return self.connection.execute("SELECT 1 FROM jobs WHERE job_id = ?", (job_id,)).fetchone() is not None
+
+    def is_unchanged(self, job_id, card_title=None):
+        """Indique si l'offre est connue et que son titre dans la liste (si fourni) n'a pas changé"""
+        row = self.connection.execute("SELECT card_title FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None:
+            return False
+        return not card_title or not row['card_title'] or row['card_title'] == card_title
+
+    def touch(self, job_id):
+        """Met à jour la date de dernière apparition et retourne la ligne d'export enregistrée"""
+        with self.connection:
+            self.connection.execute("UPDATE jobs SET last_seen = ? WHERE job_id = ?", (now(), job_id))
+        self.skipped += 1
+        return self.get(job_id)
+
+    def upsert(self, job_id, job, description=None, card_title=None):
+        """Insère ou met à jour une offre analysée (validé immédiatement)"""
+        values = {column: job.get(column) for column in EXPORT_COLUMNS}
+        values.update({'job_id': job_id, 'description': description, 'card_title': card_title or None, 'now': now()})
+        with self.connection:
+            self.connection.execute(_UPSERT, values)
+
+    def get(self, job_id):
+        """Ligne d'export d'une offre, ou None si elle est inconnue"""
+        row = self.connection.execute(
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def select(self, friendly=None, min_score=None, company=None, seen_since=None, first_seen_since=None,
+               columns=None, limit=None):
+        """Requête SQL filtrée et ses paramètres, triée par score décroissant"""
+        conditions, params = [], []
+        if friendly is not None:
+            conditions.append("is_gaijin_friendly = ?")
+            params.append('Oui' if friendly else 'Non')
+        if min_score is not None:
+            conditions.append("score_total >= ?")
+            params.append(min_score)
+        if company:
+            conditions.append("company = ?")
+            params.append(company)
+        if seen_since:
+            conditions.append("last_seen >= ?")
+            params.append(seen_since)
+        if first_seen_since:
+            conditions.append("first_seen >= ?")
+            params.append(first_seen_since)
+
+        query = f"SELECT {', '.join(columns or EXPORT_COLUMNS)} FROM jobs"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY score_total DESC, last_seen DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, params
+
+    def query(self, **filters):
+        """Lignes d'export correspondant aux filtres (voir select)"""
+        query, params = self.select(**filters)
+        return [dict(row) for row in self.connection.execute(query, params)]
+
+    def close(self):
+        self.connection.close()
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    parser = argparse.ArgumentParser(description="Export des offres stockées dans la base SQLite")
+    parser.add_argument("--store", default=DEFAULT_STORE_FILE, help=f"Base SQLite (défaut: {DEFAULT_STORE_FILE})")
+    parser.add_argument("--friendly", action="store_true", help="Uniquement les offres adaptées aux étrangers")
+    parser.add_argument("--min-score", type=int, default=None, help="Score total minimal")
+    parser.add_argument("--company", default=None, help="Entreprise")
+    parser.add_argument("--since", default=None, help="Offres vues depuis cette date (AAAA-MM-JJ)")
+    parser.add_argument("--new-since", default=None, help="Offres apparues pour la première fois depuis cette date (AAAA-MM-JJ)")
+    args = parser.parse_args()
+
+    store = JobStore(args.store)
+    try:
+        # L'exporteur n'est importé qu'ici (pandas n'est pas nécessaire au stockage)
+        from linkedin_export import LinkedInExporter
+        export_files = LinkedInExporter().export_store(
+            store, friendly=True if args.friendly else None, min_score=args.min_score,
+            company=args.company, seen_since=args.since, first_seen_since=args.new_since
+        )
+    finally:
+        store.close()
+    logger.info(f"CSV: {export_files['csv']}")
+    logger.info(f"Excel: {export_files['excel']}")
+    logger.info(f"Rapport HTML: {export_files['html']}")
+
+
+if __name__ == "__main__":
+    main()
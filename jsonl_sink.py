@@ -0,0 +1,60 @@
+"""
+Écriture en continu des offres évaluées dans un fichier JSONL.
+
+Chaque offre est ajoutée au fichier (une ligne JSON) et vidée sur disque dès
+qu'elle est évaluée : la mémoire reste constante sur les longues exécutions et
+d'autres outils peuvent lire les résultats partiels pendant le scraping.
+"""
+
+import os
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlSink:
+    """Fichier JSONL ouvert en ajout, vidé après chaque offre"""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(path, 'a', encoding='utf-8')
+        self.count = 0
+        logger.info(f"Offres écrites au fil de l'eau dans {path}")
+
+    def write(self, job):
+        """Ajoute une offre et vide le tampon pour la rendre lisible immédiatement"""
+        self.file.write(json.dumps(job, ensure_ascii=False) + '\n')
+        self.file.flush()
+        self.count += 1
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_jsonl(path):
+    """
+    Lit paresseusement les offres d'un fichier JSONL (une offre par ligne).
+    Une ligne incomplète (fichier en cours d'écriture) est ignorée
+    """
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError:
+                logger.warning(f"Ligne JSONL invalide ignorée dans {path}")
+                continue
+            yield job
@@ -0,0 +1,119 @@
+"""
+Détection de la langue de rédaction des offres.
+
+Une passe rapide sur les écritures Unicode tranche la plupart des cas sans
+langdetect : une forte proportion de kana/kanji désigne le japonais, un texte
+essentiellement latin est départagé entre anglais et français par le décompte
+de mots vides. Seuls les textes ambigus (mélanges, autres langues) passent par
+langdetect, avec une graine fixe pour des résultats reproductibles. Les
+résultats sont mémorisés par empreinte du contenu.
+
+Exemple:
+    language_detector.detect_language("No Japanese required, English is our official language.")  # 'en'
+"""
+
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Graine de langdetect (sans graine, le résultat varie d'un appel à l'autre)
+DEFAULT_SEED = 0
+# Nombre de résultats mémorisés
+DEFAULT_CACHE_SIZE = 4096
+
+# Part minimale de kana/kanji parmi les lettres pour conclure au japonais
+JAPANESE_RATIO = 0.3
+# Part minimale de lettres latines pour départager anglais et français
+LATIN_RATIO = 0.9
+# Mots vides à trouver, et avance requise d'une langue sur l'autre (facteur)
+MIN_STOP_WORDS = 3
+STOP_WORD_LEAD = 2
+
+# Mots vides propres à chaque langue (les mots partagés avec l'espagnol ou
+# l'italien, comme "de", "la", "que", sont exclus)
+STOP_WORDS = {
+    'en': frozenset([
+        'the', 'and', 'to', 'of', 'in', 'is', 'for', 'with', 'you', 'your', 'our', 'we',
+        'will', 'are', 'be', 'this', 'that', 'on', 'as', 'an', 'or', 'have', 'from', 'by',
+    ]),
+    'fr': frozenset([
+        'le', 'les', 'des', 'du', 'et', 'est', 'une', 'pour', 'dans', 'nous', 'vous', 'avec',
+        'sur', 'au', 'aux', 'qui', 'ce', 'cette', 'sont', 'pas', 'être', 'ou', 'notre', 'nos',
+    ]),
+}
+
+KANA_RE = re.compile(r'[\u3040-\u30ff\uff66-\uff9f]')
+KANJI_RE = re.compile(r'[\u3400-\u4dbf\u4e00-\u9fff]')
+LATIN_RE = re.compile(r'[A-Za-z\u00c0-\u024f]')
+LETTER_RE = re.compile(r'[^\W\d_]')
+WORD_RE = re.compile(r'[^\W\d_]+')
+
+
+def script_language(text):
+    """
+    Langue déduite des écritures et des mots vides ('ja', 'en', 'fr'),
+    ou None si le texte est ambigu
+    """
+    letters = len(LETTER_RE.findall(text))
+    if not letters:
+        return None
+
+    kana = len(KANA_RE.findall(text))
+    # Des kanji sans kana peuvent être du chinois : laissé à langdetect
+    if kana and (kana + len(KANJI_RE.findall(text))) / letters >= JAPANESE_RATIO:
+        return 'ja'
+
+    if len(LATIN_RE.findall(text)) / letters < LATIN_RATIO:
+        return None
+
+    counts = dict.fromkeys(STOP_WORDS, 0)
+    for word in WORD_RE.findall(text.lower()):
+        for language, words in STOP_WORDS.items():
+            if word in words:
+                counts[language] += 1
+    if counts['en'] >= MIN_STOP_WORDS and counts['en'] >= STOP_WORD_LEAD * counts['fr']:
+        return 'en'
+    if counts['fr'] >= MIN_STOP_WORDS and counts['fr'] >= STOP_WORD_LEAD * counts['en']:
+        return 'fr'
+    return None
+
+
+class LanguageDetector:
+    """Détection mémorisée par empreinte du contenu, partagée entre threads"""
+
+    def __init__(self, seed=DEFAULT_SEED, cache_size=DEFAULT_CACHE_SIZE):
+        self.seed = seed
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self._detect = None
+
+    def fallback(self, text):
+        """Détection par langdetect (importé au premier texte ambigu, avec graine fixe)"""
+        if self._detect is None:
+            from langdetect import DetectorFactory, detect
+            DetectorFactory.seed = self.seed
+            self._detect = detect
+        return self._detect(text)
+
+    def detect(self, text):
+        """Code de langue du texte ; les erreurs de langdetect sont propagées"""
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        language = script_language(text) or self.fallback(text)
+
+        with self.lock:
+            self.cache[key] = language
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return language
+
+
+# Détecteur partagé du processus
+DETECTOR = LanguageDetector()
+detect_language = DETECTOR.detect
@@ -1,10 +1,11 @@
 import os
-import pandas as pd
 import logging
-import webbrowser
 from datetime import datetime
 import re
+import csv
 import json
+from jsonl_sink import read_jsonl
+import timing
 
 # Configuration des logs
 logging.basicConfig(
@@ -14,6 +15,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Emplacement des données des offres dans le gabarit du rapport HTML
+JOBS_DATA_PLACEHOLDER = "__JOBS_DATA__"
+
+
+def without_description(jobs):
+    """Offres sans la description longue, inutile dans les exports"""
+    for job in jobs:
+        yield {k: v for k, v in job.items() if k != 'description'}
+
+
 class LinkedInExporter:
     def __init__(self):
         self.export_dir = "exports"
@@ -26,20 +37,32 @@ class LinkedInExporter:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"{self.export_dir}/{base_name}_{timestamp}"
     
+    @timing.timed('export.csv')
     def export_to_csv(self, jobs, filename=None):
-        """Exporter les offres en CSV"""
+        """
+        Exporter les offres en CSV.
+        jobs peut être une liste ou un itérable paresseux (lignes écrites au fil de l'eau)
+        """
         if not filename:
             filename = self.prepare_filename("linkedin_jobs") + ".csv"
         
-        logger.info(f"Exportation de {len(jobs)} offres vers CSV: {filename}")
+        logger.info(f"Exportation des offres vers CSV: {filename}")
         
-        # Créer un DataFrame et exporter
-        df = pd.DataFrame(jobs)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        count = 0
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = None
+            for job in jobs:
+                # Les colonnes sont celles de la première offre
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(job.keys()), extrasaction='ignore')
+                    writer.writeheader()
+                writer.writerow(job)
+                count += 1
         
-        logger.info(f"Export CSV terminé: {filename}")
+        logger.info(f"Export CSV terminé: {filename} ({count} offres)")
         return filename
     
+    @timing.timed('export.excel')
     def export_to_excel(self, jobs, filename=None):
         """Exporter les offres en Excel avec formatage avancé"""
         if not filename:
@@ -47,6 +70,9 @@ class LinkedInExporter:
             
         logger.info(f"Exportation de {len(jobs)} offres vers Excel: {filename}")
         
+        # pandas n'est importé que pour l'export Excel (les processus qui n'exportent pas ne le chargent pas)
+        import pandas as pd
+        
         # Créer un DataFrame
         df = pd.DataFrame(jobs)
         
@@ -171,23 +197,18 @@ class LinkedInExporter:
             logger.error(f"Erreur lors de l'export Excel: {str(e)}")
             return None
     
+    @timing.timed('export.html')
     def create_html_report(self, jobs, output_file):
-        """Crée un rapport HTML interactif à partir des données d'offres d'emploi"""
+        """
+        Crée un rapport HTML interactif à partir des données d'offres d'emploi.
+        jobs peut être une liste ou un itérable paresseux: les données sont écrites
+        dans le fichier offre par offre, sans construire la chaîne JSON complète
+        """
         try:
-            logger.info(f"Création du rapport HTML pour {len(jobs)} offres")
+            logger.info("Création du rapport HTML")
             
-            # Vérifier si on a des données
-            if not jobs:
-                logger.warning("Aucune offre d'emploi disponible pour le rapport HTML")
-                df = pd.DataFrame()
-            else:
-                # Convertir en dataframe pour traitement
-                df = pd.DataFrame(jobs)
-                logger.info(f"Nombre d'offres disponibles pour le rapport HTML: {len(df)}")
-            
-            # Préparer les données pour le JavaScript - Correction: utiliser json.dumps directement
-            json_data = json.dumps(jobs)
-            logger.info(f"Taille des données JSON: {len(json_data)} caractères")
+            # Emplacement des données JavaScript, remplacé à l'écriture du fichier
+            json_data = JOBS_DATA_PLACEHOLDER
             
             # S'assurer que le fichier de sortie a une extension .html
             if not output_file.endswith('.html'):
@@ -535,18 +556,31 @@ class LinkedInExporter:
 </body>
 </html>"""
 
-            # Enregistrer le fichier HTML
+            # Enregistrer le fichier HTML (même JSON que json.dumps(list(jobs)), sur une seule ligne)
             os.makedirs(self.export_dir, exist_ok=True)
+            before, after = html_content.split(JOBS_DATA_PLACEHOLDER)
+            count = 0
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            logger.info(f"Rapport HTML créé: {output_file}")
+                f.write(before)
+                f.write('[')
+                for job in jobs:
+                    if count:
+                        f.write(', ')
+                    f.write(json.dumps(job))
+                    count += 1
+                f.write(']')
+                f.write(after)
+            
+            if not count:
+                logger.warning("Aucune offre d'emploi disponible pour le rapport HTML")
+            logger.info(f"Rapport HTML créé: {output_file} ({count} offres)")
             return output_file
         
         except Exception as e:
             logger.error(f"Erreur lors de la création du rapport HTML: {str(e)}")
             return None
     
+    @timing.timed('export.all')
     def export_all(self, jobs):
         """Exporte les données dans tous les formats disponibles"""
         logger.info(f"Export des données pour {len(jobs)} offres dans tous les formats")
@@ -574,6 +608,38 @@ class LinkedInExporter:
             'html': html_file
         }
         
+    def export_jsonl(self, path):
+        """
+        Exporte les offres d'un fichier JSONL (jsonl_sink.JsonlSink) en le relisant
+        paresseusement pour le CSV et le rapport HTML
+        """
+        logger.info(f"Export des offres du fichier {path} dans tous les formats")
+        
+        def export_jobs():
+            return without_description(read_jsonl(path))
+        
+        csv_file = self.export_to_csv(export_jobs())
+        # XlsxWriter a besoin du nombre de lignes et de colonnes: seul l'Excel matérialise les offres
+        excel_file = self.export_to_excel(list(export_jobs()))
+        html_file = self.create_html_report(export_jobs(), self.prepare_filename("linkedin_report"))
+        html_file = self.fix_html_report(html_file)
+        
+        return {
+            'csv': csv_file,
+            'excel': excel_file,
+            'html': html_file
+        }
+        
+    def export_store(self, store, **filters):
+        """
+        Exporte les offres de la base SQLite (job_store.JobStore) correspondant aux filtres,
+        appliqués en SQL (friendly, min_score, company, seen_since, first_seen_since)
+        """
+        jobs = store.query(**filters)
+        logger.info(f"{len(jobs)} offres lues depuis la base {store.path}")
+        return self.export_all(jobs)
+        
+    @timing.timed('export.fix_html')
     def fix_html_report(self, html_file):
         """Corrige les potentielles erreurs de syntaxe dans le HTML généré"""
         if not os.path.exists(html_file):
@@ -1,20 +1,33 @@
 import os
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.firefox.service import Service
-from webdriver_manager.firefox import GeckoDriverManager
-from dotenv import load_dotenv
-import pandas as pd
-from langdetect import detect
-import re
 import logging
 import argparse
+from datetime import datetime
 # Import the localization system
 from localization import i18n, Localization
+import driver_setup
+import rule_engine
+import job_store
+from job_store import JobStore
+import score_cache
+from score_cache import ScoreCache
+import checkpoint
+from checkpoint import Checkpoint
+from jsonl_sink import JsonlSink, read_jsonl
+from search_pages import SearchPaginator
+from gaijin_scorer import GaijinScorer
+import waits
+from waits import SmartWait
+import job_extractor
+from job_extractor import DriverJobExtractor
+from worker_pool import BrowserWorkerPool, MAX_WORKERS
+from http_extractor import HttpJobExtractor
+from async_fetcher import AsyncJobFetcher, DEFAULT_CONCURRENCY
+import rate_limiter
+from rate_limiter import RateLimiter, paced_get
+import session_store
+from session_store import SessionStore, session_cookies
+import linkedin_urls
+import timing
 
 # Configuration des logs
 logging.basicConfig(
@@ -24,47 +37,93 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Éléments de navigation présents uniquement lorsque l'utilisateur est connecté
+CONNECTED_SELECTOR = "nav.global-nav, div.global-nav__content, div.feed-identity-module, div.artdeco-card"
+
 class LinkedInScraper:
-    def __init__(self):
+    def __init__(self, wait_timeouts=None, max_wait=None, rate=rate_limiter.DEFAULT_RATE,
+                 burst=rate_limiter.DEFAULT_BURST,
+                 session_file=session_store.DEFAULT_SESSION_FILE, driver_profile=driver_setup.DEFAULT_PROFILE,
+                 geckodriver_path=None, store_file=job_store.DEFAULT_STORE_FILE,
+                 checkpoint_file=checkpoint.DEFAULT_CHECKPOINT_FILE, record_dir=None,
+                 score_cache_file=score_cache.DEFAULT_CACHE_FILE):
         logger.info(i18n.get('scraper_init'))
+        # Les dépendances lourdes (selenium, dotenv, pandas) sont importées à leur point
+        # d'utilisation: linkedin_scraper.py --help démarre sans les charger
+        from dotenv import load_dotenv
         load_dotenv()
+        # Cache des scores par description (None pour tout analyser sans mémoriser)
+        self.score_cache = ScoreCache(score_cache_file) if score_cache_file else None
+        self.scorer = GaijinScorer(cache=self.score_cache)
+        # Cookies de session persistés entre deux exécutions (None pour désactiver)
+        self.session = SessionStore(session_file) if session_file else None
+        # Base des offres analysées, alimentée au fil de l'eau (None pour tout ré-analyser sans stocker)
+        self.store = JobStore(store_file) if store_file else None
+        self.run_started = job_store.now()
+        # Point de reprise de l'exécution (None pour désactiver)
+        self.checkpoint = Checkpoint(checkpoint_file) if checkpoint_file else None
+        # Fichier JSONL alimenté au fil de l'eau (voir open_stream)
+        self.sink = None
+        # Offres évaluées (reprise comprise), pour les statistiques finales
+        self.counts = {'total': 0, 'friendly': 0}
+        # Enregistrement des pages visitées pour un rejeu hors ligne (None pour désactiver)
+        self.recorder = None
+        if record_dir:
+            from fixtures import FixtureRecorder
+            self.recorder = FixtureRecorder(record_dir)
+        self.driver_profile = driver_profile
+        self.geckodriver_path = geckodriver_path
         self.driver = None
+        self.pool = None
+        self.paginator = None
+        # Rythme commun des navigations et clics (pool de navigateurs compris)
+        self.limiter = RateLimiter(rate=rate, burst=burst)
         self.setup_driver()
+        # Attentes conditionnelles bornées à la place des pauses fixes
+        self.waits = SmartWait(self.driver, timeouts=wait_timeouts, max_wait=max_wait)
+        self.extractor = DriverJobExtractor(self.driver)
         
     def setup_driver(self):
-        """Configure le driver Firefox avec les options nécessaires"""
+        """Configure le driver Firefox principal"""
+        self.driver = self.build_driver()
+        
+    def build_driver(self):
+        """Crée un driver Firefox selon le profil choisi (driver principal ou worker)"""
+        from selenium import webdriver
+        from selenium.webdriver.firefox.service import Service
+        
         logger.info(i18n.get('config_driver'))
-        options = webdriver.FirefoxOptions()
-        # Désactiver le mode headless pour le débogage
-        # options.add_argument('--headless')
-        options.add_argument('--width=1920')
-        options.add_argument('--height=1080')
+        logger.info(f"Profil du driver: {self.driver_profile}")
+        options = driver_setup.build_options(self.driver_profile)
         
         try:
-            service = Service(GeckoDriverManager().install())
-            self.driver = webdriver.Firefox(service=service, options=options)
-            self.driver.maximize_window()  # Maximiser la fenêtre
+            # Résolu une seule fois, puis réutilisé par les drivers des workers
+            self.geckodriver_path = driver_setup.resolve_geckodriver(self.geckodriver_path)
+            service = Service(self.geckodriver_path)
+            driver = webdriver.Firefox(service=service, options=options)
+            if driver_setup.should_maximize(self.driver_profile):
+                driver.maximize_window()  # Maximiser la fenêtre
             logger.info(i18n.get('driver_success'))
+            return driver
         except Exception as e:
             logger.error(i18n.get('driver_error', str(e)))
             raise
                 
     def login(self):
         """Se connecte à LinkedIn"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
         logger.info("Tentative de connexion à LinkedIn...")
-        self.driver.get('https://www.linkedin.com/login')
-        time.sleep(5)  # Attendre que la page se charge complètement
+        self.navigate(linkedin_urls.url('/login'))
         
         # Vérifier que la page de connexion est bien chargée
-        try:
-            WebDriverWait(self.driver, 20).until(
-                EC.presence_of_element_located((By.ID, 'username'))
-            )
-            logger.info("Champ de connexion trouvé")
-        except TimeoutException:
+        if not self.waits.until(EC.presence_of_element_located((By.ID, 'username')), 'login', nominal=5):
             logger.error("La page de connexion n'a pas pu être chargée")
             self.driver.save_screenshot("debug_login_page.png")
-            raise
+            raise TimeoutException("La page de connexion n'a pas pu être chargée")
+        logger.info("Champ de connexion trouvé")
             
         email = os.getenv('LINKEDIN_EMAIL')
         password = os.getenv('LINKEDIN_PASSWORD')
@@ -86,11 +145,12 @@ class LinkedInScraper:
             logger.info("Mot de passe saisi")
             
             login_button = self.driver.find_element(By.CSS_SELECTOR, '.login__form_action_container button')
-            login_button.click()
+            self.click(login_button)
             logger.info("Bouton de connexion cliqué")
             
-            # Attendre que la connexion soit traitée
-            time.sleep(10)  # Augmenter le temps d'attente
+            # Attendre que la connexion soit traitée (sortie de la page de connexion)
+            self.waits.until(waits.url_left('/login'), 'login', nominal=10,
+                             message="la page de connexion est toujours affichée")
             
             # Vérifier si nous sommes sur une page de vérification
             current_url = self.driver.current_url
@@ -102,7 +162,8 @@ class LinkedInScraper:
                 input("Veuillez compléter la vérification de sécurité manuellement, puis appuyez sur Entrée...")
                 
                 # Attendre que la vérification soit terminée
-                time.sleep(5)
+                self.waits.until(waits.url_left('checkpoint'), 'login', nominal=5,
+                                 message="la vérification n'est pas terminée")
             
             # Vérifier que la connexion a réussi de plusieurs façons
             logger.info("Vérification de la connexion réussie...")
@@ -117,25 +178,12 @@ class LinkedInScraper:
                 self.driver.save_screenshot("debug_still_on_login.png")
                 raise Exception("La connexion a échoué - nous sommes toujours sur la page de connexion")
             
-            # Essayer plusieurs sélecteurs pour vérifier la connexion
-            selectors = [
-                "nav.global-nav",
-                "div.global-nav__content",
-                "div.feed-identity-module",
-                "div.artdeco-card"
-            ]
-            
-            connected = False
-            for selector in selectors:
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Élément trouvé avec le sélecteur: {selector}")
-                    connected = True
-                    break
-                except:
-                    continue
+            # Une seule attente pour l'ensemble des sélecteurs de navigation, au lieu de 10 s par sélecteur
+            connected = self.waits.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, CONNECTED_SELECTOR)), 'login', nominal=0
+            )
+            if connected:
+                logger.info(f"Élément de navigation trouvé: {connected.tag_name}")
             
             if not connected:
                 logger.warning("Aucun élément de navigation trouvé, mais la connexion semble réussie")
@@ -148,833 +196,169 @@ class LinkedInScraper:
             self.driver.save_screenshot("debug_login_error.png")
             raise
         
+        # Enregistrer la session pour les prochaines exécutions
+        if self.session:
+            try:
+                self.session.save(session_cookies(self.driver))
+            except OSError as e:
+                logger.warning(f"Impossible d'enregistrer la session: {str(e)}")
+    
+    def restore_session(self):
+        """
+        Restaure la session enregistrée et vérifie qu'elle est toujours authentifiée.
+        Retourne False si aucune session valide n'est disponible
+        """
+        if not self.session:
+            return False
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        cookies = self.session.load()
+        if not cookies:
+            return False
+        
+        logger.info(f"Restauration de la session enregistrée ({len(cookies)} cookies)")
+        session_store.add_cookies(self.driver, cookies, self.limiter)
+        self.navigate(linkedin_urls.url('/feed/'))
+        connected = self.waits.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, CONNECTED_SELECTOR)), 'login', nominal=0
+        )
+        current_url = self.driver.current_url
+        if not connected or any(marker in current_url for marker in ("login", "authwall", "checkpoint")):
+            logger.info("La session enregistrée n'est plus valide")
+            self.session.clear()
+            self.driver.delete_all_cookies()
+            return False
+        
+        logger.info("Session restaurée, connexion non nécessaire")
+        return True
+    
+    def start_session(self):
+        """Réutilise la session enregistrée si elle est valide, sinon se connecte"""
+        if not self.restore_session():
+            self.login()
+        
     def search_jobs(self, keywords=None, location="Tokyo, Japan"):
         """Recherche des offres d'emploi sur LinkedIn"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        
         if keywords is None:
             keywords = ["Technical Consultant", "Software Consultant", "Professional Services"]
         
         logger.info(f"Recherche d'offres avec les mots-clés: {keywords}")
         logger.info(f"Localisation: {location}")
         
-        # Construire l'URL de recherche
-        base_url = "https://www.linkedin.com/jobs/search"
-        
-        # Encoder les mots-clés pour l'URL
-        search_query = " OR ".join(keywords)
-        encoded_query = search_query.replace(" ", "+")
-        
-        # ID géographique pour Tokyo, Japan
-        geo_id = "101355337"  # ID pour Tokyo, Japan
-        
-        # Construire l'URL complète
-        search_url = f"{base_url}?keywords={encoded_query}&distance=25&geoId={geo_id}"
+        # Construire l'URL de recherche (les pages suivantes sont adressées par leur décalage start=)
+        self.paginator = SearchPaginator(keywords, location)
+        search_url = self.paginator.url(0)
         logger.info(f"URL de recherche: {search_url}")
         
         # Naviguer vers l'URL de recherche
         logger.info("Navigation vers la page de résultats...")
-        self.driver.get(search_url)
+        if not self.navigate(search_url, expected='/jobs/search'):
+            raise Exception("La page de recherche reste inaccessible (limitation de LinkedIn)")
         
-        # Attendre plus longtemps pour le chargement initial
-        time.sleep(10)
+        # Attendre l'affichage des premières offres
+        with timing.phase('search.page_load'):
+            self.waits.until(waits.job_cards_present, 'page_load', nominal=10,
+                             message="aucune offre affichée après le chargement")
         
         # Gérer les pop-ups de cookies si présents
-        try:
-            cookie_button = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-control-name='ga-cookie.consent.accept.v2']"))
-            )
-            cookie_button.click()
-            logger.info("Popup de cookies fermé")
-            time.sleep(2)
-        except:
-            logger.info("Pas de popup de cookies détecté")
+        with timing.phase('search.popup'):
+            try:
+                cookie_button = self.waits.until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[data-control-name='ga-cookie.consent.accept.v2']")),
+                    'popup', nominal=0
+                )
+                if cookie_button:
+                    self.click(cookie_button)
+                    logger.info("Popup de cookies fermé")
+                    self.waits.until(EC.staleness_of(cookie_button), 'popup', nominal=2)
+                else:
+                    logger.info("Pas de popup de cookies détecté")
+            except:
+                logger.info("Pas de popup de cookies détecté")
         
         # Attendre que la page charge complètement
         logger.info("Attente du chargement complet de la page...")
-        time.sleep(10)
+        with timing.phase('search.page_load'):
+            self.waits.until(waits.page_ready, 'page_load', nominal=10,
+                             message="la page de résultats n'est pas complètement chargée")
         
         # Vérification que la page contient des offres
-        try:
-            # Vérifier la présence d'éléments li (on utilise une approche plus générique)
-            list_items = self.driver.find_elements(By.CSS_SELECTOR, "li")
-            logger.info(f"Nombre d'éléments li trouvés: {len(list_items)}")
+        with timing.phase('search.verification'):
+            try:
+                # Vérifier la présence d'éléments li (on utilise une approche plus générique)
+                list_items = self.driver.find_elements(By.CSS_SELECTOR, "li")
+                logger.info(f"Nombre d'éléments li trouvés: {len(list_items)}")
             
-            # Vérifier la présence d'éléments spécifiques aux jobs
-            job_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-job-id]")
-            logger.info(f"Nombre d'éléments avec data-job-id trouvés: {len(job_elements)}")
+                # Vérifier la présence d'éléments spécifiques aux jobs
+                job_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-job-id]")
+                logger.info(f"Nombre d'éléments avec data-job-id trouvés: {len(job_elements)}")
             
-            # Vérifier les éléments avec classes contenant 'job'
-            job_class_elements = self.driver.find_elements(By.CSS_SELECTOR, "[class*='job']")
-            logger.info(f"Nombre d'éléments avec classe 'job' trouvés: {len(job_class_elements)}")
+                # Vérifier les éléments avec classes contenant 'job'
+                job_class_elements = self.driver.find_elements(By.CSS_SELECTOR, "[class*='job']")
+                logger.info(f"Nombre d'éléments avec classe 'job' trouvés: {len(job_class_elements)}")
             
-            # Prendre une capture d'écran pour analyse visuelle
-            self.driver.save_screenshot("search_results_loaded.png")
-            logger.info("Capture d'écran sauvegardée dans search_results_loaded.png")
+                # Prendre une capture d'écran pour analyse visuelle
+                self.driver.save_screenshot("search_results_loaded.png")
+                logger.info("Capture d'écran sauvegardée dans search_results_loaded.png")
             
-            if len(job_elements) == 0 and len(job_class_elements) == 0:
-                logger.error("Aucun élément d'offre d'emploi trouvé")
-                raise Exception("Aucun élément d'offre d'emploi trouvé")
+                if len(job_elements) == 0 and len(job_class_elements) == 0:
+                    logger.error("Aucun élément d'offre d'emploi trouvé")
+                    raise Exception("Aucun élément d'offre d'emploi trouvé")
             
-            logger.info("Page de résultats chargée avec succès")
+                logger.info("Page de résultats chargée avec succès")
             
-        except Exception as e:
-            logger.error(f"Erreur lors de la vérification des résultats: {str(e)}")
-            self.driver.save_screenshot("debug_search_results.png")
-            raise
+            except Exception as e:
+                logger.error(f"Erreur lors de la vérification des résultats: {str(e)}")
+                self.driver.save_screenshot("debug_search_results.png")
+                raise
         
+    @timing.timed('scoring')
     def is_gaijin_friendly(self, description):
         """
         Détermine si l'offre est adaptée aux étrangers en utilisant une approche multicritère
-        Retourne un tuple contenant (resultat, score_total, scores_détails, jours_congés, avantages)
-        """
-        # Score de base
-        score = 0
-        days_of_leave = None
-        
-        # Analyse du niveau de japonais requis
-        japanese_score = self.analyze_japanese_requirements(description)
-        score += japanese_score
-        
-        # Analyse de l'environnement international
-        international_score = self.analyze_international_environment(description)
-        score += international_score
-        
-        # Analyse des avantages pour expatriés
-        benefits_score = self.analyze_expat_benefits(description)
-        score += benefits_score
-        
-        # Analyse des politiques de congés
-        leave_policy_score, days_of_leave = self.analyze_leave_policy(description)
-        score += leave_policy_score
-        
-        # Analyse de la langue utilisée dans l'offre
-        language_score = self.analyze_language(description)
-        score += language_score
-        
-        # Analyse générale de sentiment
-        sentiment_score = self.analyze_sentiment(description)
-        score += sentiment_score
-        
-        # Détecter les avantages supplémentaires
-        additional_benefits = self.detect_additional_benefits(description)
-        
-        # Journaliser le score final
-        logger.info(f"Score gaijin-friendly: {score}")
-        logger.info(f"Japonais: {japanese_score}, International: {international_score}, "
-                    f"Avantages: {benefits_score}, Congés: {leave_policy_score}, "
-                    f"Langue: {language_score}, Sentiment: {sentiment_score}")
-        if days_of_leave:
-            logger.info(f"Jours de congés: {days_of_leave}")
-        if additional_benefits:
-            logger.info(f"Avantages supplémentaires: {', '.join(additional_benefits)}")
-        
-        # Créer un dictionnaire des détails pour le CSV
-        details = {
-            'score_total': score,
-            'score_japonais': japanese_score,
-            'score_international': international_score,
-            'score_avantages': benefits_score,
-            'score_conges': leave_policy_score,
-            'score_langue': language_score,
-            'score_sentiment': sentiment_score,
-            'jours_conges': days_of_leave,
-            'avantages': ', '.join(additional_benefits) if additional_benefits else ''
-        }
-        
-        # Une offre est considérée comme gaijin-friendly si le score est supérieur à 15 
-        # ET le score japonais n'est pas fortement négatif
-        is_friendly = score > 15 and japanese_score > -10
-        return is_friendly, details
-
-    def analyze_japanese_requirements(self, description):
+        Retourne un tuple contenant (resultat, scores_détails)
+        L'analyse est déléguée au composant de scoring (gaijin_scorer), utilisable sans driver
         """
-        Analyse les exigences linguistiques japonaises
-        Retourne un score: positif si peu/pas de japonais requis, négatif si japonais avancé requis
-        """
-        score = 0
-        
-        # Expressions positives (pas de japonais ou japonais basique requis)
-        positive_patterns = [
-            # Pas de japonais requis
-            r'(?i)no\s+japanese\s+(language\s+)?(required|needed)',
-            r'(?i)japanese\s+(language\s+)?(not|isn\'t|isn t|isnt)\s+(required|needed|necessary)',
-            r'(?i)japanese\s+(language\s+)?is\s+(not|optional)',
-            r'(?i)without\s+japanese\s+language',
-            r'(?i)english(\s+)(speaking|environment|workplace)',
-            r'(?i)english\s+(as|is)\s+(the|a|an|our)\s+(primary|main|official|working|company|business|corporate)\s+language',
-            r'(?i)(primary|main|official|working|company|business|corporate)\s+language\s+is\s+english',
-            r'(?i)japanese\s+is\s+a\s+plus',
-            r'(?i)japanese\s+is\s+not\s+required',
-            
-            # Langues alternatives
-            r'(?i)english\s+(only|speaking)',
-            r'(?i)(speak|communication\s+in)\s+english',
-            r'(?i)(proficient|fluent)\s+in\s+english',
-            r'(?i)english\s+(proficiency|fluency)',
-            r'(?i)english\s+language\s+skills',
-            
-            # Mots-clés positifs supplémentaires
-            r'(?i)foreigner\s+friendly',
-            r'(?i)gaijin\s+friendly',
-            r'(?i)international\s+candidates',
-            r'(?i)overseas\s+applicants',
-            r'(?i)foreign\s+nationals\s+(welcome|encouraged)',
-            r'(?i)open\s+to\s+(foreigners|expats|expatriates)',
-            r'(?i)welcome\s+(foreigners|expats|expatriates)'
-        ]
-        
-        # Expressions négatives (japonais requis)
-        negative_patterns = [
-            r'(?i)japanese\s+(language|fluency)\s+(required|needed|mandatory|essential)',
-            r'(?i)(proficient|fluent)\s+in\s+japanese',
-            r'(?i)japanese\s+(proficiency|fluency)',
-            r'(?i)japanese\s+language\s+skills',
-            r'(?i)(high|strong)\s+level\s+of\s+japanese',
-            r'(?i)ビジネスレベル.*日本語',
-            r'(?i)日本語.*ビジネスレベル',
-            r'(?i)日本語必須',
-            r'(?i)(native|business)\s+level\s+japanese',
-            r'(?i)jlpt\s*(n1|n2)',
-            r'(?i)(must|should)\s+(be\s+)?(able\s+to\s+)?(speak|understand|read|write)\s+japanese',
-            r'(?i)native\s+japanese\s+speaker',
-            r'(?i)fluent\s+japanese',
-            r'(?i)advanced\s+japanese',
-            
-            # Nouveaux patterns pour résoudre les problèmes identifiés
-            r'(?i)both\s+.*japanese\s+and\s+english.*mandatory',
-            r'(?i)both\s+.*japanese\s+and\s+english.*required',
-            r'(?i)(skills|communication).*japanese\s+and\s+english',
-            r'(?i)japanese\s+and\s+english\s+(skills|communication)',
-            r'(?i)(skills|communication).*in\s+.*japanese.*is\s+a\s+must',
-            r'(?i)(skills|communication).*in\s+.*japanese.*required',
-            r'(?i)(skills|communication).*in\s+.*japanese.*necessary',
-            r'(?i)(english\s+and\s+japanese|japanese\s+and\s+english).*is\s+a\s+must',
-            r'(?i)(english\s+and\s+japanese|japanese\s+and\s+english).*required',
-            r'(?i)fluent\s+in\s+.*japanese',
-            r'(?i)fluent\s+in\s+.*english\s+and\s+japanese',
-            r'(?i)fluent\s+in\s+.*japanese\s+and\s+english',
-            r'(?i)language\s+proficiency.*japanese',
-            r'(?i)proficiency\s+in\s+.*japanese',
-            r'(?i)strong\s+.*communication\s+skills.*japanese',
-            r'(?i)excellent\s+.*communication\s+skills.*japanese',
-            
-            # Nouveaux patterns spécifiques pour le cas signalé et similaires
-            r'(?i)native\s+japanese\s+speaker',
-            r'(?i)native\s+japanese.*fluent\s+in\s+english',
-            r'(?i)native\s+japanese.*english\s+fluent',
-            r'(?i)native\s+japanese.*english\s+speaker',
-            r'(?i)japanese\s+native\s+speaker',
-            r'(?i)fluent\s+japanese\s+language',
-            r'(?i)native\s+level\s+japanese',
-            r'(?i)japanese\s+at\s+native\s+level',
-            r'(?i)japanese\s+at\s+a\s+native\s+level',
-            r'(?i)native\s+or\s+near-native\s+japanese',
-            r'(?i)near-native\s+japanese',
-            r'(?i)japanese\s+mother\s+tongue',
-            r'(?i)mother\s+tongue\s+japanese',
-            r'(?i)japanese\s+as\s+(a\s+)?mother\s+tongue',
-            r'(?i)spoken\s+and\s+written\s+japanese',
-            r'(?i)read\s+and\s+write\s+japanese',
-            r'(?i)japanese\s+reading\s+and\s+writing',
-            r'(?i)(speaking|communicating)\s+in\s+japanese\s+with',
-            r'(?i)communicate\s+.*in\s+japanese',
-            r'(?i)communication\s+.*in\s+japanese',
-            r'(?i)japanese\s+speaker',
-            r'(?i)need\s+to\s+(speak|understand)\s+japanese',
-            r'(?i)requires\s+japanese\s+language',
-            r'(?i)japanese\s+language\s+is\s+(mandatory|required|a must)',
-            r'(?i)strong\s+japanese\s+language\s+skills',
-            r'(?i)strong\s+command\s+of\s+japanese',
-            r'(?i)command\s+of\s+japanese',
-            r'(?i)excellent\s+japanese',
-            r'(?i)proficient\s+japanese',
-            r'(?i)japanese\s+proficient',
-            r'(?i)competent\s+in\s+japanese',
-            r'(?i)japanese\s+competency'
-        ]
-        
-        # Détection des niveaux JLPT
-        jlpt_patterns = {
-            'N1': r'(?i)jlpt\s*n1|日本語検定1級|native\s+level\s+japanese',
-            'N2': r'(?i)jlpt\s*n2|日本語検定2級|business\s+level\s+japanese',
-            'N3': r'(?i)jlpt\s*n3|日本語検定3級|intermediate\s+japanese',
-            'N4': r'(?i)jlpt\s*n4|日本語検定4級|basic\s+japanese',
-            'N5': r'(?i)jlpt\s*n5|日本語検定5級|elementary\s+japanese'
-        }
-        
-        # Vérifier les expressions positives
-        positives_found = []
-        for pattern in positive_patterns:
-            matches = re.finditer(pattern, description)
-            for match in matches:
-                positives_found.append(match.group(0))
-                score += 10  # Réduit de 15 à 10 points, mais plus de patterns
-        
-        # Loguer les expressions positives trouvées
-        if positives_found:
-            logger.info(f"Expressions positives trouvées ({len(positives_found)}): {', '.join(positives_found[:3])}")
-        
-        # Vérifier les expressions négatives
-        negatives_found = []
-        for pattern in negative_patterns:
-            matches = re.finditer(pattern, description)
-            for match in matches:
-                negatives_found.append(match.group(0))
-                score -= 10  # Réduit de 15 à 10 points négatifs
-        
-        # Loguer les expressions négatives trouvées
-        if negatives_found:
-            logger.info(f"Expressions négatives trouvées ({len(negatives_found)}): {', '.join(negatives_found[:3])}")
-        
-        # Vérifier les niveaux JLPT
-        for level, pattern in jlpt_patterns.items():
-            if re.search(pattern, description):
-                if level in ['N1', 'N2']:
-                    score -= 10
-                    logger.info(f"Exigence JLPT élevée: {level}")
-                elif level == 'N3':
-                    score -= 5
-                    logger.info(f"Exigence JLPT intermédiaire: {level}")
-                else:  # N4 ou N5
-                    score += 5
-                    logger.info(f"Exigence JLPT basique: {level}")
-        
-        # Analyse contextuelle avancée pour détecter les situations ambiguës
-        # Par exemple, "Japanese language skills a plus" est positif malgré la mention de japonais
-        context_patterns = {
-            'positif': [
-                r'(?i)japanese\s+language\s+is\s+a\s+plus',
-                r'(?i)japanese\s+would\s+be\s+(a\s+plus|helpful|beneficial)',
-                r'(?i)japanese\s+is\s+not\s+mandatory',
-                r'(?i)japanese\s+skills\s+are\s+optional',
-                r'(?i)basic\s+japanese\s+is\s+sufficient',
-                r'(?i)willing\s+to\s+learn\s+japanese'
-            ],
-            'négatif': [
-                r'(?i)daily\s+communication\s+in\s+japanese',
-                r'(?i)work\s+environment\s+is\s+(primarily|mainly)\s+japanese',
-                r'(?i)must\s+communicate\s+with\s+japanese\s+clients',
-                r'(?i)japanese\s+team\s+members',
-                r'(?i)japanese\s+documentation',
-                r'(?i)native\s+level\s+of\s+japanese',
-                r'(?i)bilingual\s+.*japanese\s+and\s+english',
-                r'(?i)fluent\s+in\s+both\s+japanese\s+and\s+english',
-                r'(?i)fluent\s+in\s+both\s+english\s+and\s+japanese'
-            ]
-        }
-        
-        # Vérifier les patterns contextuels positifs
-        for pattern in context_patterns['positif']:
-            if re.search(pattern, description):
-                score += 5
-                logger.info(f"Contexte positif trouvé: {pattern}")
-        
-        # Vérifier les patterns contextuels négatifs
-        for pattern in context_patterns['négatif']:
-            if re.search(pattern, description):
-                score -= 5
-                logger.info(f"Contexte négatif trouvé: {pattern}")
-        
-        # Bonus: si plusieurs indicateurs positifs sans négatifs
-        if len(positives_found) >= 3 and len(negatives_found) == 0:
-            score += 10
-            logger.info("Bonus: Multiples indicateurs positifs sans négatifs")
-        
-        return score
-
-    def analyze_international_environment(self, description):
-        """
-        Analyse si l'environnement de travail est international
-        """
-        score = 0
-        
-        international_indicators = [
-            # Environnement de travail
-            r'(?i)international\s+(team|office|environment|company|organization|culture|workplace|firm)',
-            r'(?i)diverse\s+(team|workplace|culture|environment|workforce)',
-            r'(?i)multicultural\s+(environment|team|company|workplace|setting)',
-            r'(?i)english\s+as\s+(the|a)\s+working\s+language',
-            r'(?i)global\s+(company|team|organization|culture|firm|player|business)',
-            r'(?i)foreign\s+(employees|workers|staff|colleagues)',
-            r'(?i)(team|staff|colleagues|employees)\s+from\s+(all\s+over|many|various|different)\s+(the\s+world|countries|backgrounds)',
-            
-            # Structure organisationnelle
-            r'(?i)expatriates',
-            r'(?i)multinational\s+(corporation|company|organization|environment)',
-            r'(?i)offices\s+in\s+\d+\s+countries',
-            r'(?i)presence\s+in\s+\d+\s+countries',
-            r'(?i)global\s+presence',
-            r'(?i)worldwide\s+operations',
-            
-            # Clients et projets
-            r'(?i)international\s+(clients|projects|assignments|business)',
-            r'(?i)global\s+(clients|projects|market|customers)',
-            r'(?i)cross\s*-\s*border',
-            r'(?i)(work|collaborate)\s+with\s+(international|global|worldwide)\s+(teams|colleagues|clients)',
-            
-            # Culture d'entreprise
-            r'(?i)inclusive\s+(environment|workplace|culture)',
-            r'(?i)diversity\s+and\s+inclusion',
-            r'(?i)equal\s+opportunity\s+employer',
-            r'(?i)cross\s*-\s*cultural',
-            
-            # Pratiques commerciales
-            r'(?i)global\s+(mindset|outlook|perspective)',
-            r'(?i)international\s+(travel|exposure|experience)',
-            r'(?i)global\s+mobility',
-            r'(?i)relocation\s+opportunities'
-        ]
-        
-        # Compteur de patterns trouvés
-        patterns_found = []
-        
-        for indicator in international_indicators:
-            matches = re.finditer(indicator, description)
-            for match in matches:
-                patterns_found.append(match.group(0))
-                score += 5
-        
-        # Loguer les patterns trouvés
-        if patterns_found:
-            logger.info(f"Indicateurs d'environnement international trouvés ({len(patterns_found)}): {', '.join(patterns_found[:5])}")
-        
-        # Analyse contextuelle supplémentaire
-        global_keywords = ['global', 'international', 'worldwide', 'multinational']
-        keyword_count = sum(1 for keyword in global_keywords if keyword.lower() in description.lower())
-        
-        # Bonus si multiples mentions de mots-clés globaux
-        if keyword_count >= 3:
-            score += 5
-            logger.info(f"Bonus: {keyword_count} mots-clés globaux trouvés")
-        
-        # Limiter le score maximum pour cette catégorie
-        return min(score, 20)  # Augmenté de 15 à 20 pour être plus généreux
-
-    def analyze_expat_benefits(self, description):
-        """
-        Analyse les avantages spécifiques pour les expatriés
-        """
-        score = 0
-        
-        expat_benefits = [
-            # Visa et immigration
-            r'(?i)visa\s+(sponsorship|support|assistance)',
-            r'(?i)sponsor\s+(working\s+visa|work\s+visa|visa)',
-            r'(?i)work\s+permit\s+(support|assistance)',
-            r'(?i)immigration\s+(support|assistance)',
-            
-            # Relocation et logement
-            r'(?i)relocation\s+(package|assistance|support|help|allowance)',
-            r'(?i)housing\s+(allowance|assistance|support|subsidy|benefit)',
-            r'(?i)(help|assist)\s+with\s+(finding|securing)\s+accommodation',
-            r'(?i)temporary\s+housing',
-            r'(?i)accommodation\s+(support|assistance|allowance)',
-            
-            # Transport et voyage
-            r'(?i)flight\s+(tickets|reimbursement|allowance)',
-            r'(?i)air\s+fare',
-            r'(?i)travel\s+(allowance|expense|reimbursement)',
-            r'(?i)home\s+travel\s+allowance',
-            r'(?i)transportation\s+(allowance|benefit)',
-            r'(?i)commuting\s+allowance',
-            
-            # Installation et adaptation
-            r'(?i)settling(-|\s+)in\s+allowance',
-            r'(?i)home\s+leave',
-            r'(?i)language\s+lessons',
-            r'(?i)japanese\s+lessons',
-            r'(?i)cultural\s+training',
-            r'(?i)cross-cultural\s+training',
-            r'(?i)orientation\s+program',
-            
-            # Santé et assurance
-            r'(?i)international\s+health\s+insurance',
-            r'(?i)global\s+health\s+coverage',
-            r'(?i)medical\s+insurance\s+for\s+expatriates',
-            r'(?i)private\s+health\s+insurance',
-            
-            # Avantages financiers
-            r'(?i)expatriate\s+package',
-            r'(?i)expat\s+benefits',
-            r'(?i)moving\s+expenses',
-            r'(?i)cost\s+of\s+living\s+adjustment',
-            r'(?i)expatriate\s+premium',
-            r'(?i)hardship\s+allowance',
-            r'(?i)tax\s+(assistance|consultation)',
-            
-            # Support familial
-            r'(?i)family\s+relocation',
-            r'(?i)dependent\s+visa\s+support',
-            r'(?i)spouse\s+(support|assistance|program)',
-            r'(?i)education\s+allowance\s+for\s+children',
-            r'(?i)international\s+school\s+fees'
-        ]
-        
-        # Compteur des patterns trouvés
-        benefits_found = []
-        
-        for benefit in expat_benefits:
-            matches = re.finditer(benefit, description)
-            for match in matches:
-                benefits_found.append(match.group(0))
-                score += 5
-        
-        # Loguer les avantages trouvés
-        if benefits_found:
-            logger.info(f"Avantages pour expatriés trouvés ({len(benefits_found)}): {', '.join(benefits_found[:5])}")
-        
-        # Analyse contextuelle supplémentaire
-        # Si "package" ou "benefits" est mentionné à proximité de mots comme "expat", "international", "relocation"
-        context_patterns = [
-            r'(?i)(comprehensive|attractive|competitive)\s+(package|benefits|perks|compensation)',
-            r'(?i)(package|benefits|perks)\s+include',
-            r'(?i)(full|complete)\s+support\s+for\s+(foreigners|expatriates|international\s+candidates)'
-        ]
-        
-        for pattern in context_patterns:
-            if re.search(pattern, description):
-                score += 5
-                logger.info(f"Contexte d'avantages trouvé: {pattern}")
-        
-        # Limiter le score maximum pour cette catégorie
-        return min(score, 20)  # Augmenté de 15 à 20
-
-    def analyze_leave_policy(self, description):
-        """
-        Analyse la politique de congés pour identifier les entreprises offrant des conditions
-        plus généreuses que le standard japonais (10 jours après 6 mois)
-        Retourne (score, jours_de_congés)
-        """
-        score = 0
-        days_of_leave = None
-        
-        # Recherche de mentions de jours de congés généreux
-        generous_leave_patterns = [
-            # Nombre de jours de congés supérieur à la norme japonaise
-            r'(?i)(\d{2,})\s+(days|business days)\s+(of|for)\s+(annual|paid)\s+leave',
-            r'(?i)(annual|paid)\s+leave\s+(\d{2,})\s+(days|business days)',
-            r'(?i)(\d{2,})\s+(days|business days)\s+(vacation|holiday|time off|leave|pto)',
-            r'(?i)(vacation|holiday|time off|leave|pto)\s+(\d{2,})\s+(days|business days)',
-            r'(?i)(up\s+to|min|minimum|maximum|max|more\s+than)\s+(\d{2,})\s+(days|business days)',
-            
-            # Mentions spécifiques de politiques généreuses
-            r'(?i)generous\s+(vacation|leave|time off|holiday|pto)',
-            r'(?i)flexible\s+(vacation|leave|time off|holiday|pto)',
-            r'(?i)unlimited\s+(vacation|leave|time off|holiday|pto)',
-            r'(?i)work(-|\s+)life\s+balance',
-            r'(?i)above\s+statutory\s+(leave|vacation|holidays)',
-            r'(?i)competitive\s+(leave|vacation|holiday)\s+policy',
-            
-            # Types de congés spécifiques
-            r'(?i)sabbatical\s+leave',
-            r'(?i)parental\s+leave',
-            r'(?i)paternity\s+leave',
-            r'(?i)maternity\s+leave',
-            r'(?i)sick\s+leave',
-            r'(?i)personal\s+days',
-            r'(?i)mental\s+health\s+days',
-            r'(?i)volunteer\s+days',
-            r'(?i)bereavement\s+leave',
-            r'(?i)summer\s+holidays',
-            r'(?i)winter\s+holidays',
-            r'(?i)golden\s+week',
-            r'(?i)summer\s+break',
-            r'(?i)winter\s+break',
-            
-            # Flexibilité horaire
-            r'(?i)flexible\s+(working\s+hours|schedule|work\s+arrangements)',
-            r'(?i)flex\s+time',
-            r'(?i)remote\s+work',
-            r'(?i)work\s+from\s+home',
-            r'(?i)hybrid\s+work',
-            r'(?i)flextime',
-            r'(?i)4-day\s+work\s+week',
-            r'(?i)compressed\s+work\s+week',
-            
-            # Jours fériés
-            r'(?i)(all|global|international|local)\s+public\s+holidays',
-            r'(?i)public\s+holidays\s+plus',
-            r'(?i)national\s+holidays\s+plus'
-        ]
-        
-        # Recherche des patterns et calcul du score
-        leave_patterns_found = []
-        
-        for pattern in generous_leave_patterns:
-            matches = re.finditer(pattern, description)
-            for match in matches:
-                leave_patterns_found.append(match.group(0))
-                score += 5
-        
-        # Loguer les patterns trouvés
-        if leave_patterns_found:
-            logger.info(f"Politiques de congés favorables trouvées ({len(leave_patterns_found)}): {', '.join(leave_patterns_found[:5])}")
-        
-        # Essayer d'extraire le nombre de jours de congés
-        # Recherche de patterns comme "20 days", "20 vacation days", etc.
-        days_patterns = [
-            r'(?i)(\d{2,})\s+days\s+(?:of\s+)?(?:annual|paid)?\s*(?:leave|vacation|holiday|time\s+off|pto)',
-            r'(?i)(?:annual|paid)?\s*(?:leave|vacation|holiday|time\s+off|pto)\s+(?:of\s+)?(\d{2,})\s+days',
-            r'(?i)(?:up\s+to|min|minimum|maximum|max|more\s+than)\s+(\d{2,})\s+days'
-        ]
-        
-        for pattern in days_patterns:
-            days_match = re.search(pattern, description)
-            if days_match:
-                try:
-                    days = int(days_match.group(1))
-                    logger.info(f"Nombre de jours de congés mentionné: {days}")
-                    days_of_leave = days
-                    
-                    # Bonus pour les congés vraiment généreux
-                    if days >= 25:
-                        score += 10
-                        logger.info(f"Bonus élevé pour {days} jours de congés")
-                    elif days >= 20:
-                        score += 7
-                        logger.info(f"Bonus important pour {days} jours de congés")
-                    elif days >= 15:
-                        score += 5
-                        logger.info(f"Bonus pour {days} jours de congés")
-                    elif days > 10:
-                        score += 3
-                        logger.info(f"Petit bonus pour {days} jours de congés")
-                except:
-                    pass
-        
-        # Bonus pour des combinaisons de mots-clés liés aux congés
-        leave_keywords = ['flexible', 'generous', 'work-life balance', 'unlimited', 'paid time off']
-        leave_keyword_count = sum(1 for keyword in leave_keywords if keyword.lower() in description.lower())
-        
-        if leave_keyword_count >= 2:
-            score += 5
-            logger.info(f"Bonus: {leave_keyword_count} mots-clés de congés trouvés")
-        
-        # Limiter le score maximum pour cette catégorie
-        return min(score, 20), days_of_leave  # Augmenté de 15 à 20
-
-    def analyze_language(self, description):
-        """
-        Analyse la langue utilisée dans l'offre et détecte les mentions de français
-        qui peuvent indiquer une entreprise francophone
-        """
-        score = 0
-        
-        # Détection du français
-        french_patterns = [
-            r'(?i)french\s+(speaking|speaker)',
-            r'(?i)fluent\s+in\s+french',
-            r'(?i)french\s+(language|fluency)',
-            r'(?i)speak\s+french',
-            r'(?i)french\s+skills',
-            r'(?i)knowledge\s+of\s+french',
-            r'(?i)french\s+a\s+plus',
-            r'(?i)french\s+company',
-            r'(?i)french\s+firm',
-            r'(?i)francophone',
-            r'(?i)france\s+based',
-            r'(?i)headquartered\s+in\s+france',
-            # Expressions en français
-            r'(?i)parle\s+français',
-            r'(?i)français\s+courant',
-            r'(?i)maîtrise\s+du\s+français',
-            r'(?i)entreprise\s+française',
-            r'(?i)société\s+française'
-        ]
-        
-        french_matches = []
-        for pattern in french_patterns:
-            matches = re.finditer(pattern, description)
-            for match in matches:
-                french_matches.append(match.group(0))
-                score += 5
-        
-        if french_matches:
-            logger.info(f"Indices de français trouvés ({len(french_matches)}): {', '.join(french_matches)}")
-            score += 5  # Bonus supplémentaire pour du français
-        
-        # Analyse de la langue de rédaction
-        try:
-            from langdetect import detect
-            lang = detect(description[:1000])  # Limiter à 1000 caractères pour la détection
-            
-            if lang == 'en':
-                score += 10
-                logger.info("Offre rédigée en anglais")
-            elif lang == 'fr':
-                score += 10
-                logger.info("Offre rédigée en français")
-            elif lang == 'ja':
-                score -= 10
-                logger.info("Offre rédigée en japonais")
-        except:
-            logger.warning("Impossible de détecter la langue de l'offre")
-        
-        return min(score, 15)  # Maximum 15 points pour cette catégorie
-
-    def analyze_sentiment(self, description):
-        """
-        Analyse le sentiment général de l'offre vis-à-vis des étrangers
-        """
-        score = 0
-        
-        # Phrases positives qui indiquent une ouverture aux étrangers
-        positive_phrases = [
-            r'(?i)we\s+welcome\s+(international|foreign|overseas|global)\s+(candidates|applicants|talents)',
-            r'(?i)(ideal|perfect)\s+for\s+(international|foreign|overseas|global)\s+candidates',
-            r'(?i)(great|excellent|good)\s+opportunity\s+for\s+(international|foreign|overseas|global)\s+candidates',
-            r'(?i)we\s+value\s+diversity',
-            r'(?i)we\s+are\s+an\s+equal\s+opportunity\s+employer',
-            r'(?i)we\s+embrace\s+cultural\s+diversity',
-            r'(?i)diverse\s+perspectives\s+are\s+valued',
-            r'(?i)we\s+celebrate\s+diversity',
-            r'(?i)(join|joining)\s+our\s+(international|global|diverse)\s+team',
-            r'(?i)background\s+is\s+not\s+important',
-            r'(?i)regardless\s+of\s+(nationality|background)',
-            r'(?i)we\s+are\s+committed\s+to\s+diversity',
-            r'(?i)we\s+are\s+building\s+a\s+diverse\s+team',
-            r'(?i)applicants\s+of\s+all\s+backgrounds',
-            r'(?i)applicants\s+from\s+all\s+countries',
-            r'(?i)no\s+prior\s+experience\s+in\s+japan\s+required'
-        ]
-        
-        # Phrases négatives qui peuvent indiquer des difficultés pour les étrangers
-        negative_phrases = [
-            r'(?i)must\s+understand\s+japanese\s+business\s+culture',
-            r'(?i)must\s+be\s+familiar\s+with\s+japanese\s+(business|work)\s+(culture|practices|customs)',
-            r'(?i)knowledge\s+of\s+japanese\s+market\s+required',
-            r'(?i)experience\s+in\s+japan\s+required',
-            r'(?i)must\s+be\s+able\s+to\s+adapt\s+to\s+japanese\s+work\s+environment',
-            r'(?i)candidates\s+must\s+already\s+be\s+in\s+japan',
-            r'(?i)no\s+visa\s+sponsorship',
-            r'(?i)no\s+relocation\s+support',
-            r'(?i)must\s+already\s+have\s+valid\s+work\s+permit',
-            r'(?i)must\s+be\s+eligible\s+to\s+work\s+in\s+japan'
-        ]
-        
-        # Comptage des phrases positives
-        positive_found = []
-        for phrase in positive_phrases:
-            matches = re.finditer(phrase, description)
-            for match in matches:
-                positive_found.append(match.group(0))
-                score += 5
-        
-        if positive_found:
-            logger.info(f"Expressions positives pour étrangers trouvées ({len(positive_found)}): {', '.join(positive_found[:3])}")
-        
-        # Comptage des phrases négatives
-        negative_found = []
-        for phrase in negative_phrases:
-            matches = re.finditer(phrase, description)
-            for match in matches:
-                negative_found.append(match.group(0))
-                score -= 5
-        
-        if negative_found:
-            logger.info(f"Expressions négatives pour étrangers trouvées ({len(negative_found)}): {', '.join(negative_found[:3])}")
-        
-        # Analyse simple des sentiments basée sur des mots-clés
-        positive_sentiment_words = [
-            'welcome', 'opportunity', 'diversity', 'inclusive', 'global', 'international',
-            'support', 'assist', 'help', 'flexible', 'open', 'multicultural', 'diverse'
-        ]
-        
-        negative_sentiment_words = [
-            'required', 'must', 'essential', 'mandatory', 'necessary', 'expected',
-            'no sponsorship', 'no support', 'no relocation', 'already in Japan'
-        ]
-        
-        # Compter les occurrences de mots positifs et négatifs
-        positive_word_count = sum(1 for word in positive_sentiment_words if re.search(r'(?i)\b' + word + r'\b', description))
-        negative_word_count = sum(1 for word in negative_sentiment_words if re.search(r'(?i)\b' + word + r'\b', description))
-        
-        # Bonus si beaucoup de mots positifs
-        if positive_word_count > negative_word_count + 5:
-            score += 5
-            logger.info(f"Sentiment général positif: {positive_word_count} mots positifs vs {negative_word_count} négatifs")
-        
-        # Malus si beaucoup de mots négatifs
-        if negative_word_count > positive_word_count:
-            score -= 5
-            logger.info(f"Sentiment général négatif: {negative_word_count} mots négatifs vs {positive_word_count} positifs")
-        
-        return min(score, 15)  # Maximum 15 points
+        return self.scorer.is_gaijin_friendly(description)
 
-    def detect_additional_benefits(self, description):
+    def scrape_jobs(self, max_pages=5, resume=None):
         """
-        Détecte d'autres avantages qui pourraient être intéressants pour les expatriés
-        Cette fonction est utilisée pour information uniquement et n'affecte pas le score
+        Scrape les offres d'emploi et les filtre.
+        resume est l'état d'un point de reprise (Checkpoint.load) à partir duquel continuer
         """
-        benefits = []
-        
-        benefit_patterns = {
-            'Flexibilité horaire': r'(?i)flexible\s+(working\s+hours|schedule)',
-            'Télétravail': r'(?i)(remote\s+work|work\s+from\s+home|hybrid\s+work)',
-            'Formation continue': r'(?i)(training|education)\s+(allowance|program|opportunities)',
-            'Assurance santé': r'(?i)health\s+insurance',
-            'Retraite/401k': r'(?i)(retirement|pension|401k)',
-            'Bonus': r'(?i)(bonus|incentive)',
-            'Stock options': r'(?i)(stock\s+options|equity)',
-            'Remboursement transport': r'(?i)(transportation|commuting)\s+(allowance|benefit)',
-            'Activités team building': r'(?i)(team\s+building|social\s+events)',
-            'Gym/Fitness': r'(?i)(gym|fitness|wellness)\s+(membership|allowance|program)',
-            'Primes bi-annuelles': r'(?i)(bi-annual|twice\s+a\s+year)\s+(bonus|payment)',
-            'Smartphone fourni': r'(?i)(company|provided)\s+(phone|smartphone|mobile)',
-            'Ordinateur portable fourni': r'(?i)(company|provided)\s+(laptop|computer)',
-            'Repas fournis': r'(?i)(free|provided|subsidized)\s+(meals|lunch|dinner|food)',
-            'Café/Snacks gratuits': r'(?i)(free|complimentary)\s+(coffee|drinks|snacks)',
-            'Allocation repas': r'(?i)(meal|lunch)\s+allowance',
-            'Prime de démarrage': r'(?i)(signing|welcome|starting)\s+bonus',
-            'Frais de déménagement': r'(?i)moving\s+expenses',
-            'Indemnité journalière': r'(?i)per\s+diem',
-            'Garde d\'enfants': r'(?i)(childcare|daycare)\s+(allowance|benefit|support)',
-            'Espace de co-working': r'(?i)(co-working|coworking)\s+space',
-            'Évènements sociaux': r'(?i)(social|company)\s+events',
-            'Jours supplémentaires de congés': r'(?i)extra\s+(vacation|leave|holiday)\s+days',
-            'Journées bien-être': r'(?i)wellness\s+days',
-            'Remboursement formation': r'(?i)(education|tuition)\s+reimbursement',
-            'Cours de japonais': r'(?i)japanese\s+(lessons|classes|training)'
-        }
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
         
-        for benefit_name, pattern in benefit_patterns.items():
-            if re.search(pattern, description):
-                benefits.append(benefit_name)
-                logger.info(f"Avantage supplémentaire détecté: {benefit_name}")
-        
-        return benefits
-
-    def scrape_jobs(self, max_pages=5):
-        """Scrape les offres d'emploi et les filtre"""
         logger.info(f"Début du scraping sur {max_pages} pages maximum")
-        jobs = []
-        
-        for page in range(max_pages):
+        state = resume or {}
+        jobs = list(state.get('jobs', []))
+        # Offres déjà traitées (reprise), à ne pas rouvrir
+        processed = set(state.get('processed_ids', []))
+        start_page = state.get('page', 0)
+        # Description de l'offre précédente, pour détecter la mise à jour du panneau
+        previous_description = None
+        
+        if start_page:
+            logger.info(f"Reprise à la page {start_page + 1} ({self.counts['total']} offres déjà collectées)")
+            self.open_search_page(start_page)
+        
+        for page in range(start_page, max_pages):
             logger.info(f"Analyse de la page {page + 1}")
             
             # Faire défiler la page pour charger toutes les offres
-            logger.info("Défilement de la page pour charger toutes les offres...")
-            
-            # Défiler progressivement pour s'assurer que toutes les offres sont chargées
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            for _ in range(5):  # Faire plusieurs défilements
-                # Défiler vers le bas
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)  # Attendre le chargement des éléments
-                
-                # Calculer la nouvelle hauteur
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break  # Si la hauteur n'a pas changé, on a atteint le bas de la page
-                last_height = new_height
-            
-            logger.info("Défilement terminé, toutes les offres devraient être chargées")
+            self.scroll_job_list()
             
             # Recherche de tous les liens de titres d'offres après défilement
             logger.info("Recherche des liens de titres d'offres...")
             
-            # Attendre que la page soit complètement chargée
-            time.sleep(3)
+            # Attendre que la liste des offres soit présente
+            with timing.phase('scrape.job_list'):
+                self.waits.until(waits.job_cards_present, 'job_list', nominal=3)
+            self.record_page(self.paginator.url(page))
             
             try:
                 # Sélecteur spécifique pour les liens de titres d'offres
@@ -994,11 +378,12 @@ class LinkedInScraper:
                         "h3 a"
                     ]
                     
-                    for selector in alternative_selectors:
-                        job_links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        logger.info(f"Sélecteur {selector}: {len(job_links)} liens trouvés")
-                        if len(job_links) > 0:
-                            break
+                    with timing.phase('scrape.selector_fallback'):
+                        for selector in alternative_selectors:
+                            job_links = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                            logger.info(f"Sélecteur {selector}: {len(job_links)} liens trouvés")
+                            if len(job_links) > 0:
+                                break
                 
                 # Si on a toujours pas trouvé de liens
                 if len(job_links) == 0:
@@ -1009,14 +394,10 @@ class LinkedInScraper:
                     # Si nous sommes redirigés vers le feed ou une autre page
                     if "/jobs/search" not in current_url:
                         logger.warning("Nous ne sommes plus sur la page de recherche d'emplois!")
+                        self.limiter.throttled(f"redirection vers {current_url}")
                         # Revenir à la page de recherche
                         logger.info("Tentative de retour à la page de recherche...")
-                        base_url = "https://www.linkedin.com/jobs/search"
-                        search_query = "Technical+Consultant+OR+Software+Consultant+OR+Professional+Services"
-                        geo_id = "101355337"  # ID pour Tokyo, Japan
-                        search_url = f"{base_url}?keywords={search_query}&distance=25&geoId={geo_id}"
-                        self.driver.get(search_url)
-                        time.sleep(10)
+                        self.open_search_page(page)
                         # Essayer à nouveau
                         job_links = self.driver.find_elements(By.CSS_SELECTOR, "a.job-card-list__title--link, .job-card-container__link")
                         logger.info(f"Après redirection: {len(job_links)} liens trouvés")
@@ -1041,172 +422,55 @@ class LinkedInScraper:
                     try:
                         logger.info(f"Analyse de l'offre {i+1}/{final_job_count}")
                         
+                        # Identifiant de l'offre cliquée, pour reconnaître son panneau de détails
+                        clicked_job_id = job_extractor.job_id_from_url(link.get_attribute("href"))
+                        card_title = " ".join((link.get_attribute("textContent") or "").split())
+                        
+                        # Offre déjà traitée avant l'interruption de l'exécution reprise
+                        if clicked_job_id and clicked_job_id in processed:
+                            continue
+                        
+                        # Offre déjà analysée lors d'une exécution précédente: pas de clic
+                        if self.store is not None and self.store.is_unchanged(clicked_job_id, card_title):
+                            logger.info(f"Offre {clicked_job_id} déjà analysée, résultat enregistré réutilisé")
+                            self.emit(jobs, self.store.touch(clicked_job_id))
+                            self.mark_processed(clicked_job_id, processed, page, jobs)
+                            continue
+                        
                         # Faire défiler pour rendre le lien visible
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-                        time.sleep(1)
+                        self.waits.until(EC.element_to_be_clickable(link), 'job_list', nominal=1)
                         
                         # Cliquer sur le lien pour afficher les détails sur le côté droit
                         logger.info("Clic sur l'offre pour afficher les détails")
-                        link.click()
+                        self.click(link)
                         
-                        # Attendre que le panneau de détails se charge
+                        # Attendre que le panneau de détails affiche la nouvelle offre
                         logger.info("Attente du chargement du panneau de détails...")
-                        try:
-                            WebDriverWait(self.driver, 10).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, "div.job-view-layout.jobs-details"))
-                            )
-                            logger.info("Panneau de détails chargé")
-                        except TimeoutException:
-                            logger.warning("Timeout en attendant le panneau de détails")
-                            continue
-                        
-                        # Faire une pause pour s'assurer que tout est chargé
-                        time.sleep(3)
+                        with timing.phase('scrape.panel_wait'):
+                            panel_loaded = self.waits.until(waits.job_detail_loaded(clicked_job_id, previous_description),
+                                                            'job_panel', nominal=3)
+                        if not panel_loaded:
+                            # Le panneau peut afficher une offre à la description identique
+                            if not self.driver.find_elements(By.CSS_SELECTOR, waits.JOB_PANEL_SELECTOR):
+                                logger.warning("Timeout en attendant le panneau de détails")
+                                continue
+                        logger.info("Panneau de détails chargé")
                         
-                        # Extraire les informations depuis le panneau de détails
+                        # Extraire les informations depuis le panneau de détails (un seul appel au navigateur)
                         try:
-                            # Titre de l'offre
-                            title_selectors = [
-                                "h2.jobs-unified-top-card__job-title", 
-                                "h1.job-title", 
-                                "h1[class*='job']", 
-                                ".jobs-unified-top-card h1",
-                                ".job-details-jobs-unified-top-card__job-title"
-                            ]
-                            title = "Titre inconnu"
-                            for selector in title_selectors:
-                                try:
-                                    title_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                    title = title_elem.text.strip()
-                                    if title:
-                                        break
-                                except:
-                                    continue
-                            
-                            # Entreprise
-                            company_selectors = [
-                                "a.jobs-unified-top-card__company-name",
-                                "span.jobs-unified-top-card__company-name",
-                                ".jobs-unified-top-card__subtitle a",
-                                ".jobs-unified-top-card__subtitle span",
-                                "[class*='company-name']"
-                            ]
-                            company = "Entreprise inconnue"
-                            for selector in company_selectors:
-                                try:
-                                    company_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                    company = company_elem.text.strip()
-                                    if company:
-                                        break
-                                except:
-                                    continue
-                            
-                            # Localisation - Amélioration pour capturer la localisation
-                            location_selectors = [
-                                "span.jobs-unified-top-card__bullet",
-                                "span.jobs-unified-top-card__workplace-type",
-                                ".jobs-unified-top-card__metadata-container span",
-                                ".t-black--light.job-details-jobs-unified-top-card__tertiary-description-container span.tvm__text:first-child",
-                                "[class*='location']"
-                            ]
-                            location = "Localisation inconnue"
-                            for selector in location_selectors:
-                                try:
-                                    location_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                    location_text = location_elem.text.strip()
-                                    if location_text and not location_text.startswith("il y a") and not location_text.startswith("·"):
-                                        location = location_text
-                                        break
-                                except:
-                                    continue
-                            
-                            # Description - Faire défiler jusqu'à la description pour s'assurer qu'elle est chargée
-                            try:
-                                description_container = self.driver.find_element(By.CSS_SELECTOR, "div.jobs-description__content")
-                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", description_container)
-                                time.sleep(1)  # Attendre que le contenu se charge après le défilement
-                            except:
-                                logger.warning("Impossible de faire défiler jusqu'à la description")
-                            
-                            # Maintenant essayer d'extraire la description
-                            description_selectors = [
-                                "div.jobs-description__content",
-                                "div.jobs-description-content",
-                                ".jobs-description",
-                                "[class*='description-content']",
-                                "#job-details"
-                            ]
-                            description = "Description non disponible"
-                            for selector in description_selectors:
-                                try:
-                                    description_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                    description = description_elem.text.strip()
-                                    if description:
-                                        break
-                                except:
-                                    continue
+                            details = self.extractor.extract()
+                            if details['job_id'] or clicked_job_id:
+                                self.record_page(job_extractor.job_view_url(details['job_id'] or clicked_job_id))
+                            title = details['title']
+                            company = details['company']
+                            location = details['location']
+                            description = details['description']
+                            job_url = details['url']
                             
                             logger.info(f"Informations extraites: {title} | {company} | {location}")
                             logger.info(f"Longueur de la description: {len(description)} caractères")
                             
-                            # Obtenir l'URL de l'offre - Amélioration
-                            job_url = ""
-                            try:
-                                # Extraire l'ID de l'offre actuelle depuis l'URL avec currentJobId
-                                current_url = self.driver.current_url
-                                logger.info(f"URL actuelle: {current_url}")
-                                
-                                if "currentJobId=" in current_url:
-                                    try:
-                                        # Extraire l'ID de l'offre actuelle
-                                        job_id = re.search(r'currentJobId=(\d+)', current_url).group(1)
-                                        # Construire une URL propre
-                                        job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-                                        logger.info(f"URL extraite depuis currentJobId: {job_url}")
-                                    except Exception as e:
-                                        logger.error(f"Erreur lors de l'extraction du currentJobId: {str(e)}")
-                                
-                                # Si pas de currentJobId, essayer d'autres méthodes
-                                if not job_url:
-                                    # Méthodes alternatives avec les sélecteurs
-                                    url_selectors = [
-                                        "a.job-details-jobs-unified-top-card__job-title-link",
-                                        ".jobs-unified-top-card__content a[href*='/jobs/view/']",
-                                        "a[data-tracking-control-name='public_jobs_topcard-title-link']"
-                                    ]
-                                    
-                                    for selector in url_selectors:
-                                        try:
-                                            url_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                                            potential_url = url_elem.get_attribute("href")
-                                            if potential_url and "/jobs/view/" in potential_url:
-                                                job_url = potential_url
-                                                logger.info(f"URL extraite avec sélecteur {selector}: {job_url}")
-                                                break
-                                        except:
-                                            continue
-                                    
-                                    # Si on est directement sur une page d'offre
-                                    if not job_url and "/jobs/view/" in current_url:
-                                        job_url = current_url
-                                        logger.info(f"URL extraite de l'URL actuelle: {job_url}")
-                                
-                            except Exception as e:
-                                logger.error(f"Erreur lors de l'extraction de l'URL: {str(e)}")
-                            
-                            # Si l'URL est toujours vide, utiliser des méthodes de secours
-                            if not job_url:
-                                try:
-                                    # Chercher des éléments avec data-job-id
-                                    job_id_elements = self.driver.find_elements(By.CSS_SELECTOR, "[data-job-id]")
-                                    if job_id_elements:
-                                        job_id = job_id_elements[0].get_attribute("data-job-id")
-                                        if job_id:
-                                            job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-                                            logger.info(f"URL construite à partir de l'ID: {job_url}")
-                                except Exception as e:
-                                    logger.error(f"Erreur lors de l'extraction de l'ID de l'offre: {str(e)}")
-                            
                             if job_url:
                                 logger.info(f"URL finale de l'offre: {job_url}")
                             else:
@@ -1217,156 +481,343 @@ class LinkedInScraper:
                             
                             # On ajoute l'offre au CSV, qu'elle soit gaijin-friendly ou non
                             logger.info(f"{'✓ Offre adaptée aux étrangers' if is_gaijin_friendly else '✗ Offre non adaptée aux étrangers'}")
-                            job_data = {
-                                'title': title,
-                                'company': company,
-                                'location': location,
-                                'url': job_url,
-                                'is_gaijin_friendly': 'Oui' if is_gaijin_friendly else 'Non',
-                                'score_total': gaijin_details['score_total'],
-                                'score_japonais': gaijin_details['score_japonais'],
-                                'score_international': gaijin_details['score_international'],
-                                'score_avantages': gaijin_details['score_avantages'],
-                                'score_conges': gaijin_details['score_conges'],
-                                'score_langue': gaijin_details['score_langue'],
-                                'score_sentiment': gaijin_details['score_sentiment'],
-                                'jours_conges': gaijin_details['jours_conges'] if gaijin_details['jours_conges'] else 'Non spécifié',
-                                'avantages': gaijin_details['avantages']
-                            }
-                            jobs.append(job_data)
+                            job_data = rule_engine.build_job_record(
+                                title, company, location, job_url, is_gaijin_friendly, gaijin_details
+                            )
+                            self.emit(jobs, job_data)
+                            previous_description = description
+                            
+                            job_id = details['job_id'] or clicked_job_id
+                            if self.store is not None:
+                                # Sans identifiant, l'offre est enregistrée sous une clé de repli pour être exportée
+                                self.store.upsert(job_id or job_store.fallback_job_id(job_data), job_data,
+                                                  description, card_title)
+                            self.mark_processed(clicked_job_id or job_id, processed, page, jobs)
                             
                         except Exception as e:
+                            if driver_setup.is_driver_fatal(e):
+                                raise
                             logger.error(f"Erreur lors de l'extraction des informations: {str(e)}")
                         
-                        # Faire une courte pause entre chaque offre
-                        time.sleep(2)
-                        
                     except Exception as e:
+                        if driver_setup.is_driver_fatal(e):
+                            raise
                         logger.error(f"Erreur lors de l'analyse de l'offre {i+1}: {str(e)}")
                 
             except Exception as e:
+                if driver_setup.is_driver_fatal(e):
+                    # Navigateur perdu: la page sera reprise avec --resume, sans les offres déjà traitées
+                    logger.error(f"Navigateur perdu pendant la page {page + 1}: {str(e)}")
+                    if self.checkpoint:
+                        self.checkpoint.save(self.checkpoint_state(page, processed, jobs))
+                    raise
                 logger.error(f"Erreur globale lors du scraping: {str(e)}")
             
-            # Passer à la page suivante en utilisant les boutons de pagination numérotés
-            if page < max_pages - 1:  # Si ce n'est pas la dernière page
-                logger.info(f"Tentative de passage à la page {page + 2}")
-                
-                # Défiler vers le bas pour s'assurer que la pagination est visible
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                
-                # Vérifier que la pagination existe
-                try:
-                    pagination = self.driver.find_element(By.CSS_SELECTOR, "ul.artdeco-pagination__pages")
-                    logger.info("Barre de pagination trouvée")
-                    
-                    # Chercher le bouton pour la page suivante (page + 2 car on est à la page page + 1)
-                    next_page_button = None
-                    
-                    # Approche 1: chercher par data-test-pagination-page-btn
-                    try:
-                        next_page_button = self.driver.find_element(By.CSS_SELECTOR, f"li[data-test-pagination-page-btn='{page + 2}'] button")
-                        logger.info(f"Bouton pour la page {page + 2} trouvé par data-test-pagination-page-btn")
-                    except:
-                        logger.info("Bouton non trouvé par data-test-pagination-page-btn, essai d'autres approches")
-                    
-                    # Approche 2: chercher par aria-label
-                    if not next_page_button:
-                        try:
-                            next_page_button = self.driver.find_element(By.CSS_SELECTOR, f"button[aria-label='Page {page + 2}']")
-                            logger.info(f"Bouton pour la page {page + 2} trouvé par aria-label")
-                        except:
-                            logger.info("Bouton non trouvé par aria-label, essai d'autres approches")
-                    
-                    # Approche 3: chercher par le texte dans le span
-                    if not next_page_button:
-                        page_buttons = self.driver.find_elements(By.CSS_SELECTOR, "li.artdeco-pagination__indicator--number button")
-                        for btn in page_buttons:
-                            try:
-                                span_text = btn.find_element(By.TAG_NAME, "span").text
-                                if span_text == str(page + 2):
-                                    next_page_button = btn
-                                    logger.info(f"Bouton pour la page {page + 2} trouvé par texte")
-                                    break
-                            except:
-                                continue
-                    
-                    if next_page_button:
-                        # Faire défiler pour voir le bouton
-                        self.driver.execute_script("arguments[0].scrollIntoView(true);", next_page_button)
-                        time.sleep(1)
-                        
-                        # Essayer de cliquer sur le bouton
-                        try:
-                            next_page_button.click()
-                            logger.info(f"Clic sur le bouton de la page {page + 2}")
-                            time.sleep(5)  # Attendre que la page se charge
-                        except Exception as e:
-                            logger.error(f"Erreur lors du clic sur le bouton de pagination: {str(e)}")
-                            
-                            # Essayer avec JavaScript si le clic normal échoue
-                            try:
-                                self.driver.execute_script("arguments[0].click();", next_page_button)
-                                logger.info(f"Clic avec JavaScript sur le bouton de la page {page + 2}")
-                                time.sleep(5)  # Attendre que la page se charge
-                            except Exception as e:
-                                logger.error(f"Échec du clic avec JavaScript: {str(e)}")
-                                
-                                # Dernière tentative: construire l'URL directement
-                                try:
-                                    base_url = "https://www.linkedin.com/jobs/search"
-                                    search_query = "Technical+Consultant+OR+Software+Consultant+OR+Professional+Services"
-                                    geo_id = "101355337"  # ID pour Tokyo, Japan
-                                    page_start = page * 25 + 25  # 25 offres par page
-                                    next_url = f"{base_url}?keywords={search_query}&distance=25&geoId={geo_id}&start={page_start}"
-                                    
-                                    logger.info(f"Navigation directe vers la page {page + 2}: {next_url}")
-                                    self.driver.get(next_url)
-                                    time.sleep(5)
-                                except Exception as e:
-                                    logger.error(f"Échec de la navigation directe: {str(e)}")
-                                    break
-                    else:
-                        logger.error(f"Bouton pour la page {page + 2} non trouvé")
-                        
-                        # Utiliser la navigation directe par URL si le bouton n'est pas trouvé
-                        try:
-                            base_url = "https://www.linkedin.com/jobs/search"
-                            search_query = "Technical+Consultant+OR+Software+Consultant+OR+Professional+Services"
-                            geo_id = "101355337"  # ID pour Tokyo, Japan
-                            page_start = page * 25 + 25  # 25 offres par page
-                            next_url = f"{base_url}?keywords={search_query}&distance=25&geoId={geo_id}&start={page_start}"
-                            
-                            logger.info(f"Navigation directe vers la page {page + 2}: {next_url}")
-                            self.driver.get(next_url)
-                            time.sleep(5)
-                        except Exception as e:
-                            logger.error(f"Échec de la navigation directe: {str(e)}")
-                            break
-                            
-                except Exception as e:
-                    logger.error(f"Erreur lors de la recherche de la pagination: {str(e)}")
-                    
-                    # Utiliser la navigation directe par URL si la pagination n'est pas trouvée
-                    try:
-                        base_url = "https://www.linkedin.com/jobs/search"
-                        search_query = "Technical+Consultant+OR+Software+Consultant+OR+Professional+Services"
-                        geo_id = "101355337"  # ID pour Tokyo, Japan
-                        page_start = page * 25 + 25  # 25 offres par page
-                        next_url = f"{base_url}?keywords={search_query}&distance=25&geoId={geo_id}&start={page_start}"
-                        
-                        logger.info(f"Navigation directe vers la page {page + 2}: {next_url}")
-                        self.driver.get(next_url)
-                        time.sleep(5)
-                    except Exception as e:
-                        logger.error(f"Échec de la navigation directe: {str(e)}")
-                        break
+            # Point de reprise: la page est terminée
+            if self.checkpoint:
+                self.checkpoint.save(self.checkpoint_state(page + 1, processed, jobs))
+            
+            # Passer à la page suivante
+            if page < max_pages - 1 and not self.go_to_next_page(page):
+                break
         
-        logger.info(f"Scraping terminé. {len(jobs)} offres trouvées")
+        logger.info(f"Scraping terminé. {self.counts['total']} offres trouvées")
+        self.log_store_summary()
+        self.waits.log_summary()
+        self.limiter.log_summary()
         return jobs
+
+    @timing.timed('scrape.scroll')
+    def scroll_job_list(self):
+        """Fait défiler la page de résultats pour charger toutes les offres"""
+        logger.info("Défilement de la page pour charger toutes les offres...")
+        
+        # Défiler progressivement pour s'assurer que toutes les offres sont chargées
+        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        
+        for _ in range(5):  # Faire plusieurs défilements
+            # Défiler vers le bas
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            
+            # Attendre le chargement de nouveaux éléments (changement de hauteur)
+            if not self.waits.until(waits.height_changed(last_height), 'scroll', nominal=2):
+                break  # Si la hauteur n'a pas changé, on a atteint le bas de la page
+            last_height = self.driver.execute_script("return document.body.scrollHeight")
+        
+        logger.info("Défilement terminé, toutes les offres devraient être chargées")
+
+    def collect_job_ids(self, max_pages=5):
+        """
+        Collecte les offres des pages de résultats, sans les ouvrir.
+        Retourne {identifiant: titre de la carte}, dans l'ordre des pages
+        """
+        job_ids = {}
+        for page in range(max_pages):
+            logger.info(f"Collecte des identifiants de la page {page + 1}")
+            self.scroll_job_list()
+            self.waits.until(waits.job_cards_present, 'job_list', nominal=3)
+            self.record_page(self.paginator.url(page))
+            
+            page_ids = {job_id: title for job_id, title in self.extractor.job_cards().items()
+                        if job_id not in job_ids}
+            logger.info(f"{len(page_ids)} nouvelles offres trouvées sur la page {page + 1}")
+            if not page_ids:
+                break
+            job_ids.update(page_ids)
+            
+            if page < max_pages - 1 and not self.go_to_next_page(page):
+                break
+        
+        logger.info(f"{len(job_ids)} identifiants d'offres collectés")
+        return job_ids
+
+    def scrape_jobs_parallel(self, max_pages=5, workers=2, resume=None, backend='browser',
+                             concurrency=DEFAULT_CONCURRENCY, host_rate=rate_limiter.DEFAULT_HOST_RATE):
+        """
+        Scrape les offres en deux temps: le driver principal collecte les identifiants,
+        puis les pages d'offres sont ouvertes en parallèle, par un pool de navigateurs
+        (backend 'browser') ou par requêtes HTTP sur les pages publiques, au plus `host_rate`
+        requêtes par seconde (backend 'http' avec des threads, backend 'async' avec asyncio
+        et `concurrency` requêtes simultanées ; les offres dont la page publique ne suffit
+        pas sont reprises par les navigateurs).
+        resume est l'état d'un point de reprise (Checkpoint.load) à partir duquel continuer
+        """
+        state = resume or {}
+        processed = set(state.get('processed_ids', []))
+        # Résultats déjà collectés (reprise) puis offres traitées dans l'ordre d'arrivée
+        collected = list(state.get('jobs', []))
+        resumed_jobs = list(collected)
+        
+        cards = [(job_id, title) for job_id, title in self.collect_job_ids(max_pages).items() if job_id not in processed]
+        results = [None] * len(cards)
+        
+        # Offres déjà analysées lors d'une exécution précédente (titre de la carte inchangé): pas de navigation
+        pending = []
+        for position, (job_id, card_title) in enumerate(cards):
+            if self.store is not None and self.store.is_unchanged(job_id, card_title):
+                self.emit_result(self.store.touch(job_id), position, results, collected)
+                self.mark_processed(job_id, processed, 0, collected)
+            else:
+                pending.append((position, job_id, card_title))
+        logger.info(f"{len(pending)} offres à analyser, {len(cards) - len(pending)} déjà connues")
         
+        try:
+            if pending and backend == 'http':
+                logger.info("Téléchargement des pages publiques des offres (sans navigateur)")
+                self.pool = HttpJobExtractor(workers=workers, limiter=self.limiter.sibling(host_rate),
+                                             recorder=self.recorder)
+                pending = self.fetch_and_score(pending, results, collected, processed)
+                self.close_pool()
+                if pending:
+                    logger.info(f"{len(pending)} offres à reprendre avec un navigateur")
+            elif pending and backend == 'async':
+                logger.info("Téléchargement asynchrone des pages publiques des offres (sans navigateur)")
+                pending = self.fetch_and_score_async(pending, results, collected, processed, concurrency, host_rate)
+                if pending:
+                    logger.info(f"{len(pending)} offres à reprendre avec un navigateur")
+            
+            if pending:
+                self.pool = BrowserWorkerPool(
+                    self.build_driver, session_cookies(self.driver), workers=workers,
+                    timeouts=self.waits.timeouts, limiter=self.limiter, recorder=self.recorder
+                )
+                self.fetch_and_score(pending, results, collected, processed)
+        finally:
+            self.close_pool()
+            if self.checkpoint:
+                self.checkpoint.save(self.checkpoint_state(0, processed, collected))
+        
+        jobs = resumed_jobs + [job for job in results if job is not None]
+        logger.info(f"Scraping terminé. {self.counts['total']} offres trouvées")
+        self.log_store_summary()
+        self.limiter.log_summary()
+        return jobs
+
+    def fetch_and_score(self, pending, results, collected, processed):
+        """
+        Fait extraire les offres [(position, job_id, titre de la carte)] par self.pool et les évalue.
+        Retourne les offres dont l'extraction a échoué
+        """
+        failed = []
+        pending_ids = [job_id for _, job_id, _ in pending]
+        for done, (pending_position, details) in enumerate(self.pool.map(pending_ids), start=1):
+            self.score_fetched(pending[pending_position], details, done, len(pending),
+                               results, collected, processed, failed)
+        return failed
+
+    def fetch_and_score_async(self, pending, results, collected, processed, concurrency, host_rate):
+        """
+        Télécharge les offres [(position, job_id, titre de la carte)] avec asyncio ; chaque offre analysée
+        est évaluée dès sa sortie de la file. Retourne les offres dont l'extraction a échoué
+        """
+        failed = []
+        done = 0
+
+        def handle(pending_position, details):
+            nonlocal done
+            done += 1
+            self.score_fetched(pending[pending_position], details, done, len(pending),
+                               results, collected, processed, failed)
+
+        fetcher = AsyncJobFetcher(concurrency=concurrency, limiter=self.limiter.sibling(host_rate),
+                                  recorder=self.recorder)
+        fetcher.run([job_id for _, job_id, _ in pending], handle)
+        return failed
+
+    def score_fetched(self, item, details, done, total, results, collected, processed, failed):
+        """Évalue une offre extraite (item = (position, job_id, titre de la carte)), ou la note comme échouée"""
+        position, job_id, card_title = item
+        if details is None:
+            failed.append(item)
+            return
+        logger.info(f"Offre {done}/{total}: {details['title']} | {details['company']} | {details['location']}")
+        
+        # Le scoring reste dans le thread principal
+        is_gaijin_friendly, gaijin_details = self.is_gaijin_friendly(details['description'])
+        logger.info(f"{'✓ Offre adaptée aux étrangers' if is_gaijin_friendly else '✗ Offre non adaptée aux étrangers'}")
+        job_data = rule_engine.build_job_record(
+            details['title'], details['company'], details['location'], details['url'],
+            is_gaijin_friendly, gaijin_details
+        )
+        if self.store is not None:
+            self.store.upsert(job_id, job_data, details['description'], card_title)
+        self.emit_result(job_data, position, results, collected)
+        self.mark_processed(job_id, processed, 0, collected)
+
+    def emit_result(self, job_data, position, results, collected):
+        """Comme emit, en gardant l'ordre des pages de résultats hors mode continu"""
+        if not self.sink:
+            results[position] = job_data
+        self.emit(collected, job_data)
+
+    def emit(self, jobs, job_data):
+        """
+        Compte une offre évaluée et l'ajoute aux résultats ou, en mode continu,
+        au seul fichier JSONL (mémoire constante quel que soit le nombre d'offres)
+        """
+        self.counts['total'] += 1
+        if job_data['is_gaijin_friendly'] == 'Oui':
+            self.counts['friendly'] += 1
+        if self.sink:
+            self.sink.write(job_data)
+        else:
+            jobs.append(job_data)
+
+    def load_checkpoint(self):
+        """
+        Charge le point de reprise de la dernière exécution interrompue, ou None.
+        Les offres déjà collectées gardent la date de début de l'exécution d'origine
+        """
+        state = self.checkpoint.load() if self.checkpoint else None
+        if state:
+            self.run_started = state.get('run_started', self.run_started)
+            # Les offres de l'exécution reprise continuent le même fichier JSONL, qui
+            # n'est pas relu: les offres traitées sont connues par leurs identifiants
+            if state.get('stream_file') and os.path.exists(state['stream_file']) and self.sink is None:
+                self.open_stream(state['stream_file'])
+            self.counts = state.get('counts') or self.count_jobs(
+                read_jsonl(state['stream_file']) if self.sink else state.get('jobs', []))
+        return state
+
+    @staticmethod
+    def count_jobs(jobs):
+        """Compteurs des statistiques finales pour des offres déjà évaluées"""
+        counts = {'total': 0, 'friendly': 0}
+        for job in jobs:
+            counts['total'] += 1
+            counts['friendly'] += job['is_gaijin_friendly'] == 'Oui'
+        return counts
+
+    def open_stream(self, path=None):
+        """Active l'écriture continue des offres dans un fichier JSONL (horodaté par défaut)"""
+        if not path:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = os.path.join("exports", f"linkedin_jobs_{timestamp}.jsonl")
+        self.sink = JsonlSink(path)
+        return path
+
+    def checkpoint_state(self, page, processed, jobs):
+        """État enregistré dans le point de reprise"""
+        return {
+            'keywords': self.paginator.keywords,
+            'location': self.paginator.location,
+            'run_started': self.run_started,
+            'page': page,
+            'processed_ids': sorted(processed),
+            # En mode continu, les résultats sont déjà dans le fichier JSONL
+            'jobs': [] if self.sink else jobs,
+            'stream_file': self.sink.path if self.sink else None,
+            'counts': dict(self.counts),
+        }
+
+    def mark_processed(self, job_id, processed, page, jobs):
+        """Note une offre comme traitée et enregistre périodiquement le point de reprise"""
+        if job_id:
+            processed.add(job_id)
+        if self.checkpoint:
+            self.checkpoint.step(lambda: self.checkpoint_state(page, processed, jobs))
+
+    def log_store_summary(self):
+        """Journalise le nombre d'offres réutilisées depuis la base et le cache des scores"""
+        if self.store is not None:
+            logger.info(f"Base des offres: {len(self.store)} offres connues, {self.store.skipped} non rouvertes")
+        if self.score_cache is not None:
+            self.score_cache.log_summary()
+
+    def go_to_next_page(self, page):
+        """
+        Passe de la page page + 1 à la page page + 2 par navigation directe.
+        Retourne False si la navigation a échoué ; la perte du navigateur est propagée
+        """
+        logger.info(f"Passage à la page {page + 2}")
+        try:
+            return self.open_search_page(page + 1)
+        except Exception as e:
+            if driver_setup.is_driver_fatal(e):
+                raise
+            logger.error(f"Échec de la navigation vers la page {page + 2}: {str(e)}")
+            return False
+
+    def open_search_page(self, page):
+        """
+        Ouvre directement la page de résultats demandée (0 pour la première).
+        Retourne False si aucune offre n'est affichée
+        """
+        page_url = self.paginator.url(page)
+        logger.info(f"Navigation vers la page {page + 1}: {page_url}")
+        if not self.navigate(page_url, expected='/jobs/search'):
+            logger.error(f"Page {page + 1} inaccessible (limitation de LinkedIn)")
+            return False
+        return bool(self.waits.until(waits.job_cards_present, 'page_load', nominal=5,
+                                     message=f"aucune offre affichée sur la page {page + 1}"))
+        
+    @timing.timed('browser.navigate')
+    def navigate(self, url, expected=None):
+        """
+        Ouvre une page au rythme du limiteur. Si expected (fragment d'URL) est donné,
+        une redirection ailleurs est traitée comme une limitation (backoff puis nouvel essai).
+        Retourne False si la page attendue reste inaccessible
+        """
+        return paced_get(self.limiter, self.driver, url, expected=expected)
+
+    def record_page(self, url):
+        """Enregistre la page affichée sous l'URL donnée (mode --record)"""
+        if self.recorder:
+            try:
+                self.recorder.record_driver(self.driver, url)
+            except OSError as e:
+                logger.warning(f"Impossible d'enregistrer la page {url}: {str(e)}")
+
+    @timing.timed('browser.click')
+    def click(self, element):
+        """Clique sur l'élément au rythme du limiteur"""
+        self.limiter.acquire()
+        element.click()
+
     def save_to_csv(self, jobs, filename='linkedin_jobs.csv'):
         """Sauvegarde les offres dans un fichier CSV (méthode obsolète, utilisée pour compatibilité)"""
+        import pandas as pd
+        
         logger.info(f"Sauvegarde des {len(jobs)} offres dans {filename}")
         df = pd.DataFrame(jobs)
         df.to_csv(filename, index=False, encoding='utf-8')
@@ -1379,8 +830,15 @@ class LinkedInScraper:
             from linkedin_export import LinkedInExporter
             exporter = LinkedInExporter()
             
-            # Exporter les données
-            export_files = exporter.export_all(jobs)
+            # Exporter les données: relecture paresseuse du fichier JSONL en mode continu,
+            # sinon depuis la base (offres vues pendant cette exécution)
+            if self.sink:
+                self.sink.close()
+                export_files = exporter.export_jsonl(self.sink.path)
+            elif self.store is not None:
+                export_files = exporter.export_store(self.store, seen_since=self.run_started)
+            else:
+                export_files = exporter.export_all(jobs)
             
             logger.info("Export des données terminé avec succès")
             logger.info(f"CSV: {export_files['csv']}")
@@ -1390,16 +848,38 @@ class LinkedInScraper:
             return export_files
         except Exception as e:
             logger.error(f"Erreur lors de l'export: {str(e)}")
+            if self.sink:
+                # Mode continu: aucune offre en mémoire, le fichier JSONL contient toutes les offres
+                logger.info(f"Les offres de l'exécution restent disponibles dans {self.sink.path}")
+                return None
             # Utiliser la méthode de sauvegarde traditionnelle en cas d'erreur
             logger.info("Utilisation de la méthode de sauvegarde traditionnelle")
             self.save_to_csv(jobs)
             return None
     
+    def close_pool(self):
+        """Arrête le pool d'extraction (navigateurs ou session HTTP) s'il est actif"""
+        if self.pool:
+            logger.info("Fermeture du pool d'extraction")
+            self.pool.close()
+            self.pool = None
+    
     def close(self):
-        """Ferme le driver"""
+        """Ferme le pool de navigateurs, le driver, la base des offres et le cache des scores"""
+        self.close_pool()
         if self.driver:
             logger.info("Fermeture du driver Firefox")
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception as e:
+                # Navigateur déjà perdu: la base, le cache et le fichier JSONL doivent être fermés
+                logger.warning(f"Erreur lors de la fermeture du driver: {str(e)}")
+        if self.store is not None:
+            self.store.close()
+        if self.score_cache is not None:
+            self.score_cache.close()
+        if self.sink:
+            self.sink.close()
             
 def main():
     # Configurer le parser d'arguments
@@ -1411,6 +891,59 @@ def main():
                       help="Localisation pour la recherche (défaut: 'Tokyo, Japan')")
     parser.add_argument("--language", "-l", type=str, choices=['en', 'fr'], default='en',
                       help="Language for the application: English (en) or French (fr). Default: English (en)")
+    parser.add_argument("--max-wait", type=float, default=None,
+                      help="Borne supérieure (secondes) de chaque attente conditionnelle (défaut: bornes par type d'attente)")
+    parser.add_argument("--rate", type=float, default=rate_limiter.DEFAULT_RATE,
+                      help=f"Navigations et clics par seconde, tous navigateurs confondus (défaut: {rate_limiter.DEFAULT_RATE})")
+    parser.add_argument("--burst", type=int, default=rate_limiter.DEFAULT_BURST,
+                      help=f"Nombre d'actions enchaînables sans attente (défaut: {rate_limiter.DEFAULT_BURST})")
+    parser.add_argument("--workers", type=int, default=1,
+                      help=f"Nombre de navigateurs ouvrant les offres en parallèle (défaut: 1, maximum: {MAX_WORKERS})")
+    parser.add_argument("--backend", type=str, choices=['browser', 'http', 'async'], default='browser',
+                      help="Ouverture des offres: browser (navigateur), http (pages publiques sans navigateur) "
+                           "ou async (pages publiques téléchargées avec asyncio) ; les offres non publiques "
+                           "sont reprises par un navigateur")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                      help=f"Backend async: nombre de requêtes simultanées (défaut: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--host-rate", type=float, default=rate_limiter.DEFAULT_HOST_RATE,
+                      help=f"Backends http et async: nombre maximal de requêtes par seconde vers LinkedIn (défaut: {rate_limiter.DEFAULT_HOST_RATE})")
+    parser.add_argument("--driver-profile", type=str, choices=sorted(driver_setup.DRIVER_PROFILES),
+                      default=driver_setup.DEFAULT_PROFILE,
+                      help="Profil du navigateur: default (visible) ou performance (headless, sans images, médias ni polices)")
+    parser.add_argument("--geckodriver", type=str, default=None,
+                      help=f"Chemin de geckodriver (défaut: variable {driver_setup.GECKODRIVER_ENV}, cache local, puis téléchargement)")
+    parser.add_argument("--store", type=str, default=job_store.DEFAULT_STORE_FILE,
+                      help=f"Base SQLite des offres analysées; les offres connues ne sont pas rouvertes (défaut: {job_store.DEFAULT_STORE_FILE})")
+    parser.add_argument("--no-store", action="store_true",
+                      help="Ré-analyser toutes les offres, sans consulter ni alimenter la base")
+    parser.add_argument("--rules", type=str, default=None,
+                      help=f"Fichier de règles de scoring JSON, rechargé à chaud s'il est modifié (défaut: variable {rule_engine.RULES_FILE_ENV}, sinon scoring_rules.json)")
+    parser.add_argument("--score-cache", type=str, default=score_cache.DEFAULT_CACHE_FILE,
+                      help=f"Cache SQLite des scores; une description déjà évaluée avec les mêmes règles n'est pas ré-analysée (défaut: {score_cache.DEFAULT_CACHE_FILE})")
+    parser.add_argument("--no-score-cache", action="store_true",
+                      help="Analyser toutes les descriptions, sans consulter ni alimenter le cache des scores")
+    parser.add_argument("--prune-score-cache", type=int, nargs='?', const=score_cache.DEFAULT_PRUNE_DAYS, default=None,
+                      metavar="JOURS",
+                      help=f"Supprimer du cache les scores d'autres règles de plus de JOURS jours (défaut: {score_cache.DEFAULT_PRUNE_DAYS})")
+    parser.add_argument("--stream", nargs='?', const='', default=None, metavar="FICHIER",
+                      help="Écrire chaque offre dans un fichier JSONL dès son évaluation (défaut: exports/linkedin_jobs_<date>.jsonl)")
+    parser.add_argument("--resume", action="store_true",
+                      help="Reprendre la dernière exécution interrompue à partir de son point de reprise")
+    parser.add_argument("--checkpoint-file", type=str, default=checkpoint.DEFAULT_CHECKPOINT_FILE,
+                      help=f"Fichier du point de reprise (défaut: {checkpoint.DEFAULT_CHECKPOINT_FILE})")
+    parser.add_argument("--session-file", type=str, default=session_store.DEFAULT_SESSION_FILE,
+                      help=f"Fichier des cookies de session réutilisés entre deux exécutions (défaut: {session_store.DEFAULT_SESSION_FILE})")
+    parser.add_argument("--no-session", action="store_true",
+                      help="Ne pas réutiliser ni enregistrer la session (connexion complète à chaque exécution)")
+    parser.add_argument("--timings", type=str, default=None, metavar="FICHIER",
+                      help="Fichier JSON du résumé des temps par phase (défaut: exports/timings_<date>.json)")
+    parser.add_argument("--base-url", type=str, default=None,
+                      help=f"Adresse de base du site, par exemple le serveur de rejeu de fixtures.py "
+                           f"(défaut: variable {linkedin_urls.BASE_URL_ENV}, sinon {linkedin_urls.DEFAULT_BASE_URL})")
+    parser.add_argument("--no-login", action="store_true",
+                      help="Ne pas se connecter (rejeu de pages enregistrées, pages publiques)")
+    parser.add_argument("--record", type=str, default=None, metavar="RÉPERTOIRE",
+                      help="Enregistrer le HTML des pages de résultats et des offres dans ce répertoire de fixtures")
     
     # Parser les arguments
     args = parser.parse_args()
@@ -1424,25 +957,66 @@ def main():
     logger.info(i18n.get('script_start'))
     logger.info(i18n.get('config_info', args.pages, keywords, args.location))
     
-    scraper = LinkedInScraper()
+    # Chronométrage des phases de l'exécution
+    timing.TIMER.enabled = True
+    
+    if args.rules:
+        rule_engine.set_rules_file(args.rules)
+    
+    if args.base_url:
+        linkedin_urls.set_base_url(args.base_url)
+        logger.info(f"Adresse de base: {linkedin_urls.base_url()}")
+    
+    scraper = LinkedInScraper(max_wait=args.max_wait, rate=args.rate, burst=args.burst,
+                              session_file=None if args.no_session else args.session_file,
+                              driver_profile=args.driver_profile, geckodriver_path=args.geckodriver,
+                              store_file=None if args.no_store else args.store,
+                              checkpoint_file=args.checkpoint_file, record_dir=args.record,
+                              score_cache_file=None if args.no_score_cache else args.score_cache)
     try:
-        scraper.login()
+        if scraper.score_cache is not None and args.prune_score_cache is not None:
+            scraper.score_cache.prune(args.prune_score_cache)
+        # Reprise: la recherche de l'exécution interrompue est conservée
+        resume_state = scraper.load_checkpoint() if args.resume else None
+        location = args.location
+        if resume_state:
+            keywords, location = resume_state['keywords'], resume_state['location']
+        elif args.resume:
+            logger.info("Aucun point de reprise trouvé, démarrage d'une nouvelle exécution")
+        if args.stream is not None and scraper.sink is None:
+            scraper.open_stream(args.stream)
+        
+        if not args.no_login:
+            scraper.start_session()
         # Recherche avec les mots-clés et localisation spécifiés
-        scraper.search_jobs(keywords=keywords, location=args.location)
+        scraper.search_jobs(keywords=keywords, location=location)
         
         # Utiliser le nombre de pages spécifié
-        jobs = scraper.scrape_jobs(max_pages=args.pages)
+        if args.workers > 1 or args.backend != 'browser':
+            jobs = scraper.scrape_jobs_parallel(max_pages=args.pages, workers=args.workers, resume=resume_state,
+                                                backend=args.backend, concurrency=args.concurrency,
+                                                host_rate=args.host_rate)
+        else:
+            jobs = scraper.scrape_jobs(max_pages=args.pages, resume=resume_state)
         
         # Utiliser le nouvel exporteur
         scraper.export_data(jobs)
         
+        # Exécution terminée: le point de reprise n'est plus utile (il est conservé
+        # si le scraping a été interrompu, par exemple par la perte du navigateur)
+        if scraper.checkpoint:
+            scraper.checkpoint.clear()
+        
         # Afficher les statistiques
-        friendly_jobs = [job for job in jobs if job['is_gaijin_friendly'] == 'Oui']
-        logger.info(i18n.get('stats_summary', len(jobs), len(friendly_jobs)))
+        logger.info(i18n.get('stats_summary', scraper.counts['total'], scraper.counts['friendly']))
     except Exception as e:
         logger.error(i18n.get('error_occurred', str(e)))
     finally:
         scraper.close()
+        # Temps passé dans chaque phase de l'exécution
+        print(timing.TIMER.report())
+        timing.TIMER.write(args.timings or os.path.join(
+            "exports", f"timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"))
         logger.info(i18n.get('script_end'))
 
 if __name__ == "__main__":
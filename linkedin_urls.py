@@ -0,0 +1,32 @@
+"""
+Adresse de base du site LinkedIn.
+
+Toutes les URL construites par le scraper (recherche, offres, connexion, fil
+d'actualité) partent de cette base. Elle peut être remplacée (option --base-url
+ou variable LINKEDIN_BASE_URL), par exemple par le serveur local de fixtures
+(fixtures.py) pour rejouer une exécution enregistrée sans réseau.
+"""
+
+import os
+
+DEFAULT_BASE_URL = "https://www.linkedin.com"
+BASE_URL_ENV = "LINKEDIN_BASE_URL"
+
+# Base choisie explicitement (set_base_url), prioritaire sur la variable d'environnement
+_base_url = None
+
+
+def set_base_url(url):
+    """Remplace l'adresse de base (None pour revenir à la variable d'environnement ou au défaut)"""
+    global _base_url
+    _base_url = url
+
+
+def base_url():
+    """Adresse de base courante, sans / final"""
+    return (_base_url or os.getenv(BASE_URL_ENV) or DEFAULT_BASE_URL).rstrip('/')
+
+
+def url(path):
+    """URL complète d'un chemin du site (par exemple '/jobs/search')"""
+    return base_url() + path
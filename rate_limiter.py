@@ -0,0 +1,160 @@
+"""
+Limiteur de débit commun à toutes les requêtes vers LinkedIn.
+
+Chaque navigation, clic et requête HTTP consomme un jeton d'un seau à jetons
+(débit soutenu `rate` par seconde, rafale de `burst` actions), avec un aléa
+(jitter) pour éviter un rythme parfaitement régulier. Lorsqu'un blocage est
+détecté (redirection vers la page de connexion ou le fil d'actualité au lieu de
+la page demandée, réponse HTTP 429), le limiteur suspend toutes les actions avec
+un délai qui double à chaque blocage consécutif. Le rythme s'adapte ainsi au
+débit réellement toléré au lieu de pauses fixes calées sur le pire cas.
+
+Les requêtes HTTP ont leur propre débit (RateLimiter.sibling) mais partagent la
+suspension des navigateurs : un blocage détecté par l'un suspend tous les autres.
+"""
+
+import time
+import random
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Débit soutenu (actions par seconde) et rafale autorisée pour le navigateur
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 3
+# Débit des requêtes HTTP sur les pages publiques (backends http et async)
+DEFAULT_HOST_RATE = 2.0
+# Aléa ajouté à chaque action, en fraction de l'intervalle 1 / rate
+DEFAULT_JITTER = 0.5
+
+# Suspension après un blocage: BACKOFF_BASE, puis doublée à chaque blocage consécutif
+BACKOFF_BASE = 30
+BACKOFF_MAX = 600
+
+# Nombre de nouvelles tentatives d'une navigation redirigée
+THROTTLE_RETRIES = 2
+
+# Pages vers lesquelles LinkedIn redirige une session bridée
+THROTTLE_URL_MARKERS = ("/login", "authwall", "checkpoint", "/feed")
+# Réponses HTTP signalant un blocage (999 est propre à LinkedIn)
+THROTTLE_STATUSES = (429, 999)
+
+
+def throttle_reason(current_url, expected):
+    """
+    Motif du blocage si la page affichée n'est pas celle attendue
+    (expected est un fragment de l'URL demandée, par exemple '/jobs/search'), sinon None
+    """
+    if not expected:
+        return None
+    if expected not in current_url or any(marker in current_url for marker in THROTTLE_URL_MARKERS):
+        return f"redirection vers {current_url}"
+    return None
+
+
+class Backoff:
+    """Suspension après un blocage, délai doublé à chaque blocage consécutif (partagée entre limiteurs)"""
+
+    def __init__(self, base=BACKOFF_BASE, maximum=BACKOFF_MAX):
+        self.base = base
+        self.maximum = maximum
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.lock = threading.Lock()
+
+    def strike(self):
+        """Enregistre un blocage et retourne la durée de la suspension"""
+        with self.lock:
+            backoff = min(self.base * 2 ** self.strikes, self.maximum)
+            self.strikes += 1
+            self.blocked_until = max(self.blocked_until, time.monotonic() + backoff)
+            return backoff
+
+    def reset(self):
+        """Action réussie: le prochain blocage repartira du délai de base"""
+        if self.strikes:
+            with self.lock:
+                self.strikes = 0
+
+
+class RateLimiter:
+    """Seau à jetons partagé entre threads, avec jitter et backoff exponentiel"""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, jitter=DEFAULT_JITTER,
+                 backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX, name="navigateur", backoff=None):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.jitter = jitter
+        self.name = name
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        # Suspension commune aux limiteurs créés par sibling
+        self.backoff = backoff or Backoff(backoff_base, backoff_max)
+        self.lock = threading.Lock()
+        self.stats = {'count': 0, 'waited': 0.0, 'throttled': 0, 'backoff': 0.0}
+
+    def reserve(self):
+        """Réserve un jeton et retourne le délai (secondes) à attendre avant d'agir"""
+        with self.lock:
+            now = time.monotonic()
+            if not self.rate:
+                delay = 0.0
+            else:
+                # Recharge du seau, puis jeton emprunté sur le futur s'il est vide
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                self.tokens -= 1
+                delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+                delay += random.uniform(0, self.jitter / self.rate)
+            delay = max(delay, self.backoff.blocked_until - now)
+            self.stats['count'] += 1
+            self.stats['waited'] += delay
+            return delay
+
+    def acquire(self):
+        """Attend le prochain créneau disponible"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def throttled(self, reason):
+        """Blocage détecté: suspend toutes les actions, délai doublé à chaque blocage consécutif"""
+        backoff = self.backoff.strike()
+        with self.lock:
+            self.tokens = 0.0
+            self.stats['throttled'] += 1
+            self.stats['backoff'] += backoff
+        logger.warning(f"Limitation détectée ({self.name}): {reason}, pause de {backoff:.0f}s")
+
+    def success(self):
+        """Action réussie: le prochain blocage repartira du délai de base"""
+        self.backoff.reset()
+
+    def sibling(self, rate, burst=DEFAULT_BURST, name="HTTP"):
+        """Limiteur à débit propre qui partage la suspension de celui-ci après un blocage"""
+        return RateLimiter(rate=rate, burst=burst, jitter=self.jitter, name=name, backoff=self.backoff)
+
+    def log_summary(self):
+        """Journalise le bilan du limiteur"""
+        logger.info(
+            f"Limiteur ({self.name}): {self.stats['count']} actions, temps d'attente: {self.stats['waited']:.1f}s, "
+            f"{self.stats['throttled']} limitations détectées ({self.stats['backoff']:.0f}s de pause)"
+        )
+
+
+def paced_get(limiter, driver, url, expected=None, retries=THROTTLE_RETRIES):
+    """
+    Ouvre l'URL dans le driver au rythme du limiteur. Si la page affichée n'est pas
+    celle attendue (voir throttle_reason), le limiteur est suspendu et la navigation
+    recommencée. Retourne False si la redirection persiste
+    """
+    for _ in range(retries + 1):
+        limiter.acquire()
+        driver.get(url)
+        reason = throttle_reason(driver.current_url, expected)
+        if not reason:
+            limiter.success()
+            return True
+        limiter.throttled(reason)
+    return False
@@ -0,0 +1,217 @@
+"""
+Re-scoring hors ligne des offres déjà collectées.
+
+Lit les descriptions depuis un fichier CSV, JSONL ou une base SQLite, les évalue
+avec le même composant que LinkedInScraper.is_gaijin_friendly dans un pool de
+processus, puis exporte les résultats avec LinkedInExporter. Aucun navigateur
+n'est nécessaire.
+
+Exemple:
+    python rescore.py exports/jobs.db --workers 8 --chunk-size 500
+
+Les exports CSV et JSONL du scraper ne contiennent pas les descriptions : seule
+la base des offres (exports/jobs.db) peut être ré-évaluée sans autre source.
+"""
+
+import os
+import sys
+import csv
+import sqlite3
+import logging
+import argparse
+
+import rule_engine
+from gaijin_scorer import GaijinScorer
+from score_cache import ScoreCache, normalize, DEFAULT_CACHE_FILE, DEFAULT_PRUNE_DAYS
+from jsonl_sink import read_jsonl
+
+# Configuration des logs
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Extensions reconnues pour chaque format d'entrée
+INPUT_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.db': 'sqlite',
+    '.sqlite': 'sqlite',
+    '.sqlite3': 'sqlite',
+}
+
+
+def detect_format(path):
+    """Déduit le format d'entrée de l'extension du fichier"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in INPUT_FORMATS:
+        raise ValueError(f"Format d'entrée non reconnu pour {path} (utilisez --format)")
+    return INPUT_FORMATS[extension]
+
+
+def read_records(path, input_format=None, table='jobs'):
+    """Lit les offres stockées et retourne une liste de dictionnaires"""
+    input_format = input_format or detect_format(path)
+    logger.info(f"Lecture des offres depuis {path} (format: {input_format})")
+
+    if input_format == 'csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    if input_format == 'jsonl':
+        return list(read_jsonl(path))
+
+    if input_format == 'sqlite':
+        connection = sqlite3.connect(path)
+        connection.row_factory = sqlite3.Row
+        try:
+            # Le nom de table ne peut pas être passé en paramètre SQL
+            rows = connection.execute(f'SELECT * FROM "{table}"').fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            connection.close()
+
+    raise ValueError(f"Format d'entrée inconnu: {input_format}")
+
+
+# Composant de scoring propre à chaque processus (aucun driver, construction immédiate)
+_scorer = GaijinScorer()
+
+
+def chunked(items, size):
+    """Découpe une liste en morceaux de taille fixe"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _init_worker(verbose, rules_file=None):
+    """Initialise un processus de scoring (journalisation détaillée désactivée par défaut)"""
+    if rules_file:
+        rule_engine.set_rules_file(rules_file)
+    if not verbose:
+        logging.getLogger('rule_engine').setLevel(logging.WARNING)
+
+
+def score_chunk(descriptions):
+    """Évalue un lot de descriptions, retourne [(is_friendly, détails)]"""
+    return _scorer.score_many(descriptions)
+
+
+def score_descriptions(descriptions, workers, chunk_size, verbose):
+    """Évalue les descriptions par lots, dans le processus courant si workers=1"""
+    if not descriptions:
+        return []
+    chunks = chunked(descriptions, chunk_size)
+    logger.info(f"Scoring de {len(descriptions)} descriptions en {len(chunks)} lots avec {workers} processus")
+
+    if workers == 1:
+        _init_worker(verbose)
+        return [result for chunk in chunks for result in score_chunk(chunk)]
+    # Règles compilées avant le démarrage des processus, qui chargent l'artefact
+    rule_engine.get_engine()
+    # multiprocessing n'est chargé que pour le scoring multi-processus
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(verbose, rule_engine.default_rules_file())) as executor:
+        return [result for chunk_results in executor.map(score_chunk, chunks) for result in chunk_results]
+
+
+def rescore(records, workers=None, chunk_size=200, description_column='description', verbose=False, cache=None):
+    """
+    Ré-évalue les offres et retourne les lignes d'export dans l'ordre d'entrée.
+    Avec workers=1, le scoring est fait dans le processus courant.
+    Avec un cache (score_cache.ScoreCache), seules les descriptions inconnues sont
+    évaluées, une seule fois par texte normalisé, puis enregistrées.
+    Lève ValueError si aucune offre n'a la colonne de description ; les offres
+    sans description sont ignorées (avec un avertissement) plutôt qu'évaluées à vide.
+    """
+    if records and not any(description_column in record for record in records):
+        raise ValueError(f"Colonne '{description_column}' absente de l'entrée "
+                         f"(colonnes: {', '.join(records[0])}) ; utilisez --description-column")
+    described = [record for record in records if (record.get(description_column) or '').strip()]
+    if len(described) < len(records):
+        logger.warning(f"{len(records) - len(described)} offres sans description ignorées")
+    records = described
+    descriptions = [record[description_column] for record in records]
+    workers = workers or os.cpu_count() or 1
+
+    if cache is None:
+        results = score_descriptions(descriptions, workers, chunk_size, verbose)
+    else:
+        results = [cache.get(description) for description in descriptions]
+        # Descriptions inconnues, dédoublonnées sur le texte normalisé
+        pending = list(dict.fromkeys(normalize(descriptions[i]) for i, result in enumerate(results) if result is None))
+        scored = dict(zip(pending, score_descriptions(pending, workers, chunk_size, verbose)))
+        cache.put_many((text, *result) for text, result in scored.items())
+        results = [result or scored[normalize(description)] for description, result in zip(descriptions, results)]
+        cache.log_summary()
+
+    jobs = []
+    for record, (is_friendly, details) in zip(records, results):
+        jobs.append(rule_engine.build_job_record(
+            record.get('title', ''),
+            record.get('company', ''),
+            record.get('location', ''),
+            record.get('url', ''),
+            is_friendly,
+            details
+        ))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-scoring hors ligne des offres LinkedIn stockées")
+    parser.add_argument("input", help="Fichier d'entrée (CSV, JSONL ou base SQLite)")
+    parser.add_argument("--format", choices=sorted(set(INPUT_FORMATS.values())),
+                        help="Format d'entrée (déduit de l'extension par défaut)")
+    parser.add_argument("--table", default="jobs", help="Table SQLite à lire (défaut: jobs)")
+    parser.add_argument("--description-column", default="description",
+                        help="Colonne contenant la description (défaut: description)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Nombre de processus (défaut: nombre de cœurs)")
+    parser.add_argument("--chunk-size", type=int, default=200,
+                        help="Nombre de descriptions par lot envoyé à un processus (défaut: 200)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Journaliser le détail de chaque analyse")
+    parser.add_argument("--rules", default=None,
+                        help=f"Fichier de règles de scoring JSON (défaut: variable {rule_engine.RULES_FILE_ENV}, sinon scoring_rules.json)")
+    parser.add_argument("--score-cache", default=DEFAULT_CACHE_FILE,
+                        help=f"Cache SQLite des scores par description (défaut: {DEFAULT_CACHE_FILE})")
+    parser.add_argument("--no-score-cache", action="store_true",
+                        help="Ré-évaluer toutes les descriptions, sans consulter ni alimenter le cache")
+    parser.add_argument("--prune-score-cache", type=int, nargs='?', const=DEFAULT_PRUNE_DAYS, default=None,
+                        metavar="JOURS",
+                        help=f"Supprimer du cache les scores d'autres règles de plus de JOURS jours (défaut: {DEFAULT_PRUNE_DAYS})")
+    args = parser.parse_args()
+
+    if args.rules:
+        rule_engine.set_rules_file(args.rules)
+    records = read_records(args.input, args.format, args.table)
+    cache = None if args.no_score_cache else ScoreCache(args.score_cache)
+    if cache is not None and args.prune_score_cache is not None:
+        cache.prune(args.prune_score_cache)
+    try:
+        jobs = rescore(records, args.workers, args.chunk_size, args.description_column, args.verbose, cache)
+    except ValueError as e:
+        logger.error(str(e))
+        return 1
+    finally:
+        if cache is not None:
+            cache.close()
+
+    friendly_jobs = [job for job in jobs if job['is_gaijin_friendly'] == 'Oui']
+    logger.info(f"{len(jobs)} offres évaluées, {len(friendly_jobs)} adaptées aux étrangers")
+
+    # L'exporteur n'est importé qu'ici : les processus de scoring n'en ont pas besoin
+    from linkedin_export import LinkedInExporter
+    export_files = LinkedInExporter().export_all(jobs)
+    logger.info(f"CSV: {export_files['csv']}")
+    logger.info(f"Excel: {export_files['excel']}")
+    logger.info(f"Rapport HTML: {export_files['html']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
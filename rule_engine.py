@@ -0,0 +1,915 @@
+"""
+Moteur de règles pour l'analyse gaijin-friendly des offres d'emploi.
+
+Les tables de règles, les pondérations, les plafonds et le seuil de décision
+sont définis dans un fichier JSON (scoring_rules.json par défaut). Le fichier
+est compilé une fois en un artefact pickle (règles compilées et littéraux
+déduits) portant son empreinte ; l'artefact est réutilisé tant que le fichier
+ne change pas. Le moteur partagé (rule_engine.ENGINE, get_engine) est rechargé
+automatiquement lorsque le fichier est modifié, sans redémarrer le processus.
+
+Pour chaque règle, on déduit les mots littéraux qu'une correspondance contient
+obligatoirement : une seule copie normalisée (casefold) de la description permet
+alors d'écarter d'un coup les règles qui ne peuvent pas correspondre, et seules
+les règles restantes sont évaluées, avec la même sémantique que re.finditer et
+re.search. Le résultat est identique à l'évaluation règle par règle.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import pickle
+import hashlib
+import logging
+import argparse
+import threading
+
+import timing
+import language_detector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scoring_rules.json")
+RULES_FILE_ENV = "GAIJIN_RULES_FILE"
+# Suffixe de l'artefact compilé, enregistré à côté du fichier de règles
+ARTIFACT_SUFFIX = ".compiled.pickle"
+# Format de l'artefact ; toute modification de ce module invalide aussi l'artefact
+ARTIFACT_FORMAT = 1
+# Intervalle minimal (secondes) entre deux vérifications du fichier de règles
+RELOAD_INTERVAL = 1.0
+
+# Tables et pondérations attendues dans le fichier de règles (vérifiées à la compilation)
+REQUIRED_TABLES = [
+    'japanese_positive', 'japanese_negative', 'jlpt', 'japanese_context_positive',
+    'japanese_context_negative', 'international', 'expat_benefits', 'expat_context',
+    'generous_leave', 'leave_days', 'french', 'sentiment_positive', 'sentiment_negative',
+    'sentiment_positive_words', 'sentiment_negative_words', 'additional_benefits',
+]
+REQUIRED_KEYWORDS = ['global', 'leave']
+REQUIRED_WEIGHTS = {
+    'japanese': ['positive_match', 'negative_match', 'jlpt', 'context_positive', 'context_negative',
+                 'positive_only_min', 'positive_only_bonus'],
+    'international': ['match', 'keyword_min', 'keyword_bonus', 'cap'],
+    'benefits': ['match', 'context', 'cap'],
+    'leave': ['match', 'days_bonus', 'keyword_min', 'keyword_bonus', 'cap'],
+    'language': ['french_match', 'french_bonus', 'detect_chars', 'languages', 'cap'],
+    'sentiment': ['phrase_positive', 'phrase_negative', 'word_margin', 'positive_bonus', 'negative_malus', 'cap'],
+}
+REQUIRED_THRESHOLD = ['min_total', 'min_japanese']
+
+# Noms des langues dans les journaux
+LANGUAGE_NAMES = {'en': 'anglais', 'fr': 'français', 'ja': 'japonais'}
+
+# Longueur minimale d'un littéral pour qu'il serve de filtre
+MIN_LITERAL_LENGTH = 3
+
+# Drapeaux globaux en ligne, comme (?i) ; les groupes à drapeaux locaux (?i:...) ne sont pas concernés
+_GLOBAL_FLAGS_RE = re.compile(r'\(\?([aiLmsux]+)\)')
+_QUANTIFIER_START = set('?*+{')
+# Échappements suivis d'autres caractères (codes, noms, références, octal)
+_LONG_ESCAPES = set('xuUN0123456789')
+
+# Blancs d'une ligne réduits à une espace par normalize (espace insécable et idéographique comprises)
+_BLANKS_RE = re.compile(r'[ \t\u00a0\u3000]+')
+
+
+class _UnsupportedPattern(Exception):
+    """Construction (?...) que l'analyse des littéraux ne sait pas interpréter"""
+
+
+def normalize(description):
+    """
+    Description normalisée : fins de ligne unifiées, blancs consécutifs d'une
+    ligne réduits à une espace, blancs de début et de fin supprimés.
+    L'analyse porte toujours sur ce texte, pour que toutes les copies d'une
+    description reçoivent le même score, avec ou sans cache.
+    """
+    text = (description or '').replace('\r\n', '\n').replace('\r', '\n')
+    return '\n'.join(_BLANKS_RE.sub(' ', line).strip() for line in text.split('\n')).strip()
+
+
+def _fold(text):
+    """
+    Normalise un texte pour la recherche de littéraux.
+    re.IGNORECASE fait correspondre 'i' à 'ı' et 'İ', ce que casefold ne fait pas seul.
+    """
+    return text.casefold().replace('ı', 'i').replace('i̇', 'i')
+
+
+def _read_quantifier(pattern, pos):
+    """Lit un quantificateur éventuel et retourne (minimum, position suivante)"""
+    if pos >= len(pattern) or pattern[pos] not in _QUANTIFIER_START:
+        return None, pos
+    if pattern[pos] == '{':
+        end = pattern.find('}', pos)
+        bounds = pattern[pos + 1:end].split(',')
+        minimum = int(bounds[0]) if bounds[0] else 0
+        pos = end + 1
+    else:
+        minimum = 1 if pattern[pos] == '+' else 0
+        pos += 1
+    # Quantificateur non gourmand
+    if pos < len(pattern) and pattern[pos] == '?':
+        pos += 1
+    return minimum, pos
+
+
+def _best_clause(clauses):
+    """Choisit la clause la plus sélective (littéraux les plus longs)"""
+    if not clauses:
+        return None
+    return max(clauses, key=lambda clause: min(len(literal) for literal in clause))
+
+
+def _combine(alternatives):
+    """
+    Combine les analyses de plusieurs alternatives en (clauses, préfixes).
+    Une alternative sans littéral obligatoire rend la combinaison inutilisable.
+    """
+    if len(alternatives) == 1:
+        return alternatives[0]
+    best = [_best_clause(clauses) for clauses, _ in alternatives]
+    clauses = [tuple(literal for clause in best for literal in clause)] if all(best) else []
+    prefixes = None
+    if all(alternative_prefixes for _, alternative_prefixes in alternatives):
+        prefixes = tuple(prefix for _, alternative_prefixes in alternatives for prefix in alternative_prefixes)
+    return clauses, prefixes
+
+
+def _parse_sequence(pattern, pos):
+    """
+    Analyse une séquence d'éléments jusqu'à '|' ou ')'.
+    Retourne (clauses, préfixes, position) : chaque clause est un tuple de littéraux
+    dont au moins un apparaît forcément dans toute correspondance, et les préfixes
+    (ou None) sont les littéraux par lesquels toute correspondance commence.
+    """
+    clauses = []
+    prefixes = None
+    at_start = True
+    run = ''
+
+    while pos < len(pattern) and pattern[pos] not in '|)':
+        char = pattern[pos]
+        literal = None
+        zero_width = False
+        group = ([], None)
+
+        if char == '(':
+            flags = _GLOBAL_FLAGS_RE.match(pattern, pos)
+            if flags:
+                if 'x' in flags.group(1):
+                    # Mode verbeux: espaces et commentaires ne sont plus des littéraux
+                    raise _UnsupportedPattern(flags.group(0))
+                # Drapeaux en ligne, sans effet sur les littéraux
+                pos = flags.end()
+                continue
+            lookaround = pattern.startswith(('(?=', '(?!', '(?<=', '(?<!'), pos)
+            if pattern.startswith(('(?<=', '(?<!'), pos):
+                pos += 4
+            elif pattern.startswith('(?P<', pos):
+                pos = pattern.index('>', pos) + 1
+            elif pattern.startswith(('(?:', '(?=', '(?!'), pos):
+                pos += 3
+            elif pattern.startswith('(?', pos):
+                # Drapeaux locaux, commentaires, références... : pas d'analyse
+                raise _UnsupportedPattern(pattern[pos:pos + 3])
+            else:
+                pos += 1
+            alternatives, pos = _parse_alternatives(pattern, pos)
+            pos += 1  # ')'
+            if lookaround:
+                zero_width = True
+            else:
+                group = _combine(alternatives)
+        elif char == '[':
+            end = pos + 1
+            if pattern[end] == '^':
+                end += 1
+            if pattern[end] == ']':
+                end += 1
+            while pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            pos = end + 1
+        elif char == '\\':
+            escaped = pattern[pos + 1]
+            if escaped in _LONG_ESCAPES:
+                # \x41, \N{...}, \12... : plusieurs caractères, pas d'analyse
+                raise _UnsupportedPattern(pattern[pos:pos + 2])
+            pos += 2
+            if not escaped.isalnum():
+                literal = escaped
+            zero_width = escaped in 'bBAZ'
+        elif char in '^$':
+            zero_width = True
+            pos += 1
+        elif char == '.':
+            pos += 1
+        else:
+            literal = char
+            pos += 1
+
+        minimum, pos = _read_quantifier(pattern, pos)
+        if literal is not None and minimum is None:
+            run += _fold(literal)
+            continue
+        if zero_width and not run:
+            continue
+
+        if literal is not None and minimum:
+            run += _fold(literal)
+        if at_start:
+            if run:
+                prefixes = (run,) if len(run) >= MIN_LITERAL_LENGTH else None
+            elif minimum is None or minimum > 0:
+                prefixes = group[1]
+            at_start = False
+        if len(run) >= MIN_LITERAL_LENGTH:
+            clauses.append((run,))
+        run = ''
+        if minimum is None or minimum > 0:
+            clauses.extend(group[0])
+
+    if len(run) >= MIN_LITERAL_LENGTH:
+        clauses.append((run,))
+        if at_start:
+            prefixes = (run,)
+    return clauses, prefixes, pos
+
+
+def _parse_alternatives(pattern, pos):
+    """Analyse des alternatives séparées par '|' jusqu'à ')' ou la fin du motif"""
+    alternatives = []
+    while True:
+        clauses, prefixes, pos = _parse_sequence(pattern, pos)
+        alternatives.append((clauses, prefixes))
+        if pos < len(pattern) and pattern[pos] == '|':
+            pos += 1
+            continue
+        return alternatives, pos
+
+
+def analyze_pattern(pattern):
+    """
+    Déduit d'un motif les littéraux obligatoires.
+    Retourne (clauses, préfixes) : une correspondance contient, pour chaque clause,
+    au moins un de ses littéraux, et commence par l'un des préfixes s'ils sont connus.
+    Les littéraux sont normalisés par _fold. Un motif dont une construction (?...)
+    n'est pas prise en charge n'a ni littéral ni préfixe (pas de présélection).
+    """
+    try:
+        alternatives, _ = _parse_alternatives(pattern, 0)
+    except _UnsupportedPattern:
+        return [], None
+    return _combine(alternatives)
+
+
+class Rule:
+    """Une règle compilée et les littéraux qui conditionnent sa correspondance"""
+
+    def __init__(self, label, pattern):
+        self.label = label
+        self.pattern = pattern
+        self.regex = re.compile(pattern)
+        self.clauses, self.prefixes = analyze_pattern(pattern)
+
+
+class RuleScan:
+    """
+    Évaluation paresseuse des tables de règles sur une description.
+    La description n'est normalisée qu'une fois ; chaque littéral n'y est cherché
+    qu'une fois, quel que soit le nombre de règles qui le partagent, et les règles
+    à préfixe connu ne sont essayées qu'aux positions où ce préfixe apparaît.
+    """
+
+    def __init__(self, engine, description):
+        self.engine = engine
+        self.description = description
+        self.folded = _fold(description)
+        # Les positions du texte normalisé ne sont utilisables que si casefold
+        # a conservé la longueur (aucun caractère étendu, comme 'ß' -> 'ss')
+        self.aligned = len(description.casefold()) == len(description)
+        # Littéraux présents, cherchés une seule fois pour toutes les règles
+        self.present = {literal for literal in engine.literals if literal in self.folded}
+        self._lowered = None
+        self._positions = {}
+        self._results = {}
+
+    def may_match(self, rule):
+        """Indique si la règle peut correspondre, d'après ses littéraux obligatoires"""
+        return all(not self.present.isdisjoint(clause) for clause in rule.clauses)
+
+    def positions(self, literal):
+        """Retourne les positions (triées) d'un littéral normalisé dans la description"""
+        found = self._positions.get(literal)
+        if found is None:
+            found = []
+            index = self.folded.find(literal)
+            while index != -1:
+                found.append(index)
+                index = self.folded.find(literal, index + 1)
+            self._positions[literal] = found
+        return found
+
+    def _candidates(self, rule):
+        """Positions de départ possibles d'une correspondance, dans l'ordre"""
+        if len(rule.prefixes) == 1:
+            return self.positions(rule.prefixes[0])
+        return sorted(set(index for prefix in rule.prefixes for index in self.positions(prefix)))
+
+    def _finditer(self, rule):
+        """Équivalent de list(rule.regex.finditer(description))"""
+        if not self.may_match(rule):
+            return []
+        if rule.prefixes is None or not self.aligned:
+            return list(rule.regex.finditer(self.description))
+        matches = []
+        end = 0
+        for index in self._candidates(rule):
+            if index < end:
+                continue
+            match = rule.regex.match(self.description, index)
+            if match:
+                matches.append(match)
+                end = match.end()
+        return matches
+
+    def _search(self, rule):
+        """Équivalent de rule.regex.search(description)"""
+        if not self.may_match(rule):
+            return None
+        if rule.prefixes is None or not self.aligned:
+            return rule.regex.search(self.description)
+        for index in self._candidates(rule):
+            match = rule.regex.match(self.description, index)
+            if match:
+                return match
+        return None
+
+    def finditer(self, table):
+        """Retourne [(règle, [correspondances])] comme re.finditer pour chaque règle de la table"""
+        key = ('finditer', table)
+        if key not in self._results:
+            self._results[key] = [(rule, self._finditer(rule)) for rule in self.engine.tables[table]]
+        return self._results[key]
+
+    def search(self, table):
+        """Retourne [(règle, correspondance ou None)] comme re.search pour chaque règle de la table"""
+        key = ('search', table)
+        if key not in self._results:
+            self._results[key] = [(rule, self._search(rule)) for rule in self.engine.tables[table]]
+        return self._results[key]
+
+    def count_keywords(self, keywords):
+        """Compte les mots-clés présents (recherche simple insensible à la casse)"""
+        if self._lowered is None:
+            self._lowered = self.description.lower()
+        return sum(1 for keyword in keywords if keyword.lower() in self._lowered)
+
+
+class RuleEngine:
+    """
+    Calcule le score gaijin-friendly d'une description à partir des tables compilées.
+    Les méthodes score_* reproduisent les analyseurs de LinkedInScraper ; les
+    pondérations, plafonds et seuils viennent du fichier de règles.
+    """
+
+    def __init__(self, rules, fingerprint=None):
+        tables = dict(rules['tables'])
+        # Les mots-clés de sentiment sont recherchés comme des mots entiers
+        for name, words in rules.get('word_tables', {}).items():
+            tables[name] = [r'(?i)\b' + word + r'\b' for word in words]
+        self.tables = {}
+        for name, patterns in tables.items():
+            if isinstance(patterns, dict):
+                items = patterns.items()
+            else:
+                items = enumerate(patterns)
+            self.tables[name] = [Rule(label, pattern) for label, pattern in items]
+        self.literals = frozenset(
+            literal
+            for table in self.tables.values()
+            for rule in table
+            for clause in rule.clauses
+            for literal in clause
+        )
+        self.keywords = rules['keywords']
+        self.weights = rules['weights']
+        self.threshold = rules['threshold']
+        self.fingerprint = fingerprint
+        self.validate()
+
+    def validate(self):
+        """Vérifie que toutes les tables et pondérations utilisées par les analyseurs sont définies"""
+        missing = [f"tables.{name}" for name in REQUIRED_TABLES if name not in self.tables]
+        missing += [f"keywords.{name}" for name in REQUIRED_KEYWORDS if name not in self.keywords]
+        for category, keys in REQUIRED_WEIGHTS.items():
+            missing += [f"weights.{category}.{key}" for key in keys if key not in self.weights.get(category, {})]
+        missing += [f"threshold.{key}" for key in REQUIRED_THRESHOLD if key not in self.threshold]
+        if not missing:
+            jlpt = self.weights['japanese']['jlpt']
+            missing += [f"weights.japanese.jlpt.{rule.label}" for rule in self.tables['jlpt'] if rule.label not in jlpt]
+        if missing:
+            raise ValueError(f"Clés manquantes dans le fichier de règles: {', '.join(missing)}")
+
+    def scan(self, description):
+        """Prépare l'évaluation des règles sur une description"""
+        return RuleScan(self, description)
+
+    def scan_description(self, description):
+        """Prépare l'évaluation sur la description normalisée (voir normalize), comme evaluate"""
+        return self.scan(normalize(description))
+
+    def evaluate(self, description):
+        """
+        Détermine si l'offre est adaptée aux étrangers en utilisant une approche multicritère
+        Retourne un tuple contenant (resultat, détails des scores)
+        L'analyse porte sur la description normalisée (voir normalize)
+        """
+        scan = self.scan_description(description)
+        score = 0
+
+        # Analyse du niveau de japonais requis
+        with timing.phase('scoring.japanese'):
+            japanese_score = self.score_japanese(scan)
+        score += japanese_score
+
+        # Analyse de l'environnement international
+        with timing.phase('scoring.international'):
+            international_score = self.score_international(scan)
+        score += international_score
+
+        # Analyse des avantages pour expatriés
+        with timing.phase('scoring.benefits'):
+            benefits_score = self.score_benefits(scan)
+        score += benefits_score
+
+        # Analyse des politiques de congés
+        with timing.phase('scoring.leave'):
+            leave_policy_score, days_of_leave = self.score_leave_policy(scan)
+        score += leave_policy_score
+
+        # Analyse de la langue utilisée dans l'offre
+        with timing.phase('scoring.language'):
+            language_score = self.score_language(scan)
+        score += language_score
+
+        # Analyse générale de sentiment
+        with timing.phase('scoring.sentiment'):
+            sentiment_score = self.score_sentiment(scan)
+        score += sentiment_score
+
+        # Détecter les avantages supplémentaires
+        with timing.phase('scoring.additional_benefits'):
+            additional_benefits = self.detect_additional_benefits(scan)
+
+        # Journaliser le score final
+        logger.info(f"Score gaijin-friendly: {score}")
+        logger.info(f"Japonais: {japanese_score}, International: {international_score}, "
+                    f"Avantages: {benefits_score}, Congés: {leave_policy_score}, "
+                    f"Langue: {language_score}, Sentiment: {sentiment_score}")
+        if days_of_leave:
+            logger.info(f"Jours de congés: {days_of_leave}")
+        if additional_benefits:
+            logger.info(f"Avantages supplémentaires: {', '.join(additional_benefits)}")
+
+        details = {
+            'score_total': score,
+            'score_japonais': japanese_score,
+            'score_international': international_score,
+            'score_avantages': benefits_score,
+            'score_conges': leave_policy_score,
+            'score_langue': language_score,
+            'score_sentiment': sentiment_score,
+            'jours_conges': days_of_leave,
+            'avantages': ', '.join(additional_benefits) if additional_benefits else ''
+        }
+
+        # Une offre est considérée comme gaijin-friendly si le score dépasse le seuil
+        # ET le score japonais n'est pas fortement négatif
+        is_friendly = score > self.threshold['min_total'] and japanese_score > self.threshold['min_japanese']
+        return is_friendly, details
+
+    def score_japanese(self, scan):
+        """
+        Analyse les exigences linguistiques japonaises
+        Retourne un score: positif si peu/pas de japonais requis, négatif si japonais avancé requis
+        """
+        weights = self.weights['japanese']
+        score = 0
+
+        # Vérifier les expressions positives
+        positives_found = []
+        for _, matches in scan.finditer('japanese_positive'):
+            for match in matches:
+                positives_found.append(match.group(0))
+                score += weights['positive_match']
+
+        if positives_found:
+            logger.info(f"Expressions positives trouvées ({len(positives_found)}): {', '.join(positives_found[:3])}")
+
+        # Vérifier les expressions négatives
+        negatives_found = []
+        for _, matches in scan.finditer('japanese_negative'):
+            for match in matches:
+                negatives_found.append(match.group(0))
+                score += weights['negative_match']
+
+        if negatives_found:
+            logger.info(f"Expressions négatives trouvées ({len(negatives_found)}): {', '.join(negatives_found[:3])}")
+
+        # Vérifier les niveaux JLPT
+        for rule, match in scan.search('jlpt'):
+            if match:
+                score += weights['jlpt'][rule.label]
+                logger.info(f"Exigence JLPT {rule.label}: {weights['jlpt'][rule.label]:+d}")
+
+        # Analyse contextuelle pour les situations ambiguës
+        for rule, match in scan.search('japanese_context_positive'):
+            if match:
+                score += weights['context_positive']
+                logger.info(f"Contexte positif trouvé: {rule.pattern}")
+
+        for rule, match in scan.search('japanese_context_negative'):
+            if match:
+                score += weights['context_negative']
+                logger.info(f"Contexte négatif trouvé: {rule.pattern}")
+
+        # Bonus: si plusieurs indicateurs positifs sans négatifs
+        if len(positives_found) >= weights['positive_only_min'] and len(negatives_found) == 0:
+            score += weights['positive_only_bonus']
+            logger.info("Bonus: Multiples indicateurs positifs sans négatifs")
+
+        return score
+
+    def score_international(self, scan):
+        """
+        Analyse si l'environnement de travail est international
+        """
+        weights = self.weights['international']
+        score = 0
+
+        patterns_found = []
+        for _, matches in scan.finditer('international'):
+            for match in matches:
+                patterns_found.append(match.group(0))
+                score += weights['match']
+
+        if patterns_found:
+            logger.info(f"Indicateurs d'environnement international trouvés ({len(patterns_found)}): {', '.join(patterns_found[:5])}")
+
+        # Bonus si multiples mentions de mots-clés globaux
+        keyword_count = scan.count_keywords(self.keywords['global'])
+        if keyword_count >= weights['keyword_min']:
+            score += weights['keyword_bonus']
+            logger.info(f"Bonus: {keyword_count} mots-clés globaux trouvés")
+
+        # Limiter le score maximum pour cette catégorie
+        return min(score, weights['cap'])
+
+    def score_benefits(self, scan):
+        """
+        Analyse les avantages spécifiques pour les expatriés
+        """
+        weights = self.weights['benefits']
+        score = 0
+
+        benefits_found = []
+        for _, matches in scan.finditer('expat_benefits'):
+            for match in matches:
+                benefits_found.append(match.group(0))
+                score += weights['match']
+
+        if benefits_found:
+            logger.info(f"Avantages pour expatriés trouvés ({len(benefits_found)}): {', '.join(benefits_found[:5])}")
+
+        for rule, match in scan.search('expat_context'):
+            if match:
+                score += weights['context']
+                logger.info(f"Contexte d'avantages trouvé: {rule.pattern}")
+
+        # Limiter le score maximum pour cette catégorie
+        return min(score, weights['cap'])
+
+    def score_leave_policy(self, scan):
+        """
+        Analyse la politique de congés (standard japonais: 10 jours après 6 mois)
+        Retourne (score, jours_de_congés)
+        """
+        weights = self.weights['leave']
+        score = 0
+        days_of_leave = None
+
+        leave_patterns_found = []
+        for _, matches in scan.finditer('generous_leave'):
+            for match in matches:
+                leave_patterns_found.append(match.group(0))
+                score += weights['match']
+
+        if leave_patterns_found:
+            logger.info(f"Politiques de congés favorables trouvées ({len(leave_patterns_found)}): {', '.join(leave_patterns_found[:5])}")
+
+        # Essayer d'extraire le nombre de jours de congés
+        for _, days_match in scan.search('leave_days'):
+            if days_match:
+                try:
+                    days = int(days_match.group(1))
+                    logger.info(f"Nombre de jours de congés mentionné: {days}")
+                    days_of_leave = days
+
+                    # Bonus pour les congés vraiment généreux (paliers par ordre décroissant)
+                    for tier in weights['days_bonus']:
+                        if days >= tier['min_days']:
+                            score += tier['bonus']
+                            logger.info(f"Bonus de {tier['bonus']} pour {days} jours de congés")
+                            break
+                except:
+                    pass
+
+        # Bonus pour des combinaisons de mots-clés liés aux congés
+        leave_keyword_count = scan.count_keywords(self.keywords['leave'])
+        if leave_keyword_count >= weights['keyword_min']:
+            score += weights['keyword_bonus']
+            logger.info(f"Bonus: {leave_keyword_count} mots-clés de congés trouvés")
+
+        # Limiter le score maximum pour cette catégorie
+        return min(score, weights['cap']), days_of_leave
+
+    def score_language(self, scan):
+        """
+        Analyse la langue utilisée dans l'offre et détecte les mentions de français
+        qui peuvent indiquer une entreprise francophone
+        """
+        weights = self.weights['language']
+        score = 0
+
+        french_matches = []
+        for _, matches in scan.finditer('french'):
+            for match in matches:
+                french_matches.append(match.group(0))
+                score += weights['french_match']
+
+        if french_matches:
+            logger.info(f"Indices de français trouvés ({len(french_matches)}): {', '.join(french_matches)}")
+            score += weights['french_bonus']  # Bonus supplémentaire pour du français
+
+        # Analyse de la langue de rédaction (sur le début de la description)
+        try:
+            lang = language_detector.detect_language(scan.description[:weights['detect_chars']])
+
+            if lang in weights['languages']:
+                score += weights['languages'][lang]
+                logger.info(f"Offre rédigée en {LANGUAGE_NAMES.get(lang, lang)}")
+        except:
+            logger.warning("Impossible de détecter la langue de l'offre")
+
+        return min(score, weights['cap'])
+
+    def score_sentiment(self, scan):
+        """
+        Analyse le sentiment général de l'offre vis-à-vis des étrangers
+        """
+        weights = self.weights['sentiment']
+        score = 0
+
+        positive_found = []
+        for _, matches in scan.finditer('sentiment_positive'):
+            for match in matches:
+                positive_found.append(match.group(0))
+                score += weights['phrase_positive']
+
+        if positive_found:
+            logger.info(f"Expressions positives pour étrangers trouvées ({len(positive_found)}): {', '.join(positive_found[:3])}")
+
+        negative_found = []
+        for _, matches in scan.finditer('sentiment_negative'):
+            for match in matches:
+                negative_found.append(match.group(0))
+                score += weights['phrase_negative']
+
+        if negative_found:
+            logger.info(f"Expressions négatives pour étrangers trouvées ({len(negative_found)}): {', '.join(negative_found[:3])}")
+
+        # Analyse simple des sentiments basée sur des mots-clés
+        positive_word_count = sum(1 for _, match in scan.search('sentiment_positive_words') if match)
+        negative_word_count = sum(1 for _, match in scan.search('sentiment_negative_words') if match)
+
+        # Bonus si beaucoup de mots positifs
+        if positive_word_count > negative_word_count + weights['word_margin']:
+            score += weights['positive_bonus']
+            logger.info(f"Sentiment général positif: {positive_word_count} mots positifs vs {negative_word_count} négatifs")
+
+        # Malus si beaucoup de mots négatifs
+        if negative_word_count > positive_word_count:
+            score += weights['negative_malus']
+            logger.info(f"Sentiment général négatif: {negative_word_count} mots négatifs vs {positive_word_count} positifs")
+
+        return min(score, weights['cap'])
+
+    def detect_additional_benefits(self, scan):
+        """
+        Détecte d'autres avantages qui pourraient être intéressants pour les expatriés
+        Utilisé pour information uniquement, n'affecte pas le score
+        """
+        benefits = []
+        for rule, match in scan.search('additional_benefits'):
+            if match:
+                benefits.append(rule.label)
+                logger.info(f"Avantage supplémentaire détecté: {rule.label}")
+        return benefits
+
+
+# Empreinte de ce module, dont l'analyse des motifs produit les littéraux de l'artefact
+_source_version = None
+
+
+def source_version():
+    """Empreinte du code source du moteur (rule_engine.py)"""
+    global _source_version
+    if _source_version is None:
+        with open(__file__, 'rb') as f:
+            _source_version = hashlib.sha256(f.read()).hexdigest()
+    return _source_version
+
+
+def rules_fingerprint(data):
+    """
+    Empreinte du contenu d'un fichier de règles, du format de l'artefact et du
+    code du moteur : l'artefact contient les littéraux déduits par analyze_pattern
+    """
+    return hashlib.sha256(data + f"format={ARTIFACT_FORMAT};source={source_version()}".encode()).hexdigest()
+
+
+def artifact_path(rules_file):
+    """Chemin de l'artefact compilé d'un fichier de règles"""
+    return os.path.splitext(rules_file)[0] + ARTIFACT_SUFFIX
+
+
+def compile_rules(rules_file=None):
+    """
+    Moteur compilé pour un fichier de règles.
+    L'artefact pickle est réutilisé si son empreinte correspond au contenu
+    actuel du fichier ; sinon les règles sont compilées et l'artefact réécrit.
+    """
+    rules_file = rules_file or default_rules_file()
+    with open(rules_file, 'rb') as f:
+        data = f.read()
+    fingerprint = rules_fingerprint(data)
+    artifact = artifact_path(rules_file)
+
+    try:
+        with open(artifact, 'rb') as f:
+            compiled = pickle.load(f)
+        if compiled.fingerprint == fingerprint:
+            return compiled
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+        # Artefact absent, illisible ou d'une autre version du code: recompilation
+        pass
+
+    engine = RuleEngine(json.loads(data), fingerprint)
+    # Fichier temporaire propre au processus (processus de re-scoring concurrents)
+    temporary = f"{artifact}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, 'wb') as f:
+            pickle.dump(engine, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, artifact)
+    except OSError as e:
+        logger.warning(f"Impossible d'enregistrer l'artefact des règles {artifact}: {e}")
+    logger.info(f"Règles compilées depuis {rules_file} ({fingerprint[:12]})")
+    return engine
+
+
+# Fichier de règles du moteur partagé (None: variable GAIJIN_RULES_FILE, sinon scoring_rules.json)
+_rules_file = None
+
+
+def set_rules_file(path):
+    """Change le fichier de règles du moteur partagé (rechargé au prochain accès)"""
+    global _rules_file, _checked_at
+    _rules_file = path
+    _checked_at = None
+
+
+def default_rules_file():
+    return _rules_file or os.environ.get(RULES_FILE_ENV) or DEFAULT_RULES_FILE
+
+
+# Moteur partagé, compilé au premier accès et rechargé quand le fichier de règles change
+_engine = None
+_engine_stat = None
+_checked_at = None
+_lock = threading.Lock()
+
+
+def _stat(path):
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def get_engine():
+    """
+    Moteur partagé (compilé au premier appel, pas à l'import du module).
+    Le fichier de règles est vérifié au plus une fois par RELOAD_INTERVAL ; s'il a
+    changé, le moteur est recompilé. Une modification invalide est journalisée et
+    le moteur précédent est conservé.
+    """
+    global _engine, _engine_stat, _checked_at
+    now = time.monotonic()
+    if _engine is not None and _checked_at is not None and now - _checked_at < RELOAD_INTERVAL:
+        return _engine
+    with _lock:
+        _checked_at = now
+        rules_file = default_rules_file()
+        try:
+            stat = _stat(rules_file)
+            if _engine is None or stat != _engine_stat:
+                # Noté avant la compilation : une modification invalide n'est signalée qu'une fois
+                _engine_stat = stat
+                engine = compile_rules(rules_file)
+                if _engine is not None and engine.fingerprint != _engine.fingerprint:
+                    logger.info(f"Règles rechargées depuis {rules_file} ({engine.fingerprint[:12]})")
+                _engine = engine
+        except (OSError, ValueError, KeyError, re.error) as e:
+            if _engine is None:
+                raise
+            logger.error(f"Règles invalides dans {rules_file}, règles précédentes conservées: {e}")
+        return _engine
+
+
+def __getattr__(name):
+    if name == 'ENGINE':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Empreinte des sources qui déterminent les scores au-delà du fichier de règles
+# (logique des analyseurs et détection de langue)
+_code_version = None
+
+
+def rules_version():
+    """Version des règles du moteur partagé (change dès qu'un motif, une pondération ou l'analyse change)"""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for path in (__file__, language_detector.__file__):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()
+    return hashlib.sha256((_code_version + get_engine().fingerprint).encode()).hexdigest()
+
+
+def evaluate(description):
+    """Évalue une description avec le moteur partagé (voir RuleEngine.evaluate)"""
+    return get_engine().evaluate(description)
+
+
+def build_job_record(title, company, location, url, is_friendly, details):
+    """Construit la ligne d'export d'une offre à partir du résultat de evaluate"""
+    return {
+        'title': title,
+        'company': company,
+        'location': location,
+        'url': url,
+        'is_gaijin_friendly': 'Oui' if is_friendly else 'Non',
+        'score_total': details['score_total'],
+        'score_japonais': details['score_japonais'],
+        'score_international': details['score_international'],
+        'score_avantages': details['score_avantages'],
+        'score_conges': details['score_conges'],
+        'score_langue': details['score_langue'],
+        'score_sentiment': details['score_sentiment'],
+        'jours_conges': details['jours_conges'] if details['jours_conges'] else 'Non spécifié',
+        'avantages': details['avantages']
+    }
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    parser = argparse.ArgumentParser(description="Compilation et vérification du fichier de règles de scoring")
+    parser.add_argument("rules", nargs='?', default=None,
+                        help=f"Fichier de règles JSON (défaut: variable {RULES_FILE_ENV}, sinon {os.path.basename(DEFAULT_RULES_FILE)})")
+    args = parser.parse_args()
+
+    rules_file = args.rules or default_rules_file()
+    try:
+        engine = compile_rules(rules_file)
+    except (OSError, ValueError, KeyError, re.error) as e:
+        logger.error(f"Règles invalides dans {rules_file}: {e}")
+        return 1
+    for name, rules in engine.tables.items():
+        print(f"{name:<32} {len(rules):>4} règles")
+    print(f"Empreinte: {engine.fingerprint}")
+    print(f"Artefact: {artifact_path(rules_file)}")
+    return 0
+
+
+if __name__ == "__main__":
+    # L'artefact doit référencer rule_engine.RuleEngine, pas __main__.RuleEngine
+    import rule_engine
+    sys.exit(rule_engine.main())
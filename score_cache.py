@@ -0,0 +1,139 @@
+"""
+Cache persistant des scores gaijin-friendly.
+
+Une même description revient souvent sous plusieurs identifiants (republications,
+offres multi-sites) et d'une exécution à l'autre. Le résultat de
+RuleEngine.evaluate est enregistré dans une base SQLite sous l'empreinte de la
+description normalisée (rule_engine.normalize, le texte que RuleEngine.evaluate
+analyse) : un texte identique est servi sans nouvelle analyse, avec le score
+qu'une évaluation sans cache lui donnerait.
+Chaque entrée porte la version des règles (rule_engine.rules_version) : seules
+les entrées de la version courante sont servies, y compris après un
+rechargement des règles en cours d'exécution. Les entrées des autres versions
+sont conservées (plusieurs fichiers de règles peuvent partager le cache) et ne
+sont supprimées que par prune, lorsqu'elles ont plus de DEFAULT_PRUNE_DAYS
+jours.
+
+Exemple:
+    cache = ScoreCache()
+    result = cache.get(description)
+    if result is None:
+        result = rule_engine.evaluate(description)
+        cache.put(description, *result)
+"""
+
+import os
+import time
+import json
+import hashlib
+import logging
+import sqlite3
+import threading
+
+import rule_engine
+from rule_engine import normalize
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = os.path.join("exports", "score_cache.db")
+# Âge (jours) à partir duquel prune supprime les entrées d'autres règles
+DEFAULT_PRUNE_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    key TEXT NOT NULL,              -- empreinte de la description normalisée
+    rules_version TEXT NOT NULL,
+    is_gaijin_friendly INTEGER NOT NULL,
+    details TEXT NOT NULL,          -- détails des scores (JSON)
+    stored_at REAL NOT NULL,        -- date d'enregistrement (secondes depuis l'époque)
+    PRIMARY KEY (key, rules_version)
+);
+"""
+
+
+def content_key(text):
+    """Empreinte d'une description déjà normalisée"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ScoreCache:
+    """Base SQLite des résultats d'évaluation, indexée par empreinte de la description"""
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, rules_version=None):
+        self.path = path
+        # Version imposée, ou None pour suivre les règles du moteur partagé
+        self.fixed_version = rules_version
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Partagé par les threads du scraper (backends http et async)
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(scores)")}
+        if columns and 'stored_at' not in columns:
+            # Ancien format (une seule version par description): le cache est reconstruit
+            logger.info("Cache des scores: ancien format, cache vidé")
+            with self.connection:
+                self.connection.execute("DROP TABLE scores")
+        self.connection.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+        logger.info(f"Cache des scores: {path} ({len(self)} entrées, règles {self.rules_version[:12]})")
+
+    @property
+    def rules_version(self):
+        return self.fixed_version or rule_engine.rules_version()
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def get(self, description):
+        """(is_friendly, détails) enregistrés pour cette description, ou None"""
+        key = content_key(normalize(description))
+        version = self.rules_version
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT is_gaijin_friendly, details FROM scores WHERE key = ? AND rules_version = ?", (key, version)
+            ).fetchone()
+            self.stats['hits' if row else 'misses'] += 1
+        return (bool(row[0]), json.loads(row[1])) if row else None
+
+    def put_many(self, items):
+        """Enregistre [(description, is_friendly, détails)] en une transaction"""
+        version = self.rules_version
+        stored_at = time.time()
+        rows = [
+            (content_key(normalize(description)), version, int(is_friendly), json.dumps(details), stored_at)
+            for description, is_friendly, details in items
+        ]
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scores (key, rules_version, is_gaijin_friendly, details, stored_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def put(self, description, is_friendly, details):
+        """Enregistre le résultat d'une description (validé immédiatement)"""
+        self.put_many([(description, is_friendly, details)])
+
+    def prune(self, max_age_days=DEFAULT_PRUNE_DAYS):
+        """
+        Supprime les entrées d'autres versions des règles enregistrées il y a plus de max_age_days jours.
+        Retourne le nombre d'entrées supprimées
+        """
+        cutoff = time.time() - max_age_days * 24 * 3600
+        with self.lock, self.connection:
+            pruned = self.connection.execute(
+                "DELETE FROM scores WHERE rules_version != ? AND stored_at < ?", (self.rules_version, cutoff)
+            ).rowcount
+        logger.info(f"Cache des scores: {pruned} entrées d'autres règles supprimées "
+                    f"(plus de {max_age_days} jours)")
+        return pruned
+
+    def log_summary(self):
+        total = self.stats['hits'] + self.stats['misses']
+        logger.info(f"Cache des scores: {self.stats['hits']}/{total} descriptions déjà évaluées")
+
+    def close(self):
+        self.connection.close()
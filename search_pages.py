@@ -0,0 +1,59 @@
+"""
+Construction des URL de pages de résultats de recherche LinkedIn.
+
+Chaque page est adressée directement par son décalage start= (25 offres par page),
+à partir des paramètres réels de la recherche : passer à la page suivante coûte
+une seule navigation, et les pages peuvent être préchargées ou réparties entre
+plusieurs navigateurs.
+"""
+
+from urllib.parse import urlencode
+
+import linkedin_urls
+
+SEARCH_PATH = "/jobs/search"
+
+# Nombre d'offres par page de résultats
+PAGE_SIZE = 25
+
+# Identifiants géographiques LinkedIn connus (sinon la localisation est passée en texte)
+GEO_IDS = {
+    "Tokyo, Japan": "101355337",
+}
+
+
+class SearchPaginator:
+    """
+    URL des pages de résultats pour une recherche donnée
+    (base_url par défaut: page de recherche sur l'adresse de base courante)
+    """
+
+    def __init__(self, keywords, location="Tokyo, Japan", distance=25, base_url=None, page_size=PAGE_SIZE):
+        self.keywords = list(keywords)
+        self.location = location
+        self.distance = distance
+        self.base_url = base_url or linkedin_urls.url(SEARCH_PATH)
+        self.page_size = page_size
+
+    def params(self, page=0):
+        """Paramètres de la requête pour la page demandée (0 pour la première)"""
+        params = {
+            'keywords': " OR ".join(self.keywords),
+            'distance': self.distance,
+        }
+        geo_id = GEO_IDS.get(self.location)
+        if geo_id:
+            params['geoId'] = geo_id
+        else:
+            params['location'] = self.location
+        if page > 0:
+            params['start'] = page * self.page_size
+        return params
+
+    def url(self, page=0):
+        """URL de la page demandée (0 pour la première)"""
+        return f"{self.base_url}?{urlencode(self.params(page))}"
+
+    def urls(self, max_pages):
+        """URL des max_pages premières pages"""
+        return [self.url(page) for page in range(max_pages)]
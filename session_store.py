@@ -0,0 +1,101 @@
+"""
+Persistance des cookies de session LinkedIn.
+
+Après une connexion réussie, les cookies du driver sont enregistrés sur disque ;
+au démarrage suivant ils sont restaurés dans le navigateur, ce qui évite la page
+de connexion (et ses vérifications de sécurité) tant que la session est valide.
+"""
+
+import os
+import json
+import time
+import logging
+from urllib.parse import urlparse
+
+import linkedin_urls
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SESSION_FILE = ".linkedin_session.json"
+
+# Page ouverte pour poser les cookies sur le bon domaine (relative à l'adresse de base)
+COOKIE_DOMAIN_PATH = "/"
+
+# Cookie d'authentification LinkedIn: sans lui, la session n'est pas restaurable
+AUTH_COOKIE = "li_at"
+
+
+def cookie_host():
+    """Nom d'hôte de l'adresse de base courante (www.linkedin.com par défaut)"""
+    return urlparse(linkedin_urls.base_url()).hostname or ''
+
+
+def domain_matches(host, cookie_domain):
+    """Un cookie de domaine '.linkedin.com' vaut pour www.linkedin.com (RFC 6265, 5.1.3)"""
+    cookie_domain = cookie_domain.lstrip('.').lower()
+    return bool(cookie_domain) and (host == cookie_domain or host.endswith('.' + cookie_domain))
+
+
+def session_cookies(driver, host=None):
+    """Cookies de session du driver, limités à l'hôte de l'adresse de base (ou à host)"""
+    host = (host or cookie_host()).lower()
+    return [cookie for cookie in driver.get_cookies() if domain_matches(host, cookie.get('domain', ''))]
+
+
+def add_cookies(driver, cookies, limiter=None):
+    """
+    Pose les cookies dans le driver (la page du domaine est ouverte au préalable,
+    au rythme du limiteur de débit s'il est fourni)
+    """
+    if limiter:
+        limiter.acquire()
+    driver.get(linkedin_urls.url(COOKIE_DOMAIN_PATH))
+    added = 0
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+            added += 1
+        except Exception as e:
+            logger.debug(f"Cookie {cookie.get('name')} ignoré ({str(e)})")
+    return added
+
+
+class SessionStore:
+    """Fichier JSON contenant les cookies de la dernière session authentifiée"""
+
+    def __init__(self, path=DEFAULT_SESSION_FILE):
+        self.path = path
+
+    def save(self, cookies):
+        """Enregistre les cookies (fichier lisible uniquement par l'utilisateur)"""
+        data = {'saved_at': time.time(), 'cookies': cookies}
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        logger.info(f"Session enregistrée dans {self.path} ({len(cookies)} cookies)")
+
+    def load(self):
+        """
+        Retourne les cookies enregistrés encore valides, ou une liste vide si le
+        fichier est absent, illisible ou si le cookie d'authentification a expiré
+        """
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                cookies = json.load(f).get('cookies', [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Session enregistrée illisible ({str(e)})")
+            return []
+
+        now = time.time()
+        cookies = [cookie for cookie in cookies if cookie.get('expiry') is None or cookie['expiry'] > now]
+        if not any(cookie.get('name') == AUTH_COOKIE for cookie in cookies):
+            logger.info("Session enregistrée expirée")
+            return []
+        return cookies
+
+    def clear(self):
+        """Supprime la session enregistrée"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,46 @@
+"""Arrêt du téléchargement asynchrone quand l'étape de scoring échoue"""
+
+import threading
+
+import pytest
+
+from async_fetcher import AsyncJobFetcher
+
+
+class FakeFetcher(AsyncJobFetcher):
+    """Offres analysées sans requête HTTP"""
+
+    async def fetch(self, session, job_id):
+        return {'job_id': job_id}
+
+
+def run_with_timeout(fetcher, job_ids, handle, timeout=10):
+    outcome = {}
+
+    def target():
+        try:
+            fetcher.run(job_ids, handle)
+        except Exception as e:
+            outcome['error'] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "run() bloqué"
+    return outcome.get('error')
+
+
+def test_handle_receives_every_job():
+    seen = []
+    error = run_with_timeout(FakeFetcher(concurrency=2), [str(i) for i in range(50)],
+                             lambda position, details: seen.append(details['job_id']))
+    assert error is None
+    assert sorted(seen, key=int) == [str(i) for i in range(50)]
+
+
+def test_handle_error_stops_producers():
+    def handle(position, details):
+        raise OSError("disque plein")
+
+    error = run_with_timeout(FakeFetcher(concurrency=2), [str(i) for i in range(50)], handle)
+    assert isinstance(error, OSError)
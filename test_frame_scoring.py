@@ -0,0 +1,60 @@
+"""
+Parité de score_dataframe avec RuleEngine.evaluate.
+
+Le DataFrame mélange des lignes dont casefold conserve la longueur (alignées,
+évaluées aux positions des préfixes) et des lignes non alignées ('ß'), ainsi
+que des doublons et des chiffres pleine chasse.
+"""
+
+import random
+
+import pandas as pd
+
+import rule_engine
+from frame_scoring import SCORE_COLUMNS, score_dataframe
+from benchmark_scoring import PHRASES, generate_corpus
+
+
+def descriptions():
+    rng = random.Random(11)
+    phrases = [phrase for language_phrases in PHRASES.values() for phrase in language_phrases]
+    texts = ["Commuting allowance", "Straße commuting allowance", "有給休暇２０日, up to ２０ days of paid leave",
+             "Up to 25 days of leave. Straße", "", "Work-life  balance, generous benefits"]
+    for _ in range(60):
+        text = " ".join(rng.sample(phrases, rng.randint(1, 6)))
+        if rng.random() < 0.3:
+            text = text.upper()
+        if rng.random() < 0.4:
+            text = "Straße " + text
+        texts.append(text)
+    texts += [description for _, description in generate_corpus(12, seed=11, min_size=256, max_size=4096)]
+    # Doublons: chaque texte distinct n'est évalué qu'une fois
+    return texts + texts[:10]
+
+
+def expected_row(engine, description):
+    is_friendly, details = engine.evaluate(description)
+    row = dict(details, is_gaijin_friendly=is_friendly)
+    row['jours_conges'] = row['jours_conges'] if row['jours_conges'] is not None else pd.NA
+    return [row[column] for column in SCORE_COLUMNS]
+
+
+def test_score_dataframe_matches_evaluate():
+    engine = rule_engine.get_engine()
+    texts = descriptions()
+    result = score_dataframe(pd.DataFrame({'description': texts}), engine=engine)
+
+    assert list(result.columns) == SCORE_COLUMNS
+    assert result['is_gaijin_friendly'].dtype == bool
+    for index, description in enumerate(texts):
+        actual = result.iloc[index].tolist()
+        expected = expected_row(engine, description)
+        assert [None if pd.isna(value) else value for value in actual] == \
+               [None if pd.isna(value) else value for value in expected], description
+
+
+def test_score_dataframe_keeps_index():
+    df = pd.DataFrame({'description': ["Visa sponsorship available", None]}, index=['a', 'a'])
+    result = score_dataframe(df)
+    assert list(result.index) == ['a', 'a']
+    assert result['jours_conges'].isna().all()
@@ -0,0 +1,20 @@
+"""Suspension partagée entre le limiteur des navigateurs et celui des requêtes HTTP"""
+
+from rate_limiter import RateLimiter
+
+
+def test_sibling_shares_backoff():
+    browser = RateLimiter(rate=0.5, jitter=0, backoff_base=30)
+    http = browser.sibling(2.0)
+    http.throttled("réponse HTTP 429")
+    assert browser.reserve() >= 29
+    browser.success()
+    assert http.backoff.strikes == 0
+
+
+def test_sibling_keeps_own_rate():
+    browser = RateLimiter(rate=0.5, burst=1, jitter=0)
+    http = browser.sibling(100.0, burst=1)
+    browser.reserve()
+    assert http.reserve() == 0
+    assert browser.reserve() > 1
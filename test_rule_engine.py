@@ -0,0 +1,73 @@
+"""
+Parité du moteur de règles avec le module re.
+
+Chaque règle évaluée par RuleScan (présélection par littéraux et préfixes)
+doit donner les mêmes correspondances que re.finditer et re.search appliqués
+directement à la description.
+"""
+
+import json
+import random
+
+import pytest
+
+import rule_engine
+from benchmark_scoring import PHRASES, generate_corpus
+
+# Motifs valides que l'analyse des littéraux ne prend pas (ou mal) en charge
+EXTRA_PATTERNS = [
+    r'(?i:global) team',
+    r'(?#c)diverse team',
+    r'(?-i:Tokyo) office',
+    r'(?x) visa \s+ sponsorship',
+    r'(?i)\x76isa sponsorship',
+    r'(?i)(?P<level>n[1-5])\s*\(?jlpt\)?|jlpt\s*(?P=level)?',
+    r'(?i)(?:remote|hybrid)\s+work(?=\s|,)',
+]
+
+
+def variants(text):
+    """Le texte tel quel, en majuscules, et non aligné après casefold ('ß')"""
+    return [text, text.upper(), "Straße " + text, "İstanbul " + text.swapcase()]
+
+
+def descriptions():
+    phrases = [phrase for language_phrases in PHRASES.values() for phrase in language_phrases]
+    texts = [variant for phrase in phrases for variant in variants(phrase)]
+    texts += ["GLOBAL team", "diverse team", "Visa  SPONSORSHIP", "Tokyo office", "TOKYO office",
+              "N2 (JLPT) required", "jlpt N1"]
+    texts += [description for _, description in generate_corpus(20, seed=7, min_size=256, max_size=2048)]
+    rng = random.Random(7)
+    texts += [" ".join(rng.sample(phrases, 4)).swapcase() for _ in range(50)]
+    return texts
+
+
+def spans(matches):
+    return [(match.span(), match.groups()) for match in matches]
+
+
+def assert_parity(engine, texts):
+    for text in texts:
+        scan = engine.scan(text)
+        for table in engine.tables:
+            for rule, matches in scan.finditer(table):
+                assert spans(matches) == spans(rule.regex.finditer(text)), (rule.pattern, text)
+            for rule, match in scan.search(table):
+                expected = rule.regex.search(text)
+                assert spans([match] if match else []) == spans([expected] if expected else []), (rule.pattern, text)
+
+
+def test_default_rules_match_re():
+    assert_parity(rule_engine.compile_rules(rule_engine.DEFAULT_RULES_FILE), descriptions())
+
+
+def test_unsupported_constructs_match_re():
+    with open(rule_engine.DEFAULT_RULES_FILE, encoding='utf-8') as f:
+        rules = json.load(f)
+    rules['tables']['international'] = rules['tables']['international'] + EXTRA_PATTERNS
+    assert_parity(rule_engine.RuleEngine(rules), descriptions())
+
+
+@pytest.mark.parametrize('pattern', EXTRA_PATTERNS[:5])
+def test_unsupported_constructs_disable_prefilter(pattern):
+    assert rule_engine.analyze_pattern(pattern) == ([], None)
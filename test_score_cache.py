@@ -0,0 +1,46 @@
+"""Le cache des scores ne change pas le résultat de l'évaluation"""
+
+from gaijin_scorer import GaijinScorer
+from score_cache import ScoreCache
+
+DESCRIPTIONS = [
+    "Work-life  balance, generous benefits",
+    "Work-life balance,\tgenerous benefits  \r\n",
+    "  Visa sponsorship　and relocation support. No Japanese required.",
+]
+
+
+def test_cached_scores_match_uncached(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.db"))
+    uncached = GaijinScorer()
+    cached = GaijinScorer(cache=cache)
+    expected = uncached.score_many(DESCRIPTIONS)
+    # Première passe: évaluation et enregistrement ; seconde passe: servie par le cache
+    for _ in range(2):
+        assert [cached.is_gaijin_friendly(description) for description in DESCRIPTIONS] == expected
+    assert [uncached.is_gaijin_friendly(description) for description in DESCRIPTIONS] == expected
+    cache.close()
+
+
+def test_analyzers_match_full_score():
+    scorer = GaijinScorer()
+    for description in DESCRIPTIONS:
+        _, details = scorer.is_gaijin_friendly(description)
+        assert scorer.analyze_leave_policy(description) == (details['score_conges'], details['jours_conges'])
+        assert scorer.analyze_international_environment(description) == details['score_international']
+        assert scorer.analyze_language(description) == details['score_langue']
+
+
+def test_other_rules_versions_are_kept_until_pruned(tmp_path):
+    path = str(tmp_path / "scores.db")
+    first = ScoreCache(path, rules_version="a")
+    first.put(DESCRIPTIONS[0], True, {'score_total': 20})
+    first.close()
+    second = ScoreCache(path, rules_version="b")
+    second.put(DESCRIPTIONS[0], False, {'score_total': 15})
+    assert second.prune(max_age_days=1) == 0
+    second.close()
+    first = ScoreCache(path, rules_version="a")
+    assert first.get(DESCRIPTIONS[0]) == (True, {'score_total': 20})
+    assert first.prune(max_age_days=0) == 1
+    first.close()
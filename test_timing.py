@@ -0,0 +1,19 @@
+"""Percentiles par rang le plus proche"""
+
+import pytest
+
+from timing import percentile
+
+
+@pytest.mark.parametrize('values, q, expected', [
+    (range(1, 11), 50, 5),
+    (range(1, 101), 95, 95),
+    (range(1, 101), 7, 7),
+    (range(1, 101), 99, 99),
+    (range(1, 11), 0, 1),
+    (range(1, 11), 100, 10),
+    ([3.0], 95, 3.0),
+    ([4, 1, 3, 2], 50, 2),
+])
+def test_percentile_nearest_rank(values, q, expected):
+    assert percentile(values, q) == expected
@@ -0,0 +1,115 @@
+"""
+Chronométrage des phases d'une exécution.
+
+Les phases du pipeline (navigation, défilement, attente du panneau, extraction,
+scoring, export...) sont mesurées par un gestionnaire de contexte ou un
+décorateur, avec un coût négligeable (un appel à perf_counter de part et
+d'autre). Le chronomètre global est désactivé par défaut (re-scoring,
+benchmarks) : le scraper l'active pour son exécution. En fin d'exécution, un
+résumé par phase (nombre, total, moyenne, p95) est affiché et enregistré en
+JSON pour orienter les optimisations.
+
+Exemple:
+    with timing.phase('scrape.scroll'):
+        ...
+
+    @timing.timed('export.csv')
+    def export_to_csv(...):
+        ...
+"""
+
+import os
+import json
+import math
+import time
+import logging
+import threading
+import functools
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, q):
+    """Percentile q (0-100) par rang le plus proche"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(q * len(ordered) / 100) - 1))
+    return ordered[rank]
+
+
+class PhaseTimer:
+    """Durées mesurées par phase, partagées entre threads"""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.samples.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def phase(self, name):
+        """Mesure la durée du bloc (exceptions comprises)"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """Décorateur: mesure chaque appel de la fonction sous le nom de phase donné"""
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                with self.phase(name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self):
+        """{phase: {count, total, mean, p95}} en secondes, phases triées par nom"""
+        with self.lock:
+            samples = {name: list(values) for name, values in self.samples.items()}
+        return {
+            name: {
+                'count': len(values),
+                'total': sum(values),
+                'mean': sum(values) / len(values),
+                'p95': percentile(values, 95),
+            }
+            for name, values in sorted(samples.items())
+        }
+
+    def report(self):
+        """Résumé sous forme de tableau texte"""
+        lines = [f"{'Phase':<32} {'nombre':>8} {'total s':>10} {'moyenne ms':>11} {'p95 ms':>10}"]
+        for name, stats in self.summary().items():
+            lines.append(f"{name:<32} {stats['count']:>8} {stats['total']:>10.2f} "
+                         f"{stats['mean'] * 1000:>11.1f} {stats['p95'] * 1000:>10.1f}")
+        return "\n".join(lines)
+
+    def write(self, path):
+        """Enregistre le résumé en JSON"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        logger.info(f"Temps par phase enregistrés dans {path}")
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+
+
+# Chronomètre global du processus (activé par le scraper)
+TIMER = PhaseTimer(enabled=False)
+phase = TIMER.phase
+timed = TIMER.timed
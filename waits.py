@@ -0,0 +1,142 @@
+"""
+Attentes conditionnelles pour le driver Selenium.
+
+Remplace les time.sleep fixes du scraper par des attentes WebDriverWait sur les
+conditions qui comptent réellement (panneau de l'offre chargé, texte mis à jour,
+URL modifiée...). Chaque attente a une borne supérieure configurable et garde la
+durée de la pause fixe qu'elle remplace, ce qui permet de mesurer le temps gagné.
+"""
+
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Stratégie de localisation WebDriver (valeur de By.CSS_SELECTOR) : selenium n'est
+# importé qu'au moment d'attendre, pas au chargement du module
+CSS_SELECTOR = "css selector"
+
+# Bornes supérieures par défaut (secondes) pour chaque type d'attente
+DEFAULT_TIMEOUTS = {
+    'page_load': 15,       # chargement d'une page de recherche
+    'login': 20,           # traitement de la connexion
+    'popup': 3,            # fermeture d'un popup
+    'scroll': 2,           # chargement de nouvelles offres après défilement
+    'job_list': 5,         # présence de la liste des offres
+    'job_panel': 10,       # panneau de détails mis à jour pour la nouvelle offre
+    'description': 3,      # texte de la description disponible
+}
+
+# Sélecteurs utilisés par les conditions
+JOB_CARD_SELECTOR = "a.job-card-list__title--link, .job-card-container__link, [data-job-id]"
+JOB_PANEL_SELECTOR = "div.job-view-layout.jobs-details"
+DESCRIPTION_SELECTOR = "div.jobs-description__content, div.jobs-description-content, .jobs-description, #job-details"
+
+
+def _first_text(driver, selector):
+    """Texte du premier élément correspondant au sélecteur, ou '' s'il n'existe pas"""
+    from selenium.common.exceptions import StaleElementReferenceException
+    try:
+        elements = driver.find_elements(CSS_SELECTOR, selector)
+        return elements[0].text.strip() if elements else ''
+    except StaleElementReferenceException:
+        return ''
+
+
+def page_ready(driver):
+    """Condition: le document est entièrement chargé"""
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+def job_cards_present(driver):
+    """Condition: au moins une carte d'offre est présente dans la liste"""
+    return bool(driver.find_elements(CSS_SELECTOR, JOB_CARD_SELECTOR))
+
+
+def height_changed(previous_height):
+    """Condition: la hauteur de la page a changé (nouvelles offres chargées)"""
+    def condition(driver):
+        return driver.execute_script("return document.body.scrollHeight") != previous_height
+    return condition
+
+
+def url_left(fragment):
+    """Condition: l'URL courante ne contient plus le fragment donné"""
+    def condition(driver):
+        return fragment not in driver.current_url
+    return condition
+
+
+def job_detail_loaded(job_id, previous_description):
+    """
+    Condition: le panneau de détails affiche la nouvelle offre.
+    L'URL doit pointer sur l'offre cliquée (si son identifiant est connu) et la
+    description doit être non vide et différente de celle de l'offre précédente.
+    """
+    def condition(driver):
+        if job_id and f"currentJobId={job_id}" not in driver.current_url:
+            return False
+        if not driver.find_elements(CSS_SELECTOR, JOB_PANEL_SELECTOR):
+            return False
+        description = _first_text(driver, DESCRIPTION_SELECTOR)
+        return bool(description) and description != previous_description
+    return condition
+
+
+def description_available(driver):
+    """Condition: la description de l'offre contient du texte"""
+    return bool(_first_text(driver, DESCRIPTION_SELECTOR))
+
+
+class SmartWait:
+    """
+    Couche d'attente bornée au-dessus de WebDriverWait.
+    Chaque attente indique la pause fixe qu'elle remplace ; le temps gagné est
+    la différence entre cette pause et le temps réellement attendu.
+    """
+
+    def __init__(self, driver, timeouts=None, max_wait=None, poll_frequency=0.2):
+        self.driver = driver
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        if max_wait is not None:
+            self.timeouts = {name: min(value, max_wait) for name, value in self.timeouts.items()}
+        self.poll_frequency = poll_frequency
+        self.stats = {'count': 0, 'timeouts': 0, 'waited': 0.0, 'nominal': 0.0}
+
+    def until(self, condition, kind, nominal, message=""):
+        """
+        Attend que la condition soit vraie, au plus self.timeouts[kind] secondes.
+        Retourne la valeur de la condition, ou None si la borne est atteinte.
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+        start = time.monotonic()
+        try:
+            return WebDriverWait(
+                self.driver, self.timeouts[kind], poll_frequency=self.poll_frequency,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(condition)
+        except TimeoutException:
+            self.stats['timeouts'] += 1
+            if message:
+                logger.warning(f"Délai dépassé ({self.timeouts[kind]}s): {message}")
+            return None
+        finally:
+            self.stats['count'] += 1
+            self.stats['waited'] += time.monotonic() - start
+            self.stats['nominal'] += nominal
+
+    def saved(self):
+        """Temps gagné (secondes) par rapport aux pauses fixes remplacées"""
+        return self.stats['nominal'] - self.stats['waited']
+
+    def log_summary(self):
+        """Journalise le bilan des attentes"""
+        logger.info(
+            f"Attentes: {self.stats['count']} ({self.stats['timeouts']} délais dépassés), "
+            f"temps attendu: {self.stats['waited']:.1f}s, pauses fixes équivalentes: {self.stats['nominal']:.1f}s, "
+            f"temps gagné: {self.saved():.1f}s"
+        )
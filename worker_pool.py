@@ -0,0 +1,129 @@
+"""
+Pool de navigateurs pour l'extraction parallèle des offres.
+
+Le driver principal collecte les identifiants d'offres sur les pages de recherche ;
+chaque worker possède son propre driver Firefox, authentifié avec les cookies de
+session du driver principal, et ouvre directement les pages
+https://www.linkedin.com/jobs/view/{id}/ de sa file d'attente. Les workers
+partagent le limiteur de débit du driver principal : ajouter des navigateurs
+recouvre les temps de chargement sans augmenter le rythme des requêtes.
+"""
+
+import queue
+import logging
+import threading
+
+import waits
+from waits import SmartWait
+from job_extractor import DriverJobExtractor, job_view_url
+from session_store import add_cookies
+from rate_limiter import RateLimiter, paced_get
+
+logger = logging.getLogger(__name__)
+
+# Limite de politesse: nombre maximal de navigateurs ouverts en parallèle
+MAX_WORKERS = 4
+
+# Marqueur de fin de file pour un worker
+_STOP = None
+
+
+class BrowserWorker(threading.Thread):
+    """Worker possédant un driver et une file d'identifiants d'offres"""
+
+    def __init__(self, index, driver, cookies, results, limiter, timeouts=None, max_wait=None, recorder=None):
+        super().__init__(name=f"browser-worker-{index}", daemon=True)
+        self.index = index
+        self.driver = driver
+        self.cookies = cookies
+        self.results = results
+        self.jobs = queue.Queue()
+        self.limiter = limiter
+        self.recorder = recorder
+        self.waits = SmartWait(driver, timeouts=timeouts, max_wait=max_wait)
+        self.extractor = DriverJobExtractor(driver)
+
+    def restore_session(self):
+        """Pose les cookies de session du driver principal dans ce driver"""
+        add_cookies(self.driver, self.cookies, self.limiter)
+
+    def fetch(self, job_id):
+        """Ouvre la page de l'offre et extrait ses informations"""
+        if not paced_get(self.limiter, self.driver, job_view_url(job_id), expected='/jobs/view'):
+            logger.warning(f"Worker {self.index}: page de l'offre {job_id} inaccessible (limitation)")
+            return None
+        if not self.waits.until(waits.description_available, 'job_panel', nominal=3):
+            logger.warning(f"Worker {self.index}: description non chargée pour l'offre {job_id}")
+        if self.recorder:
+            self.recorder.record_driver(self.driver, job_view_url(job_id))
+        details = self.extractor.extract()
+        if not details['job_id']:
+            details['job_id'] = job_id
+            details['url'] = job_view_url(job_id)
+        return details
+
+    def run(self):
+        try:
+            self.restore_session()
+        except Exception as e:
+            logger.error(f"Worker {self.index}: impossible de restaurer la session: {str(e)}")
+        while True:
+            item = self.jobs.get()
+            if item is _STOP:
+                break
+            position, job_id = item
+            try:
+                self.results.put((position, self.fetch(job_id)))
+            except Exception as e:
+                logger.error(f"Worker {self.index}: erreur sur l'offre {job_id}: {str(e)}")
+                self.results.put((position, None))
+
+
+class BrowserWorkerPool:
+    """
+    Répartit des identifiants d'offres entre plusieurs navigateurs.
+    driver_factory est appelée une fois par worker et doit retourner un driver prêt.
+    limiter (rate_limiter.RateLimiter) rythme les navigations de tous les workers ;
+    recorder (fixtures.FixtureRecorder) enregistre les pages d'offres ouvertes.
+    """
+
+    def __init__(self, driver_factory, cookies, workers=2, max_workers=MAX_WORKERS,
+                 timeouts=None, max_wait=None, limiter=None, recorder=None):
+        if workers > max_workers:
+            logger.warning(f"{workers} workers demandés, limités à {max_workers}")
+        self.size = max(1, min(workers, max_workers))
+        self.results = queue.Queue()
+        self.limiter = limiter or RateLimiter()
+        self.workers = []
+        logger.info(f"Démarrage de {self.size} navigateurs")
+        try:
+            for index in range(self.size):
+                worker = BrowserWorker(index + 1, driver_factory(), cookies, self.results, self.limiter,
+                                       timeouts=timeouts, max_wait=max_wait, recorder=recorder)
+                worker.start()
+                self.workers.append(worker)
+        except Exception:
+            self.close()
+            raise
+
+    def map(self, job_ids):
+        """
+        Extrait les offres et les retourne au fil de l'eau, dans l'ordre d'arrivée,
+        sous forme de (position, détails) ; détails vaut None en cas d'échec
+        """
+        for position, job_id in enumerate(job_ids):
+            self.workers[position % self.size].jobs.put((position, job_id))
+        for _ in range(len(job_ids)):
+            yield self.results.get()
+
+    def close(self):
+        """Arrête les workers et ferme leurs drivers"""
+        for worker in self.workers:
+            worker.jobs.put(_STOP)
+        for worker in self.workers:
+            worker.join()
+            try:
+                worker.driver.quit()
+            except Exception as e:
+                logger.error(f"Erreur lors de la fermeture du worker {worker.index}: {str(e)}")
+        self.workers = []